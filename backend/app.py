@@ -3,10 +3,14 @@ Hotspot IQ - Flask Application
 Main entry point for the backend API server.
 """
 
-from flask import Flask, jsonify
+import os
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from config import Config
-from routes import location_bp, analysis_bp, chat_bp
+from routes import location_bp, analysis_bp, chat_bp, admin_bp, scoring_bp, tiles_bp
+from services.warmup_service import warmup_job
+from utils.compression import compress_response
+from utils.json_provider import FastJSONProvider
 
 
 def create_app():
@@ -14,6 +18,10 @@ def create_app():
     
     app = Flask(__name__)
     
+    # orjson-backed, NumPy-aware serialization for jsonify()
+    if Config.FAST_JSON:
+        app.json = FastJSONProvider(app)
+    
     # Configure CORS - allow multiple Vite dev server ports
     CORS(app, origins=[
         Config.FRONTEND_URL, 
@@ -31,6 +39,19 @@ def create_app():
     app.register_blueprint(location_bp, url_prefix='/api')
     app.register_blueprint(analysis_bp, url_prefix='/api')
     app.register_blueprint(chat_bp, url_prefix='/api')
+    app.register_blueprint(admin_bp, url_prefix='/api')
+    app.register_blueprint(scoring_bp, url_prefix='/api')
+    app.register_blueprint(tiles_bp, url_prefix='/api')
+    
+    # gzip/brotli for large JSON and vector tile responses
+    @app.after_request
+    def compress(response):
+        return compress_response(request, response)
+    
+    # Precompute popular areas in the background. With the debug reloader,
+    # only the serving child process (WERKZEUG_RUN_MAIN) starts the job.
+    if Config.WARMUP_ON_STARTUP and (not Config.FLASK_DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+        warmup_job.start()
     
     # Health check endpoint
     @app.route('/api/health', methods=['GET'])
@@ -52,9 +73,22 @@ def create_app():
                 'health': '/api/health',
                 'autocomplete': '/api/autocomplete?query={search_term}',
                 'analyze': 'POST /api/analyze',
+                'analyze_compare': 'POST /api/analyze/compare',
                 'isochrone': 'POST /api/isochrone',
                 'digipin': '/api/digipin?lat={lat}&lng={lng}',
+                'digipin_decode': '/api/digipin/decode?code={digipin}',
+                'digipin_batch': 'POST /api/digipin/batch',
                 'chat': 'POST /api/chat',
+                'warmup': 'POST /api/warmup/start, GET /api/warmup/status',
+                'validation_cache': 'GET /api/validation/cache, POST /api/validation/cache/invalidate',
+                'admission': 'GET /api/admission',
+                'score_batch': 'POST /api/score/batch',
+                'sweep': 'POST /api/sweep',
+                'placement': 'POST /api/placement',
+                'hexgrid': '/api/hexgrid?lat={lat}&lng={lng}&radius={m}&business_type={type}&resolution={8-12}&rollup={res}',
+                'heatmap': '/api/heatmap/{z}/{x}/{y}[.png]?business_type={type}',
+                'vector_tiles': '/api/tiles/{z}/{x}/{y}.mvt?business_type={type}',
+                'clusters': '/api/clusters?lat={lat}&lng={lng}&radius={m}&business_type={type}&zoom={z}&bbox={s,w,n,e}',
                 'supply_chain': 'POST /api/supply-chain'
             }
         })
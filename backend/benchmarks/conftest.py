@@ -0,0 +1,41 @@
+"""
+Hotspot IQ - Benchmark Fixtures
+Shared setup for the pytest-benchmark suites in this directory.
+
+Environment:
+    BENCH_AREA         Recorded area to replay (default: bengaluru-indiranagar)
+    BENCH_LATENCY      Injected upstream latency, "0.2" or "overpass=1.2,latlong=0.3"
+    BENCH_JITTER       Relative latency jitter (default 0)
+    BENCH_ROUNDS       Rounds per benchmark (default 5)
+    BENCH_CONCURRENCY  Concurrent clients in throughput runs (default 8)
+    BENCH_FULL         Also run the largest score_calculator cases
+    BENCH_TIME_FACTOR  Multiplier on score_calculator time thresholds (default 1)
+"""
+
+import os
+import sys
+
+import pytest
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from replay import area_dir, load_area, parse_latency, replay_session  # noqa: E402
+
+
+BENCH_AREA = os.getenv('BENCH_AREA', 'bengaluru-indiranagar')
+BENCH_ROUNDS = int(os.getenv('BENCH_ROUNDS', '5'))
+BENCH_CONCURRENCY = int(os.getenv('BENCH_CONCURRENCY', '8'))
+
+
+@pytest.fixture(scope='session')
+def replay():
+    """(app, stub, area params) for BENCH_AREA; skips when it was never recorded."""
+    if not os.path.isdir(os.path.join(area_dir(BENCH_AREA), 'overpass')):
+        pytest.skip(f"No fixtures for '{BENCH_AREA}' - run: python benchmarks/replay.py record --area {BENCH_AREA}")
+
+    latency = parse_latency(os.getenv('BENCH_LATENCY', '0'))
+    jitter = float(os.getenv('BENCH_JITTER', '0'))
+    with replay_session(BENCH_AREA, latency=latency, jitter=jitter) as (app, stub):
+        yield app, stub, load_area(BENCH_AREA)
@@ -0,0 +1,158 @@
+"""
+Hotspot IQ - JSON Serialization Benchmark
+Measures how much of the request time of large responses goes into JSON
+serialization, with Flask's default provider vs FastJSONProvider.
+
+Runs offline: /api/analyze is served from a seeded analysis cache with a
+synthetic 2500m-radius response (hundreds of competitors and landmarks),
+and /api/relevance is static.
+
+Usage (from backend/):
+    python benchmarks/json_serialization.py [--rounds 200]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+from app import create_app
+from services.analysis_service import cache_analysis
+from utils.json_provider import FastJSONProvider, orjson
+from utils.score_calculator import score_points
+
+
+CENTER = (12.9716, 77.5946)
+RADIUS = 2500
+LANDMARK_CATEGORIES = ['school', 'college', 'hospital', 'bank', 'atm', 'metro', 'mall', 'park']
+
+
+def synthetic_analysis(competitors: int = 300, landmarks: int = 450, seed: int = 7) -> dict:
+    """An /api/analyze response shaped like a real 2500m analysis."""
+    rng = random.Random(seed)
+    lat, lng = CENTER
+
+    def point():
+        return lat + rng.uniform(-0.022, 0.022), lng + rng.uniform(-0.023, 0.023)
+
+    competitor_list = []
+    for i in range(competitors):
+        p_lat, p_lng = point()
+        competitor_list.append({
+            'name': f'Cafe {i}', 'category': 'cafe', 'lat': p_lat, 'lng': p_lng,
+            'distance': rng.randint(20, RADIUS), 'is_competitor': True,
+        })
+    competitor_list.sort(key=lambda c: c['distance'])
+
+    landmark_list = []
+    for i in range(landmarks):
+        p_lat, p_lng = point()
+        landmark_list.append({
+            'name': f'Landmark {i}', 'lat': p_lat, 'lng': p_lng,
+            'category': rng.choice(LANDMARK_CATEGORIES),
+        })
+
+    spots = []
+    for rank in range(1, 6):
+        p_lat, p_lng = point()
+        spots.append({
+            'lat': p_lat, 'lng': p_lng, 'score': round(rng.uniform(50, 120), 1),
+            'rating': 'Excellent', 'rating_color': 'green',
+            'reasons': ['Low competition - nearest competitor 326m away', 'High footfall area',
+                        'Near key landmarks (22 within 500m)', 'Near: Metro, School, College',
+                        'Good road accessibility'],
+            'nearby_competitors': rng.randint(0, 3), 'nearby_landmarks': rng.randint(5, 30),
+            'min_competitor_distance': rng.randint(300, 900), 'rank': rank,
+        })
+
+    return {
+        'location': {'lat': lat, 'lng': lng, 'center_lat': lat, 'center_lng': lng,
+                     'address': {'formatted_address': 'MG Road, Bengaluru', 'pincode': '560001'},
+                     'digipin': '4P3-JK8-KPLL'},
+        'business_type': 'cafe',
+        'radius': RADIUS,
+        'filters_applied': [],
+        'recommended_spots': spots,
+        'competitors': {'count': len(competitor_list), 'nearby': competitor_list},
+        'landmarks': {'total': len(landmark_list), 'by_category': {'nearby': len(landmark_list)},
+                      'list': landmark_list},
+        'footfall_proxy': 'high',
+    }
+
+
+def numpy_scores(points: int = 5000) -> dict:
+    """Raw vectorized scorer output (NumPy arrays) for a grid of points."""
+    rng = np.random.default_rng(7)
+    lats = CENTER[0] + rng.uniform(-0.02, 0.02, points)
+    lngs = CENTER[1] + rng.uniform(-0.02, 0.02, points)
+    payload = synthetic_analysis()
+    scores = score_points(lats, lngs, payload['competitors']['nearby'], payload['landmarks']['list'])
+    scores.pop('landmark_indices')
+    scores['min_competitor_distance'] = np.where(
+        np.isinf(scores['min_competitor_distance']), -1, scores['min_competitor_distance']
+    )
+    return {'lats': lats, 'lngs': lngs, **scores}
+
+
+def timed(fn, rounds: int) -> float:
+    """Mean wall time of fn() in milliseconds (route logging silenced)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()  # Warm up
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        elapsed = time.perf_counter() - started
+    return elapsed / rounds * 1000
+
+
+def run(rounds: int) -> None:
+    app = create_app()
+    client = app.test_client()
+    payload = synthetic_analysis()
+    cache_analysis(CENTER[0], CENTER[1], 'cafe', RADIUS, payload)
+    analyze_body = {'lat': CENTER[0], 'lng': CENTER[1], 'business_type': 'cafe', 'radius': RADIUS}
+
+    providers = [('flask default', DefaultJSONProvider(app)), ('FastJSONProvider (stdlib)', FastJSONProvider(app))]
+    providers[1][1].use_orjson = False
+    if orjson is not None:
+        providers.append(('FastJSONProvider (orjson)', FastJSONProvider(app)))
+    else:
+        print("orjson is not installed - only the stdlib paths are measured\n")
+
+    print(f"{'provider':<28}{'endpoint':<18}{'request ms':>12}{'serialize ms':>14}{'share':>8}")
+    for name, provider in providers:
+        app.json = provider
+        with app.app_context():
+            cases = [
+                ('/api/analyze', lambda: client.post('/api/analyze', json=analyze_body),
+                 lambda: provider.response(payload)),
+                ('/api/relevance', lambda: client.get('/api/relevance?business_type=cafe'),
+                 None),
+            ]
+            for endpoint, request_fn, serialize_fn in cases:
+                request_ms = timed(request_fn, rounds)
+                if serialize_fn is None:
+                    body = client.get('/api/relevance?business_type=cafe').get_json()
+                    serialize_fn = lambda body=body: provider.response(body)
+                serialize_ms = timed(serialize_fn, rounds)
+                print(f"{name:<28}{endpoint:<18}{request_ms:>12.3f}{serialize_ms:>14.3f}"
+                      f"{serialize_ms / request_ms:>8.0%}")
+
+    print("\nNumPy scorer output (5000 points):")
+    scores = numpy_scores()
+    for name, provider in providers[1:]:
+        with app.app_context():
+            print(f"  {name:<28}{timed(lambda: provider.dumps(scores), rounds):>10.3f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=200)
+    run(parser.parse_args().rounds)
@@ -0,0 +1,440 @@
+"""
+Hotspot IQ - Upstream Record/Replay Harness
+Records the LatLong, Overpass and Nominatim responses behind a benchmark
+area into fixtures, and serves them back from a local stub server with
+configurable latency, so /api/analyze, /api/validate-location and /api/chat
+can be measured offline and repeatably.
+
+Upstream calls are redirected to the stub in-process: requests sessions and
+overpy's urlopen are patched to send https://<host>/<path> to
+http://127.0.0.1:<port>/<host>/<path>. In record mode the stub forwards each
+call to the real upstream and saves successful responses under
+fixtures/<area>/<upstream>/<key>.json, with request headers dropped and
+secret setting values scrubbed so fixtures can be committed. In replay mode it answers from those
+files and returns 404 (counted in stub.misses) for anything not recorded.
+Keys ignore the Overpass mirror and [timeout:N] settings, which vary with
+the request budget.
+
+Chat is exercised on its template path (OPENAI_API_KEY is blanked), which
+covers its LatLong/Nominatim retrieval. LLM and web search latency are out
+of scope. Upstream quotas are lifted during replay, since the stub has none.
+Recording must run with the same land mask setting as replay (the mask
+changes which water probes are made).
+
+Usage (from backend/):
+    python benchmarks/replay.py list
+    python benchmarks/replay.py record --area bengaluru-indiranagar
+    python benchmarks/replay.py record --area my-area --lat 12.93 --lng 77.62 --business-type gym
+    python benchmarks/replay.py serve --area bengaluru-indiranagar --latency overpass=1.2,latlong=0.3 [--port 5002]
+
+Benchmarks (pip install pytest pytest-benchmark):
+    BENCH_AREA=bengaluru-indiranagar BENCH_LATENCY=0.2 python -m pytest benchmarks
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import overpy
+import requests
+from app import create_app
+from config import Config
+from utils import admission
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Upstream hosts redirected to the stub, by upstream name
+UPSTREAM_HOSTS = {
+    'overpass-api.de': 'overpass',
+    'overpass.kumi.systems': 'overpass',
+    'maps.mail.ru': 'overpass',
+    'apihub.latlong.ai': 'latlong',
+    'nominatim.openstreetmap.org': 'nominatim',
+}
+
+# Request headers passed through to the real upstream when recording
+FORWARD_HEADERS = ('Content-Type', 'Accept', 'User-Agent', 'X-Authorization-Token')
+
+# Seconds a recorded call may take
+RECORD_TIMEOUT = 180
+
+# Settings whose values never reach a fixture (fixtures are committed)
+SECRET_SETTINGS = ('LATLONG_API_KEY', 'OPENAI_API_KEY', 'ADMIN_TOKEN')
+REDACTED = '<redacted>'
+
+# Preset benchmark areas (record others with --lat/--lng)
+BENCH_AREAS = {
+    'bengaluru-indiranagar': {'lat': 12.9784, 'lng': 77.6408, 'business_type': 'cafe', 'radius': 1000},
+    'mumbai-bandra': {'lat': 19.0596, 'lng': 72.8295, 'business_type': 'gym', 'radius': 1000},
+    'delhi-connaught-place': {'lat': 28.6315, 'lng': 77.2167, 'business_type': 'restaurant', 'radius': 1000},
+}
+
+
+def _normalize_body(body: bytes) -> str:
+    """Request body as text, with Overpass form encoding and timeouts removed."""
+    text = body.decode('utf-8', errors='replace')
+    if text.startswith('data='):
+        text = parse_qs(text).get('data', [''])[0]
+    text = re.sub(r'\[timeout:\d+\]', '', text)
+    return ' '.join(text.split())
+
+
+def scrub(text: str) -> str:
+    """Replace configured secret values in recorded text with REDACTED."""
+    for name in SECRET_SETTINGS:
+        secret = getattr(Config, name, '')
+        if secret and len(secret) >= 8:
+            text = text.replace(secret, REDACTED)
+    return text
+
+
+def fixture_key(upstream: str, method: str, path: str, body: bytes = b'') -> str:
+    """
+    Stable key of an upstream call.
+
+    Args:
+        upstream: 'overpass', 'latlong' or 'nominatim'
+        method: HTTP method
+        path: Path and query string on the upstream host
+        body: Request body
+
+    Returns:
+        Hex key; the same call on any Overpass mirror maps to the same key
+    """
+    parts = urlsplit(path)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    location = '' if upstream == 'overpass' else parts.path
+    raw = '|'.join([upstream, method, location, json.dumps(params), _normalize_body(body)])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+def parse_latency(spec: Optional[str]) -> Dict[str, float]:
+    """
+    Parse a latency spec: "0.2" for every upstream, or per upstream as
+    "overpass=1.2,latlong=0.3" ('*' sets the default).
+    """
+    latency: Dict[str, float] = {}
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, value = part.rpartition('=')
+        latency[name or '*'] = float(value)
+    return latency
+
+
+def area_dir(area: str) -> str:
+    return os.path.join(FIXTURES_DIR, area)
+
+
+def load_area(area: str) -> Dict:
+    """Scenario parameters of a recorded area, falling back to the presets."""
+    path = os.path.join(area_dir(area), 'area.json')
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    if area in BENCH_AREAS:
+        return dict(BENCH_AREAS[area])
+    raise KeyError(f"Unknown area '{area}' (presets: {', '.join(BENCH_AREAS)})")
+
+
+def scenario_requests(params: Dict) -> List[Tuple[str, str, Dict]]:
+    """The (name, path, body) requests benchmarked for an area, in recording order."""
+    lat, lng, business_type = params['lat'], params['lng'], params['business_type']
+    return [
+        ('analyze', '/api/analyze',
+         {'lat': lat, 'lng': lng, 'business_type': business_type, 'radius': params.get('radius', 1000)}),
+        ('validate', '/api/validate-location',
+         {'lat': lat, 'lng': lng, 'business_type': business_type}),
+        ('chat', '/api/chat',
+         {'message': f'Is this a good location for a {business_type}?',
+          'context': {'lat': lat, 'lng': lng, 'business_type': business_type}}),
+    ]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server_version = 'HotspotIQReplay/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.stub.handle(self, 'GET')
+
+    def do_POST(self):
+        self.server.stub.handle(self, 'POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UpstreamStub:
+    """Local HTTP server that records or replays upstream responses."""
+
+    def __init__(self, fixtures_dir: str, record: bool = False,
+                 latency: Optional[Dict[str, float]] = None, jitter: float = 0.0):
+        """
+        Args:
+            fixtures_dir: Directory of one area's fixtures
+            record: Forward calls to the real upstreams and save the responses
+            latency: Seconds added to each replayed response, per upstream ('*' = default)
+            jitter: Relative random variation of the latency (0.2 = +-20%)
+        """
+        self.fixtures_dir = fixtures_dir
+        self.record = record
+        self.latency = latency or {}
+        self.jitter = jitter
+        self.hits: Counter = Counter()
+        self.misses: List[Dict] = []
+        self.recorded = 0
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'UpstreamStub':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        threading.Thread(target=self._server.serve_forever, name='upstream-stub', daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _delay(self, upstream: str) -> float:
+        seconds = self.latency.get(upstream, self.latency.get('*', 0.0))
+        if seconds and self.jitter:
+            with self._lock:
+                seconds *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, seconds)
+
+    def _forward(self, host: str, method: str, path: str, body: bytes, headers) -> Tuple[int, str, bytes]:
+        forwarded = {name: headers[name] for name in FORWARD_HEADERS if headers.get(name)}
+        upstream_request = urllib.request.Request(
+            f"https://{host}{path}", data=body or None, method=method, headers=forwarded
+        )
+        try:
+            with urllib.request.urlopen(upstream_request, timeout=RECORD_TIMEOUT) as response:
+                return response.status, response.headers.get('Content-Type', ''), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('Content-Type', ''), e.read()
+        except Exception as e:
+            return 502, 'application/json', json.dumps({'error': str(e)}).encode('utf-8')
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        host, _, rest = handler.path.lstrip('/').partition('/')
+        path = '/' + rest
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+
+        upstream = UPSTREAM_HOSTS.get(host)
+        if upstream is None:
+            return self._send(handler, 404, 'application/json', b'{"error": "unknown upstream"}')
+
+        key = fixture_key(upstream, method, path, body)
+        path_on_disk = os.path.join(self.fixtures_dir, upstream, f"{key}.json")
+
+        if self.record:
+            status, content_type, payload = self._forward(host, method, path, body, handler.headers)
+            if 200 <= status < 300:
+                os.makedirs(os.path.dirname(path_on_disk), exist_ok=True)
+                with open(path_on_disk, 'w') as f:
+                    # Headers (and so the LatLong token) are never saved
+                    json.dump({
+                        'upstream': upstream, 'method': method, 'path': scrub(path),
+                        'request': scrub(_normalize_body(body)[:500]),
+                        'status': status, 'content_type': content_type,
+                        'body': scrub(payload.decode('utf-8', errors='replace')),
+                    }, f)
+                with self._lock:
+                    self.recorded += 1
+            return self._send(handler, status, content_type, payload)
+
+        try:
+            with open(path_on_disk) as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses.append({'upstream': upstream, 'key': key, 'path': path,
+                                    'request': _normalize_body(body)[:200]})
+            return self._send(handler, 404, 'application/json', b'{"error": "no recorded response"}')
+
+        with self._lock:
+            self.hits[upstream] += 1
+        delay = self._delay(upstream)
+        if delay:
+            time.sleep(delay)
+        self._send(handler, fixture['status'], fixture['content_type'], fixture['body'].encode('utf-8'))
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, content_type: str, payload: bytes) -> None:
+        handler.send_response(status)
+        if content_type:
+            handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+def _rewrite(url: str, stub_url: str) -> str:
+    parts = urlsplit(url)
+    if parts.hostname not in UPSTREAM_HOSTS:
+        return url
+    return f"{stub_url}/{parts.hostname}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+
+
+@contextlib.contextmanager
+def redirect_upstreams(stub_url: str):
+    """Send upstream calls made with requests or overpy to the stub."""
+    session_request = requests.Session.request
+    overpy_urlopen = overpy.urlopen
+
+    def request(self, method, url, *args, **kwargs):
+        return session_request(self, method, _rewrite(url, stub_url), *args, **kwargs)
+
+    def urlopen(url, *args, **kwargs):
+        if isinstance(url, str):
+            url = _rewrite(url, stub_url)
+        return overpy_urlopen(url, *args, **kwargs)
+
+    requests.Session.request = request
+    overpy.urlopen = urlopen
+    try:
+        yield
+    finally:
+        requests.Session.request = session_request
+        overpy.urlopen = overpy_urlopen
+
+
+def clear_upstream_caches() -> None:
+    """Empty every cache of upstream data and analysis results."""
+    from services.analysis_service import _analysis_cache
+    from services.places_service import _radius_cache
+    from services.latlong_service import _latlong_cache
+    from services.tile_cache import _tile_cache
+    from services.validation_service import _validation_cache
+    for cache in (_analysis_cache, _radius_cache, _latlong_cache, _tile_cache, _validation_cache):
+        cache.clear()
+
+
+@contextlib.contextmanager
+def replay_session(area: str, record: bool = False, latency: Optional[Dict[str, float]] = None,
+                   jitter: float = 0.0):
+    """
+    Run the app against a stub for one area, with cold caches.
+
+    Yields:
+        (Flask app, UpstreamStub)
+    """
+    buckets = dict(admission.UPSTREAM_BUCKETS)
+    openai_key = Config.OPENAI_API_KEY
+    with UpstreamStub(area_dir(area), record=record, latency=latency, jitter=jitter) as stub, \
+            redirect_upstreams(stub.url):
+        if not record:
+            for name in buckets:
+                admission.UPSTREAM_BUCKETS[name] = admission.TokenBucket(name, 0, 1)
+        Config.OPENAI_API_KEY = ''
+        clear_upstream_caches()
+        try:
+            yield create_app(), stub
+        finally:
+            admission.UPSTREAM_BUCKETS.update(buckets)
+            Config.OPENAI_API_KEY = openai_key
+            clear_upstream_caches()
+
+
+def record(area: str, params: Dict) -> None:
+    os.makedirs(area_dir(area), exist_ok=True)
+    with open(os.path.join(area_dir(area), 'area.json'), 'w') as f:
+        json.dump(params, f, indent=2)
+
+    with replay_session(area, record=True) as (app, stub):
+        client = app.test_client()
+        for name, path, body in scenario_requests(params):
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                response = client.post(path, json=body)
+            print(f"🎙️ {name:<9} {response.status_code}  {time.perf_counter() - started:6.1f}s")
+
+    print(f"✅ Recorded {stub.recorded} upstream responses into {area_dir(area)}")
+
+
+def serve(area: str, latency: Dict[str, float], jitter: float, port: int) -> None:
+    with replay_session(area, latency=latency, jitter=jitter) as (app, stub):
+        print(f"🔁 Replaying '{area}' upstreams from {stub.url} (latency {latency or 0}, jitter {jitter})")
+        app.run(host='127.0.0.1', port=port, threaded=True)
+        if stub.misses:
+            print(f"⚠️ {len(stub.misses)} upstream calls had no recorded response - re-record '{area}'")
+
+
+def list_areas() -> None:
+    names = sorted(set(BENCH_AREAS) | set(os.listdir(FIXTURES_DIR) if os.path.isdir(FIXTURES_DIR) else []))
+    for name in names:
+        counts = {}
+        for upstream in ('latlong', 'overpass', 'nominatim'):
+            folder = os.path.join(area_dir(name), upstream)
+            counts[upstream] = len(os.listdir(folder)) if os.path.isdir(folder) else 0
+        recorded = ', '.join(f"{k} {v}" for k, v in counts.items()) if any(counts.values()) else 'not recorded'
+        print(f"{name:<28}{recorded}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help='Show areas and recorded fixture counts')
+
+    record_parser = commands.add_parser('record', help='Record upstream responses for an area')
+    record_parser.add_argument('--area', required=True)
+    record_parser.add_argument('--lat', type=float)
+    record_parser.add_argument('--lng', type=float)
+    record_parser.add_argument('--business-type')
+    record_parser.add_argument('--radius', type=int)
+
+    serve_parser = commands.add_parser('serve', help='Run the API against replayed upstreams')
+    serve_parser.add_argument('--area', required=True)
+    serve_parser.add_argument('--latency', default='0', help='Seconds, or per upstream: overpass=1.2,latlong=0.3')
+    serve_parser.add_argument('--jitter', type=float, default=0.0)
+    serve_parser.add_argument('--port', type=int, default=5002)
+
+    args = parser.parse_args()
+    if args.command == 'list':
+        list_areas()
+    elif args.command == 'record':
+        params = dict(BENCH_AREAS.get(args.area, {'business_type': 'cafe', 'radius': 1000}))
+        overrides = {'lat': args.lat, 'lng': args.lng, 'business_type': args.business_type, 'radius': args.radius}
+        params.update({k: v for k, v in overrides.items() if v is not None})
+        if 'lat' not in params or 'lng' not in params:
+            parser.error(f"--lat and --lng are required for areas other than {', '.join(BENCH_AREAS)}")
+        record(args.area, params)
+    else:
+        serve(args.area, parse_latency(args.latency), args.jitter, args.port)
@@ -0,0 +1,234 @@
+"""
+Hotspot IQ - Score Calculator Benchmark Cases
+Workloads for the scoring engine across grid sizes and POI counts, with
+peak memory measurement and regression thresholds.
+
+Every case scores synthetic clustered POIs (synthetic_pois.py) around one
+center. Grid sizes apply to calculate_grid_scores (grid_size x grid_size
+cells) and find_recommended_spots (grid_size² points of adaptive search
+budget, road checks answered offline). The summary scorers
+(calculate_footfall_proxy, calculate_landmark_value, analyze_location) scale
+with POI count only; "names" cases leave by_category empty so every POI
+name is keyword-matched.
+
+Cases whose points x POIs exceed QUICK_MAX_PAIRS only run with --full
+(BENCH_FULL=1 under pytest).
+
+Thresholds in score_thresholds.json cap the median time and the peak
+memory of each case. They are this run's measurements times TIME_HEADROOM
+and MEMORY_HEADROOM. Scale the time limits for slower machines with
+BENCH_TIME_FACTOR.
+
+Usage (from backend/):
+    python benchmarks/score_cases.py [--full] [--rounds 5] [--write-thresholds]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import score_calculator
+from synthetic_pois import CENTER, RADIUS, generate_area, landmark_summary, competitor_summary
+
+
+GRID_SIZES = (10, 25, 50, 100)
+POI_COUNTS = (10, 100, 1_000, 10_000, 50_000)
+
+# Points x POIs above which a case only runs in full mode
+QUICK_MAX_PAIRS = 25_000_000
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'score_thresholds.json')
+
+# Limits written by --write-thresholds, relative to the measured values
+TIME_HEADROOM = 3.0
+MEMORY_HEADROOM = 1.5
+
+MIB = 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def area(poi_count: int) -> Tuple[List[Dict], List[Dict]]:
+    """Shared (competitors, landmarks) per POI count."""
+    return generate_area(poi_count)
+
+
+@contextlib.contextmanager
+def offline_road_checks():
+    """Answer find_recommended_spots() road checks without Overpass."""
+    is_near_road = score_calculator._is_near_road
+    score_calculator._is_near_road = lambda lat, lng, max_distance=300: (True, 0.0)
+    try:
+        yield
+    finally:
+        score_calculator._is_near_road = is_near_road
+
+
+class ScoreCase:
+    """One benchmarked call of a score_calculator function."""
+
+    def __init__(self, function: str, poi_count: int, grid_size: Optional[int] = None,
+                 variant: Optional[str] = None):
+        self.function = function
+        self.poi_count = poi_count
+        self.grid_size = grid_size
+        self.variant = variant
+
+    @property
+    def id(self) -> str:
+        params = [f"grid={self.grid_size}"] if self.grid_size else []
+        params += [self.variant] if self.variant else []
+        params.append(f"pois={self.poi_count}")
+        return f"{self.function}[{'-'.join(params)}]"
+
+    @property
+    def pairs(self) -> int:
+        """Approximate points x POIs distances computed."""
+        if self.function == 'calculate_grid_scores':
+            return int(math.pi / 4 * self.grid_size ** 2) * self.poi_count
+        if self.function == 'find_recommended_spots':
+            return self.grid_size ** 2 * self.poi_count
+        return self.poi_count
+
+    @property
+    def quick(self) -> bool:
+        return self.pairs <= QUICK_MAX_PAIRS
+
+    def build(self) -> Callable[[], object]:
+        """The call to measure, with its inputs generated up front."""
+        competitors, landmarks = area(self.poi_count)
+        lat, lng = CENTER
+
+        if self.function == 'calculate_grid_scores':
+            return lambda: score_calculator.calculate_grid_scores(
+                lat, lng, RADIUS, competitors, landmarks, grid_size=self.grid_size
+            )
+
+        if self.function == 'find_recommended_spots':
+            def find_spots():
+                with offline_road_checks(), contextlib.redirect_stdout(io.StringIO()):
+                    return score_calculator.find_recommended_spots(
+                        lat, lng, RADIUS, competitors, landmarks, search_budget=self.grid_size ** 2
+                    )
+            return find_spots
+
+        summary = landmark_summary(landmarks, categorized=self.variant != 'names')
+        competing = competitor_summary(competitors)
+        if self.function == 'analyze_location':
+            return lambda: score_calculator.analyze_location(summary, competing, 'cafe')
+        if self.function == 'calculate_footfall_proxy':
+            return lambda: score_calculator.calculate_footfall_proxy(summary, competing)
+        return lambda: score_calculator.calculate_landmark_value(summary)
+
+
+def all_cases() -> List[ScoreCase]:
+    cases = []
+    for function in ('calculate_grid_scores', 'find_recommended_spots'):
+        cases += [ScoreCase(function, pois, grid) for grid in GRID_SIZES for pois in POI_COUNTS]
+    for function in ('calculate_footfall_proxy', 'calculate_landmark_value', 'analyze_location'):
+        cases += [ScoreCase(function, pois, variant=variant)
+                  for variant in ('categorized', 'names') for pois in POI_COUNTS]
+    return cases
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    """Peak bytes allocated while fn() runs (NumPy buffers included)."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def median_seconds(fn: Callable[[], object], rounds: int) -> float:
+    fn()  # Warm up
+    times = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return sorted(times)[len(times) // 2]
+
+
+def load_thresholds() -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(THRESHOLDS_PATH):
+        return {}
+    with open(THRESHOLDS_PATH) as f:
+        return json.load(f)
+
+
+def check_thresholds(case_id: str, median_ms: float, peak_mib: float,
+                     thresholds: Optional[Dict] = None) -> List[str]:
+    """
+    Compare a measurement with the case's limits.
+
+    Returns:
+        Descriptions of exceeded limits (empty when within them or unlisted)
+    """
+    limits = (load_thresholds() if thresholds is None else thresholds).get(case_id)
+    if not limits:
+        return []
+    time_factor = float(os.getenv('BENCH_TIME_FACTOR', '1'))
+    failures = []
+    if median_ms > limits['median_ms'] * time_factor:
+        failures.append(f"{case_id}: median {median_ms:.2f}ms > {limits['median_ms'] * time_factor:.2f}ms")
+    if peak_mib > limits['peak_mib']:
+        failures.append(f"{case_id}: peak {peak_mib:.2f}MiB > {limits['peak_mib']:.2f}MiB")
+    return failures
+
+
+def run(full: bool, rounds: int, write: bool) -> None:
+    thresholds = load_thresholds()
+    measured = {}
+    failures = []
+
+    print(f"{'case':<58}{'median ms':>12}{'peak MiB':>10}")
+    for case in all_cases():
+        if not (full or case.quick):
+            continue
+        fn = case.build()
+        median_ms = median_seconds(fn, rounds) * 1000
+        peak_mib = peak_memory(fn) / MIB
+        measured[case.id] = {'median_ms': median_ms, 'peak_mib': peak_mib}
+        failures += check_thresholds(case.id, median_ms, peak_mib, thresholds)
+        print(f"{case.id:<58}{median_ms:>12.2f}{peak_mib:>10.2f}")
+
+    if write:
+        thresholds.update({
+            case_id: {
+                # Floors keep sub-millisecond cases from failing on timer noise
+                'median_ms': round(max(values['median_ms'] * TIME_HEADROOM, 1.0), 2),
+                'peak_mib': round(max(values['peak_mib'] * MEMORY_HEADROOM, 0.5), 2),
+            }
+            for case_id, values in measured.items()
+        })
+        with open(THRESHOLDS_PATH, 'w') as f:
+            json.dump(dict(sorted(thresholds.items())), f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Wrote {len(measured)} thresholds to {THRESHOLDS_PATH}")
+    elif failures:
+        print("\n❌ Over threshold:")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--full', action='store_true', help='Include the largest grid/POI combinations')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--write-thresholds', action='store_true', help='Record limits from this run')
+    args = parser.parse_args()
+    run(args.full, args.rounds, args.write_thresholds)
@@ -0,0 +1,152 @@
+"""
+Hotspot IQ - Synthetic POIs
+Generates competitors and landmarks with city-like clustered densities for
+scoring benchmarks.
+
+Points follow a Thomas cluster process: hub centers are spread uniformly
+over the area, hub sizes are log-normal (a few dominant high streets and
+many small ones), members scatter around their hub with a per-hub spread of
+40-250m, and a share of points is uniform background. Landmark categories
+follow the mix LatLong returns for Indian cities, and names carry the
+keywords the grid scorer weighs.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from config import COMPETITOR_MAPPING
+
+
+CENTER = (12.9716, 77.5946)
+RADIUS = 2500
+
+# Share of points outside any hub
+BACKGROUND_SHARE = 0.15
+
+# Hub spread range in meters
+HUB_SPREAD = (40, 250)
+
+# Landmark category -> (relative frequency, name stem)
+LANDMARK_MIX = {
+    'bus_stop': (20, 'Bus Stop'),
+    'atm': (15, 'ATM'),
+    'school': (12, 'Public School'),
+    'office': (12, 'Tech Park Office'),
+    'residential': (10, 'Residency'),
+    'temple': (8, 'Temple'),
+    'park': (6, 'Park'),
+    'hospital': (5, 'Hospital'),
+    'college': (4, 'College'),
+    'bar': (4, 'Bar & Kitchen'),
+    'mall': (2, 'Mall'),
+    'metro_station': (2, 'Metro Station'),
+}
+
+
+def clustered_points(count: int, center: Tuple[float, float] = CENTER, radius: float = RADIUS,
+                     seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clustered random points inside a circle.
+
+    Args:
+        count: Number of points
+        center: (lat, lng) of the area
+        radius: Area radius in meters
+        seed: Random seed
+
+    Returns:
+        (lats, lngs) arrays of length count
+    """
+    rng = np.random.default_rng(seed)
+    hubs = max(1, int(math.sqrt(count) / 2))
+
+    # Hub centers uniform in the disk; log-normal sizes; per-hub spread
+    hub_r = radius * np.sqrt(rng.uniform(0, 1, hubs)) * 0.9
+    hub_theta = rng.uniform(0, 2 * math.pi, hubs)
+    hub_x, hub_y = hub_r * np.cos(hub_theta), hub_r * np.sin(hub_theta)
+    hub_weights = rng.lognormal(0, 1, hubs)
+    hub_weights /= hub_weights.sum()
+    hub_spread = rng.uniform(*HUB_SPREAD, hubs)
+
+    xs, ys = np.empty(0), np.empty(0)
+    while xs.size < count:
+        need = count - xs.size
+        background = rng.uniform(0, 1, need) < BACKGROUND_SHARE
+        hub = rng.choice(hubs, size=need, p=hub_weights)
+        r = radius * np.sqrt(rng.uniform(0, 1, need))
+        theta = rng.uniform(0, 2 * math.pi, need)
+        x = np.where(background, r * np.cos(theta), hub_x[hub] + rng.normal(0, 1, need) * hub_spread[hub])
+        y = np.where(background, r * np.sin(theta), hub_y[hub] + rng.normal(0, 1, need) * hub_spread[hub])
+        inside = x ** 2 + y ** 2 <= radius ** 2
+        xs, ys = np.concatenate([xs, x[inside]]), np.concatenate([ys, y[inside]])
+
+    lat, lng = center
+    lats = lat + ys[:count] / 111000
+    lngs = lng + xs[:count] / (111000 * math.cos(math.radians(lat)))
+    return lats, lngs
+
+
+def generate_competitors(count: int, business_type: str = 'cafe', center: Tuple[float, float] = CENTER,
+                         radius: float = RADIUS, seed: int = 0) -> List[Dict]:
+    """Competitor places shaped like get_competitors()['nearby'], nearest first."""
+    lats, lngs = clustered_points(count, center, radius, seed)
+    categories = COMPETITOR_MAPPING.get(business_type) or [business_type]
+    rng = np.random.default_rng(seed + 1)
+    kinds = rng.integers(0, len(categories), count)
+    lat0, lng0 = center
+    distances = np.hypot((lats - lat0) * 111000, (lngs - lng0) * 111000 * math.cos(math.radians(lat0)))
+
+    competitors = [
+        {'name': f"{categories[k].replace('_', ' ').title()} {i}", 'category': categories[k],
+         'lat': float(la), 'lng': float(ln), 'distance': round(float(d)), 'is_competitor': True}
+        for i, (la, ln, k, d) in enumerate(zip(lats, lngs, kinds, distances))
+    ]
+    competitors.sort(key=lambda c: c['distance'])
+    return competitors
+
+
+def generate_landmarks(count: int, center: Tuple[float, float] = CENTER, radius: float = RADIUS,
+                       seed: int = 1) -> List[Dict]:
+    """Landmarks with lat/lng, name and category in LANDMARK_MIX proportions."""
+    lats, lngs = clustered_points(count, center, radius, seed)
+    categories = list(LANDMARK_MIX)
+    weights = np.array([LANDMARK_MIX[c][0] for c in categories], dtype=np.float64)
+    rng = np.random.default_rng(seed + 1)
+    kinds = rng.choice(len(categories), size=count, p=weights / weights.sum())
+
+    return [
+        {'name': f"{LANDMARK_MIX[categories[k]][1]} {i}", 'category': categories[k],
+         'lat': float(la), 'lng': float(ln)}
+        for i, (la, ln, k) in enumerate(zip(lats, lngs, kinds))
+    ]
+
+
+def generate_area(poi_count: int, competitor_share: float = 0.25, business_type: str = 'cafe',
+                  seed: int = 0) -> Tuple[List[Dict], List[Dict]]:
+    """(competitors, landmarks) splitting poi_count POIs by competitor_share."""
+    competitors = int(round(poi_count * competitor_share))
+    return (generate_competitors(competitors, business_type, seed=seed),
+            generate_landmarks(poi_count - competitors, seed=seed + 1))
+
+
+def landmark_summary(landmarks: List[Dict], categorized: bool = True) -> Dict:
+    """
+    Landmarks in the get_landmarks_by_filters() shape used by analyze_location().
+
+    With categorized False, by_category is empty, so the scorers fall back to
+    matching keywords in every POI name.
+    """
+    by_category: Dict[str, Dict] = {}
+    if categorized:
+        for landmark in landmarks:
+            entry = by_category.setdefault(landmark['category'], {'count': 0, 'pois': []})
+            entry['count'] += 1
+            entry['pois'].append(landmark)
+    return {'by_category': by_category, 'total_count': len(landmarks), 'all_pois': landmarks}
+
+
+def competitor_summary(competitors: List[Dict]) -> Dict:
+    """Competitors in the get_competitors() shape."""
+    return {'count': len(competitors), 'nearby': competitors}
@@ -0,0 +1,75 @@
+"""
+Hotspot IQ - Endpoint Benchmarks
+End-to-end latency of /api/analyze, /api/validate-location and /api/chat,
+and concurrent /api/analyze throughput, against replayed upstreams (see
+replay.py). "cold" rounds start with empty caches, "warm" ones reuse them.
+
+Usage (from backend/):
+    python -m pytest benchmarks/test_replay_endpoints.py [--benchmark-json out.json]
+"""
+
+import contextlib
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from conftest import BENCH_CONCURRENCY, BENCH_ROUNDS  # noqa: E402
+from replay import clear_upstream_caches, scenario_requests  # noqa: E402
+
+
+def _request(app, params, name):
+    path, body = next((path, body) for n, path, body in scenario_requests(params) if n == name)
+
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return app.test_client().post(path, json=body)
+    return call
+
+
+def _check(response, stub):
+    assert response.status_code == 200, response.get_json()
+    assert not stub.misses, f"Unrecorded upstream calls, re-record the area: {stub.misses[:3]}"
+
+
+@pytest.mark.parametrize('name', ['analyze', 'validate', 'chat'])
+def test_cold_latency(benchmark, replay, name):
+    app, stub, params = replay
+    benchmark.group = 'cold'
+    response = benchmark.pedantic(_request(app, params, name), setup=clear_upstream_caches,
+                                  rounds=BENCH_ROUNDS, iterations=1)
+    _check(response, stub)
+
+
+@pytest.mark.parametrize('name', ['analyze', 'validate', 'chat'])
+def test_warm_latency(benchmark, replay, name):
+    app, stub, params = replay
+    benchmark.group = 'warm'
+    call = _request(app, params, name)
+    clear_upstream_caches()
+    call()
+    response = benchmark.pedantic(call, rounds=BENCH_ROUNDS * 4, iterations=1)
+    _check(response, stub)
+
+
+def test_analyze_throughput(benchmark, replay):
+    """BENCH_CONCURRENCY clients each sending two cold analyses at once."""
+    app, stub, params = replay
+    benchmark.group = 'throughput'
+    call = _request(app, params, 'analyze')
+    total = BENCH_CONCURRENCY * 2
+
+    def burst():
+        with ThreadPoolExecutor(max_workers=BENCH_CONCURRENCY) as pool:
+            return list(pool.map(lambda _: call(), range(total)))
+
+    responses = benchmark.pedantic(burst, setup=clear_upstream_caches, rounds=max(1, BENCH_ROUNDS // 2),
+                                   iterations=1)
+    benchmark.extra_info['requests'] = total
+    benchmark.extra_info['requests_per_second'] = round(total / benchmark.stats.stats.mean, 2)
+    benchmark.extra_info['rejected'] = sum(r.status_code == 429 for r in responses)
+    for response in responses:
+        if response.status_code != 429:
+            _check(response, stub)
@@ -0,0 +1,47 @@
+"""
+Hotspot IQ - Score Calculator Benchmarks
+Time and peak memory of the scoring engine across grid sizes (10-100) and
+POI counts (10-50,000) on synthetic clustered POIs, checked against the
+limits in score_thresholds.json (see score_cases.py).
+
+Usage (from backend/):
+    python -m pytest benchmarks/test_score_calculator.py [--benchmark-json out.json]
+    BENCH_FULL=1 python -m pytest benchmarks/test_score_calculator.py    # largest cases too
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from conftest import BENCH_ROUNDS  # noqa: E402
+from score_cases import MIB, all_cases, check_thresholds, peak_memory  # noqa: E402
+
+
+BENCH_FULL = os.getenv('BENCH_FULL', '').lower() in ('1', 'true')
+
+CASES = [
+    pytest.param(case, id=case.id, marks=pytest.mark.skipif(
+        not (BENCH_FULL or case.quick), reason='large case, set BENCH_FULL=1'
+    ))
+    for case in all_cases()
+]
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_score_case(benchmark, case):
+    fn = case.build()
+    benchmark.group = case.function
+    result = benchmark.pedantic(fn, rounds=BENCH_ROUNDS, iterations=1, warmup_rounds=1)
+
+    if case.function in ('calculate_grid_scores', 'find_recommended_spots'):
+        assert result, f"{case.id} produced no cells"
+
+    median_ms = benchmark.stats.stats.median * 1000
+    peak_mib = peak_memory(fn) / MIB
+    benchmark.extra_info['peak_mib'] = round(peak_mib, 2)
+    benchmark.extra_info['pairs'] = case.pairs
+
+    failures = check_thresholds(case.id, median_ms, peak_mib)
+    assert not failures, '; '.join(failures)
@@ -35,6 +35,107 @@ class Config:
     DEFAULT_LNG = 77.5946
     DEFAULT_RADIUS = 1000  # meters
     
+    # Upstream response caching
+    POI_CACHE_TTL = int(os.getenv('POI_CACHE_TTL', '3600'))  # seconds
+    POI_CACHE_MAX_ENTRIES = int(os.getenv('POI_CACHE_MAX_ENTRIES', '2048'))
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', '21600'))  # seconds
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', '8192'))
+    
+    # Grid scoring: 'keyword' (fixed landmark weights) or 'relevance' (per business type)
+    GRID_SCORING_MODE = os.getenv('GRID_SCORING_MODE', 'keyword').lower()
+    
+    # Recommended-spot search: points scored by the coarse-to-fine quadtree search
+    # (0 = fixed 12x12 grid), and the smallest cell it refines down to
+    SPOT_SEARCH_BUDGET = int(os.getenv('SPOT_SEARCH_BUDGET', '256'))
+    SPOT_SEARCH_MIN_CELL = float(os.getenv('SPOT_SEARCH_MIN_CELL', '25'))  # meters
+    
+    # Land/water mask for water-body checks (built by scripts/build_landmask.py);
+    # Overpass is used when the file is missing or a point is outside it
+    LANDMASK_PATH = os.getenv(
+        'LANDMASK_PATH',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'landmask_india.bin')
+    )
+    
+    # Tile-level POI cache (slippy map tiles at a fixed zoom, ~1km at zoom 15)
+    TILE_ZOOM = int(os.getenv('TILE_ZOOM', '15'))
+    TILE_CACHE_TTL = int(os.getenv('TILE_CACHE_TTL', '86400'))  # seconds
+    TILE_CACHE_MAX_ENTRIES = int(os.getenv('TILE_CACHE_MAX_ENTRIES', '50000'))
+    
+    # Per-request upstream budget (/api/analyze, /api/analyze/compare): total
+    # seconds (under the client's 120s timeout), upstream calls, and seconds
+    # kept for required stages when starting optional ones
+    REQUEST_DEADLINE = float(os.getenv('REQUEST_DEADLINE', '90'))
+    REQUEST_MAX_UPSTREAM_CALLS = int(os.getenv('REQUEST_MAX_UPSTREAM_CALLS', '80'))
+    REQUEST_STAGE_RESERVE = float(os.getenv('REQUEST_STAGE_RESERVE', '15'))
+    
+    # Upstream quotas (calls per minute, 0 = unlimited; burst = calls allowed at once)
+    OVERPASS_RATE_PER_MIN = float(os.getenv('OVERPASS_RATE_PER_MIN', '60'))
+    OVERPASS_BURST = int(os.getenv('OVERPASS_BURST', '10'))
+    LATLONG_RATE_PER_MIN = float(os.getenv('LATLONG_RATE_PER_MIN', '300'))
+    LATLONG_BURST = int(os.getenv('LATLONG_BURST', '30'))
+    NOMINATIM_RATE_PER_MIN = float(os.getenv('NOMINATIM_RATE_PER_MIN', '60'))  # usage policy: 1 request/s
+    NOMINATIM_BURST = int(os.getenv('NOMINATIM_BURST', '1'))
+    UPSTREAM_MAX_WAIT = float(os.getenv('UPSTREAM_MAX_WAIT', '10'))  # seconds a call may wait for quota
+    
+    # Analysis admission: concurrent analyses, queued analyses, seconds one may queue
+    ANALYZE_MAX_CONCURRENT = int(os.getenv('ANALYZE_MAX_CONCURRENT', '4'))
+    ANALYZE_MAX_QUEUE = int(os.getenv('ANALYZE_MAX_QUEUE', '16'))
+    ANALYZE_QUEUE_TIMEOUT = float(os.getenv('ANALYZE_QUEUE_TIMEOUT', '30'))
+    
+    # Validation verdict cache (roadway, area viability, road quality) per map tile
+    VALIDATION_TILE_ZOOM = int(os.getenv('VALIDATION_TILE_ZOOM', '16'))  # ~600m tiles
+    VALIDATION_CACHE_TTL = int(os.getenv('VALIDATION_CACHE_TTL', '604800'))  # seconds, passed checks
+    VALIDATION_FAIL_CACHE_TTL = int(os.getenv('VALIDATION_FAIL_CACHE_TTL', '86400'))  # seconds, failed checks
+    VALIDATION_CACHE_MAX_ENTRIES = int(os.getenv('VALIDATION_CACHE_MAX_ENTRIES', '50000'))
+    
+    # Batch point scoring
+    MAX_SCORE_BATCH = int(os.getenv('MAX_SCORE_BATCH', '5000'))
+    
+    # Hexagonal grid (cell resolution 8-12, ~460m to ~9m edges; 10 ~ 66m)
+    HEX_RESOLUTION = int(os.getenv('HEX_RESOLUTION', '10'))
+    HEX_CACHE_MAX_ENTRIES = int(os.getenv('HEX_CACHE_MAX_ENTRIES', '200000'))
+    MAX_HEX_CELLS = int(os.getenv('MAX_HEX_CELLS', '5000'))
+    
+    # Competitor density heatmap tiles
+    HEATMAP_BANDWIDTH = int(os.getenv('HEATMAP_BANDWIDTH', '250'))  # KDE bandwidth in meters
+    HEATMAP_MAX_DENSITY = float(os.getenv('HEATMAP_MAX_DENSITY', '20'))  # competitors/km² mapped to 255
+    HEATMAP_CACHE_MAX_ENTRIES = int(os.getenv('HEATMAP_CACHE_MAX_ENTRIES', '4096'))
+    
+    # Competitor/landmark vector tiles
+    VECTOR_TILE_CACHE_MAX_ENTRIES = int(os.getenv('VECTOR_TILE_CACHE_MAX_ENTRIES', '4096'))
+    
+    # Serialize responses with orjson when installed (falls back to the stdlib encoder)
+    FAST_JSON = os.getenv('FAST_JSON', 'True').lower() == 'true'
+    
+    # Response compression (brotli is used only if the brotli package is installed)
+    COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', '1024'))
+    GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', '6'))
+    BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', '5'))
+    
+    # City-wide sweeps
+    MAX_SWEEP_CELLS = int(os.getenv('MAX_SWEEP_CELLS', '250000'))
+    MAX_SWEEP_TILES = int(os.getenv('MAX_SWEEP_TILES', '4000'))
+    SWEEP_FETCH_WORKERS = int(os.getenv('SWEEP_FETCH_WORKERS', '4'))  # concurrent Overpass queries
+    SWEEP_SCORE_WORKERS = int(os.getenv('SWEEP_SCORE_WORKERS', str(os.cpu_count() or 1)))  # scoring processes
+    
+    # Multi-site placement
+    MAX_PLACEMENT_SITES = int(os.getenv('MAX_PLACEMENT_SITES', '25'))
+    MAX_PLACEMENT_CELLS = int(os.getenv('MAX_PLACEMENT_CELLS', '40000'))
+    MAX_PLACEMENT_CANDIDATES = int(os.getenv('MAX_PLACEMENT_CANDIDATES', '5000'))
+    
+    # MAJOR_AREAS warm-up job
+    WARMUP_ON_STARTUP = os.getenv('WARMUP_ON_STARTUP', 'False').lower() == 'true'
+    WARMUP_RATE_PER_MIN = float(os.getenv('WARMUP_RATE_PER_MIN', '2'))  # analyses per minute
+    WARMUP_CACHE_TTL = int(os.getenv('WARMUP_CACHE_TTL', '172800'))  # seconds warm-up results stay cached
+    WARMUP_LOOP = os.getenv('WARMUP_LOOP', 'True').lower() == 'true'  # keep refreshing after a pass
+    WARMUP_STATE_FILE = os.getenv(
+        'WARMUP_STATE_FILE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'warmup_state.json')
+    )
+    
+    # Shared secret for admin actions (X-Admin-Token header); empty disables them
+    ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+    
     @classmethod
     def validate(cls):
         """Validate that required API keys are present."""
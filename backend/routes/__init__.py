@@ -5,5 +5,8 @@ Hotspot IQ - Routes Package
 from .location_routes import location_bp
 from .analysis_routes import analysis_bp
 from .chat_routes import chat_bp
+from .admin_routes import admin_bp
+from .scoring_routes import scoring_bp
+from .tile_routes import tiles_bp
 
-__all__ = ['location_bp', 'analysis_bp', 'chat_bp']
+__all__ = ['location_bp', 'analysis_bp', 'chat_bp', 'admin_bp', 'scoring_bp', 'tiles_bp']
@@ -0,0 +1,147 @@
+"""
+Hotspot IQ - Admin Routes
+Handles operational endpoints such as the cache warm-up job,
+validation cache maintenance and admission metrics.
+"""
+
+import functools
+import hmac
+from typing import Callable
+
+from flask import Blueprint, request, jsonify
+from config import Config
+from services.warmup_service import warmup_job, MAJOR_AREA_RADIUS
+from services.validation_service import invalidate_validation_cache, validation_cache_stats, VALIDATION_CHECKS
+from utils.admission import admission_stats
+
+admin_bp = Blueprint('admin', __name__)
+
+
+def require_admin_token(func: Callable) -> Callable:
+    """
+    Only run func for requests carrying Config.ADMIN_TOKEN in X-Admin-Token.
+    
+    Returns 403 while no token is configured and 401 for a missing or wrong one.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not Config.ADMIN_TOKEN:
+            return jsonify({'error': 'Admin actions are disabled (ADMIN_TOKEN is not set)'}), 403
+        token = request.headers.get('X-Admin-Token', '')
+        if not hmac.compare_digest(token.encode(), Config.ADMIN_TOKEN.encode()):
+            return jsonify({'error': 'Missing or invalid X-Admin-Token'}), 401
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@admin_bp.route('/warmup/start', methods=['POST'])
+@require_admin_token
+def start_warmup():
+    """
+    POST /api/warmup/start
+    
+    Starts precomputing analyses for MAJOR_AREAS x business types.
+    Requires the X-Admin-Token header.
+    
+    Request body (all optional):
+    {
+        "cities": ["bengaluru", "mumbai"],
+        "business_types": ["cafe", "gym"],
+        "radius": 2500,
+        "resume": true
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    
+    started = warmup_job.start(
+        cities=data.get('cities'),
+        business_types=data.get('business_types'),
+        radius=data.get('radius', MAJOR_AREA_RADIUS),
+        resume=data.get('resume', True)
+    )
+    
+    if not started:
+        return jsonify({'error': 'Warm-up is already running', 'status': warmup_job.status()}), 409
+    
+    return jsonify({'message': 'Warm-up started', 'status': warmup_job.status()}), 202
+
+
+@admin_bp.route('/warmup/status', methods=['GET'])
+def warmup_status():
+    """
+    GET /api/warmup/status
+    
+    Returns progress of the current (or last) warm-up run.
+    """
+    return jsonify(warmup_job.status())
+
+
+@admin_bp.route('/warmup/stop', methods=['POST'])
+@require_admin_token
+def stop_warmup():
+    """
+    POST /api/warmup/stop
+    
+    Stops the warm-up after the current item. Progress is kept for resuming.
+    Requires the X-Admin-Token header.
+    """
+    warmup_job.stop()
+    return jsonify({'message': 'Warm-up stopping', 'status': warmup_job.status()})
+
+
+@admin_bp.route('/validation/cache', methods=['GET'])
+def validation_cache():
+    """
+    GET /api/validation/cache
+    
+    Returns size and hit/miss counters of the validation verdict cache.
+    """
+    return jsonify(validation_cache_stats())
+
+
+@admin_bp.route('/validation/cache/invalidate', methods=['POST'])
+@require_admin_token
+def invalidate_validation():
+    """
+    POST /api/validation/cache/invalidate
+    
+    Drops cached validation verdicts, e.g. after roads open or an area is
+    redeveloped. Without a body the whole cache is cleared.
+    Requires the X-Admin-Token header.
+    
+    Request body (all optional):
+    {
+        "bbox": {"south": 12.85, "west": 77.45, "north": 13.10, "east": 77.75},
+        "checks": ["roadway", "viability", "road_quality"]
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    
+    bounds = None
+    if data.get('bbox') is not None:
+        bbox = data['bbox']
+        try:
+            if isinstance(bbox, list):
+                bbox = dict(zip(('south', 'west', 'north', 'east'), bbox))
+            bounds = {k: float(bbox[k]) for k in ('south', 'west', 'north', 'east')}
+        except (KeyError, TypeError, ValueError) as e:
+            return jsonify({'error': f'Invalid bbox: {e}'}), 400
+    
+    checks = data.get('checks')
+    if checks is not None:
+        if not isinstance(checks, list) or any(check not in VALIDATION_CHECKS for check in checks):
+            return jsonify({'error': f"checks must be a list of {', '.join(VALIDATION_CHECKS)}"}), 400
+    
+    removed = invalidate_validation_cache(bounds, checks)
+    return jsonify({'removed': removed, 'stats': validation_cache_stats()})
+
+
+@admin_bp.route('/admission', methods=['GET'])
+def admission():
+    """
+    GET /api/admission
+    
+    Returns analysis queue occupancy, queue-time metrics and rejections,
+    and token levels and delays per upstream quota.
+    """
+    return jsonify(admission_stats())
@@ -3,117 +3,53 @@ Hotspot IQ - Analysis Routes
 Handles location analysis, isochrone, and scoring endpoints.
 """
 
-import re
-import math
 from flask import Blueprint, request, jsonify
 from services.latlong_service import latlong_service
-from services.places_service import fetch_competitors, fetch_landmarks
-from utils.score_calculator import analyze_location, find_recommended_spots
-from services.relevance_service import get_relevance_score, get_marker_style, RELEVANCE_MATRIX
+from services.analysis_service import run_analysis, run_comparison, resolve_comparison_types
+from services.relevance_service import get_relevance_score, get_marker_style, get_relevance_response
 from services.validation_service import validate_and_fetch_data, ValidationError
+from utils.payload import parse_fields, parse_flag, project_fields, compact_analysis
+from utils.http_cache import conditional_response
+from utils.admission import analyze_queue, QueueFull
+from utils.request_budget import with_request_budget
+from utils.score_calculator import resolve_scoring_mode
 
 analysis_bp = Blueprint('analysis', __name__)
 
+# Browsers may reuse /api/relevance responses for this long (seconds)
+RELEVANCE_MAX_AGE = 3600
 
-# Category detection keywords for landmarks
-LANDMARK_CATEGORY_KEYWORDS = {
-    'metro_station': ['metro', 'subway'],
-    'bus_stop': ['bus stop', 'bus stand', 'bus station'],
-    'railway_station': ['railway', 'train station', 'rail'],
-    'school': ['school', 'vidyalaya', 'vidya'],
-    'college': ['college', 'university', 'institute', 'iit', 'nit'],
-    'hospital': ['hospital', 'medical', 'clinic', 'healthcare'],
-    'mall': ['mall', 'plaza', 'shopping'],
-    'office': ['office', 'corporate', 'tech park', 'business'],
-    'residential': ['apartment', 'residency', 'housing', 'colony'],
-    'temple': ['temple', 'mandir', 'church', 'mosque', 'gurudwara', 'masjid'],
-    'park': ['park', 'garden', 'ground'],
-    'atm': ['atm', 'bank'],
-    'bar': ['bar', 'pub', 'brewery'],
-    'restaurant': ['restaurant', 'dhaba', 'food', 'kitchen', 'cafe', 'diner'],
-    'hotel': ['hotel', 'lodge', 'guest house', 'inn', 'oyo', 'capital o'],
-}
 
+def _busy_response(error: QueueFull):
+    """429 for an analysis turned away by the admission queue."""
+    response = jsonify({'error': 'Server busy, please retry shortly', 'retry_after': error.retry_after})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 429
 
-def detect_landmark_category(name: str) -> str:
-    """Detect category from landmark name."""
-    name_lower = name.lower()
-    for category, keywords in LANDMARK_CATEGORY_KEYWORDS.items():
-        if any(kw in name_lower for kw in keywords):
-            return category
-    return 'default'
 
-
-def parse_landmarks_from_text(landmark_text, business_type=''):
-    """
-    Parse landmark info from reverse geocode response.
-    Example inputs: 
-        "< 0.5km from Cafe Noir, < 0.5km from Farzi Cafe"
-        "~ 0.5km from SDH Danapur, ~ 0.5km from Pizza Corner"
-    
-    Returns:
-        tuple: (all_landmarks, competitors_only)
-    """
-    if not landmark_text:
-        return [], []
-    
-    all_landmarks = []
-    competitors = []
-    
-    # Business type keywords to identify competitors
-    competitor_keywords = {
-        'cafe': ['cafe', 'coffee', 'tea', 'bakery', 'starbucks', 'barista', 'roasters', 'brew', 'chai'],
-        'restaurant': ['restaurant', 'food', 'kitchen', 'dhaba', 'biryani', 'pizza', 'burger', 'diner', 'sweets', 'corner', 'hotel', 'eatery', 'cuisine', 'tandoor', 'grill', 'chinese', 'mughlai'],
-        'gym': ['gym', 'fitness', 'yoga', 'sports', 'crossfit', 'health club', 'workout'],
-        'pharmacy': ['pharmacy', 'medical', 'chemist', 'medicine', 'drugstore', 'pharma', 'medico'],
-        'salon': ['salon', 'spa', 'beauty', 'hair', 'parlour', 'parlor', 'unisex', 'barber'],
-        'retail': ['store', 'mart', 'shop', 'retail', 'boutique', 'emporium', 'showroom'],
-        'grocery': ['grocery', 'kirana', 'supermarket', 'mart', 'provision', 'general store'],
-    }
-    
-    # Parse each landmark mention
-    parts = landmark_text.split(',')
-    for part in parts:
-        part = part.strip()
-        # Extract distance and name - handle variations like:
-        # "< 0.5km from X", "~ 0.5km from X", "> 0.5km from X", "0.5km from X"
-        match = re.match(r'[<>~]?\s*([\d.]+)\s*km\s+from\s+(.+)', part, re.IGNORECASE)
-        if match:
-            distance_km = float(match.group(1))
-            name = match.group(2).strip()
-            
-            # Determine category based on name
-            category = 'landmark'
-            keywords = competitor_keywords.get(business_type, [])
-            is_competitor = any(kw in name.lower() for kw in keywords)
-            
-            if is_competitor:
-                category = business_type
-            
-            landmark = {
-                'name': name,
-                'distance': int(distance_km * 1000),  # Convert to meters
-                'category': category,
-                'is_competitor': is_competitor
-            }
-            
-            # Add to all landmarks list
-            all_landmarks.append(landmark)
-            
-            # Also track competitors separately
-            if is_competitor:
-                competitors.append(landmark)
-    
-    return all_landmarks, competitors
+def _valid_radius(radius) -> bool:
+    """Whether an analysis radius is a positive number (bools excluded)."""
+    return isinstance(radius, (int, float)) and not isinstance(radius, bool) and radius > 0
 
 
 @analysis_bp.route('/analyze', methods=['POST'])
+@with_request_budget
 def analyze():
     """
     POST /api/analyze
     
     Performs comprehensive location analysis including opportunity score.
     Now uses area-based validation to consider the entire radius, not just center.
+    
+    Optional response shaping (body keys or query parameters):
+        fields: "location,competitors.count" - keep only these dotted paths
+        compact: true - short keys, rounded coordinates, columnar POI lists
+    
+    "scoring_mode": "relevance" weighs landmarks by their relevance to the
+    business type when picking recommended spots (default: "keyword").
+    
+    Analyses wait in the admission queue (time spent there counts against
+    the request deadline); 429 with Retry-After when it is full.
     """
     data = request.get_json()
     
@@ -138,240 +74,96 @@ def analyze():
     if not business_type:
         return jsonify({'error': 'business_type is required'}), 400
     
-    # Store original center for reference
-    center_lat, center_lng = lat, lng
-    
-    # === AREA-BASED VALIDATION ===
-    # Validate the entire radius area, not just the center point
-    # This allows analysis even when center is in water, if there's land nearby
-    print(f"\n🛡️ Running area-based validation (radius={radius}m)...")
-    is_valid, validation_result = validate_and_fetch_data(lat, lng, business_type, radius=radius)
-    
-    if not is_valid:
-        error_message = validation_result.get('message', 'Location validation failed')
-        error_type = validation_result.get('error_type', 'validation_error')
-        print(f"❌ Area validation failed: {error_message}")
+    if not _valid_radius(radius):
+        return jsonify({'error': 'radius must be a positive number of meters'}), 400
+    
+    try:
+        fields = parse_fields(data.get('fields', request.args.get('fields')))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    compact = parse_flag(data.get('compact', request.args.get('compact', 'false')))
+    
+    try:
+        scoring_mode = resolve_scoring_mode(data.get('scoring_mode'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        with analyze_queue.admit():
+            response = run_analysis(lat, lng, business_type, radius, filters, scoring_mode=scoring_mode)
+    except QueueFull as e:
+        return _busy_response(e)
+    except ValidationError as e:
         return jsonify({
-            'error': error_message,
-            'error_type': error_type,
+            'error': e.message,
+            'error_type': e.error_type,
             'validation_failed': True
         }), 400
     
-    # Use the analysis point (best land location found within radius)
-    # This could be the center if it was valid, or a nearby land point if center was in water
-    analysis_point = validation_result.get('analysis_point', {})
-    if analysis_point.get('lat') and analysis_point.get('lng'):
-        lat, lng = analysis_point['lat'], analysis_point['lng']
-        print(f"📍 Using analysis point: ({lat}, {lng})")
-    
-    # Also check for snapped location (on-road point)
-    snapped_location = validation_result.get('snapped_location', {})
-    if snapped_location.get('lat') and snapped_location.get('lng'):
-        snap_lat, snap_lng = snapped_location['lat'], snapped_location['lng']
-        
-        # Calculate distance between analysis point and snapped
-        R = 6371000  # Earth radius in meters
-        dlat = math.radians(snap_lat - lat)
-        dlng = math.radians(snap_lng - lng)
-        a = math.sin(dlat/2)**2 + math.cos(math.radians(lat)) * math.cos(math.radians(snap_lat)) * math.sin(dlng/2)**2
-        snap_distance = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        # Use snapped if it's close to analysis point (within 100m)
-        if snap_distance < 100:
-            lat, lng = snap_lat, snap_lng
-            print(f"📍 Using snapped location: ({lat}, {lng}) - {snap_distance:.1f}m from analysis point")
-    
-    print(f"✅ Area validation passed!")
-    print(f"   Center: ({center_lat}, {center_lng})")
-    print(f"   Analysis point: ({lat}, {lng})")
-    # === END VALIDATION ===
-    
-    # Get reverse geocode for address info (includes landmark text)
-    # Use the analysis point for more accurate address
-    address_info = latlong_service.reverse_geocode(lat, lng)
-    
-    # Parse landmarks from reverse geocode landmark field
-    parsed_landmarks, _ = parse_landmarks_from_text(
-        address_info.get('landmark', ''), 
-        business_type
-    )
-    
-    # Get landmarks from multiple sample points to cover the full radius
-    # Sample points: center + 4 cardinal directions + 4 diagonal directions
-    sample_offsets = [
-        (0, 0),  # Center
-        (0.7, 0), (-0.7, 0), (0, 0.7), (0, -0.7),  # Cardinal directions at 70% radius
-        (0.5, 0.5), (-0.5, 0.5), (0.5, -0.5), (-0.5, -0.5),  # Diagonals at 50% radius
-    ]
-    
-    # Convert radius to lat/lng offsets - use original center for sampling
-    lat_offset_per_m = 1 / 111000  # ~1 degree per 111km
-    lng_offset_per_m = 1 / (111000 * math.cos(math.radians(center_lat)))
-    
-    nearby_landmarks = []
-    landmark_names_seen = set()
-    
-    # Use center_lat/center_lng for sampling to cover the whole selected area
-    for lat_mult, lng_mult in sample_offsets:
-        sample_lat = center_lat + (lat_mult * radius * lat_offset_per_m)
-        sample_lng = center_lng + (lng_mult * radius * lng_offset_per_m)
-        
-        # Get landmarks at this sample point
-        sample_landmarks = latlong_service.get_landmarks(sample_lat, sample_lng)
-        
-        for lm in sample_landmarks:
-            lm_name = lm.get('name', '').lower()
-            if lm_name and lm_name not in landmark_names_seen:
-                landmark_names_seen.add(lm_name)
-                nearby_landmarks.append(lm)
-    
-    # Fetch competitors using the new places_service (covers entire radius from center)
-    print(f"🔎 Fetching competitors: category={business_type}, radius={radius}m from center")
-    osm_competitors = fetch_competitors(center_lat, center_lng, radius, business_type)
-    
-    # Fetch landmarks using places_service for better area coverage
-    osm_landmarks = fetch_landmarks(center_lat, center_lng, radius)
-    
-    # Also fetch landmarks from LatLong POI API for additional data
-    latlong_poi_categories = ['hospital', 'school', 'hotel', 'bank', 'atm', 'mall', 'restaurant']
-    latlong_pois = []
-    for poi_cat in latlong_poi_categories:
-        try:
-            poi_result = latlong_service.get_poi(center_lat, center_lng, poi_cat, radius)
-            for poi in poi_result.get('pois', []):
-                latlong_pois.append({
-                    'name': poi.get('name', ''),
-                    'category': poi_cat,
-                    'lat': poi.get('lat', center_lat),
-                    'lng': poi.get('lng', center_lng)
-                })
-        except Exception as e:
-            print(f"⚠️ Error fetching POI {poi_cat}: {e}")
-    
-    print(f"📍 Found {len(latlong_pois)} POIs from LatLong API")
-    
-    # Combine all landmarks - start with parsed landmarks
-    all_landmarks = []
-    existing_names = set()
-    
-    # Add parsed landmarks with detected categories
-    for lm in parsed_landmarks:
-        lm_name = lm.get('name', '')
-        if lm_name.lower() not in existing_names:
-            # Detect category from name
-            lm['category'] = detect_landmark_category(lm_name)
-            all_landmarks.append(lm)
-            existing_names.add(lm_name.lower())
-    
-    # Add landmarks from Landmarks API with detected categories
-    for lm in nearby_landmarks:
-        lm_name = lm.get('name', '')
-        if lm_name.lower() not in existing_names:
-            lm['category'] = detect_landmark_category(lm_name)
-            all_landmarks.append(lm)
-            existing_names.add(lm_name.lower())
-    
-    # Add landmarks from OpenStreetMap (for better area coverage)
-    for lm in osm_landmarks:
-        lm_name = lm.get('name', '')
-        if lm_name.lower() not in existing_names:
-            # Convert places_service format to expected format
-            all_landmarks.append({
-                'name': lm_name,
-                'lat': lm.get('lat'),
-                'lng': lm.get('lng'),
-                'category': lm.get('type', 'landmark')
-            })
-            existing_names.add(lm_name.lower())
-    
-    # Add landmarks from LatLong POI API
-    for poi in latlong_pois:
-        poi_name = poi.get('name', '')
-        if poi_name.lower() not in existing_names:
-            all_landmarks.append(poi)
-            existing_names.add(poi_name.lower())
-    
-    print(f"🏛️ Total landmarks combined: {len(all_landmarks)}")
-    
-    # Format competitors with distance calculation from center
-    all_competitors = []
-    for comp in osm_competitors:
-        # Calculate approximate distance in meters from center
-        R = 6371000  # Earth's radius in meters
-        lat1, lon1 = math.radians(center_lat), math.radians(center_lng)
-        lat2, lon2 = math.radians(comp.get('lat', center_lat)), math.radians(comp.get('lng', center_lng))
-        dlat, dlon = lat2 - lat1, lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        distance = int(R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a)))
-        
-        all_competitors.append({
-            'name': comp.get('name', 'Unknown'),
-            'category': business_type,
-            'lat': comp.get('lat'),
-            'lng': comp.get('lng'),
-            'distance': distance,
-            'is_competitor': True
-        })
+    if fields:
+        response = project_fields(response, fields)
+    if compact:
+        response = compact_analysis(response)
     
-    # Sort competitors by distance
-    all_competitors.sort(key=lambda x: x.get('distance', 9999))
+    return jsonify(response)
+
+
+@analysis_bp.route('/analyze/compare', methods=['POST'])
+@with_request_budget
+def compare_business_types():
+    """
+    POST /api/analyze/compare
     
-    # Get Digipin using analysis point for accurate pincode
-    digipin_info = latlong_service.get_digipin(lat, lng)
+    Ranks business types for one area from a single shared POI fetch.
     
-    # Build landmarks structure for analysis
-    landmarks_data = {
-        'by_category': {'nearby': {'count': len(all_landmarks), 'pois': all_landmarks}},
-        'total_count': len(all_landmarks),
-        'all_pois': all_landmarks
+    Request body:
+    {
+        "lat": 12.9716,
+        "lng": 77.5946,
+        "radius": 1000,
+        "business_types": ["cafe", "gym"]   // optional, default: all
     }
     
-    # Build competitors structure
-    competitors_data = {
-        'count': len(all_competitors),
-        'nearby': all_competitors
-    }
+    Shares the admission queue with /api/analyze.
+    """
+    data = request.get_json()
     
-    # Perform analysis
-    analysis_result = analyze_location(landmarks_data, competitors_data, business_type)
-    
-    # Find recommended spots for business setup (search from center of selected area)
-    print(f"🎯 Finding recommended spots in the area...")
-    recommended_spots = find_recommended_spots(
-        center_lat=center_lat,
-        center_lng=center_lng,
-        radius=radius,
-        competitors=all_competitors,
-        landmarks=all_landmarks,
-        max_spots=5
-    )
-    print(f"✅ Found {len(recommended_spots)} recommended spots")
-    
-    # Compile response - return ALL competitors for heatmap accuracy
-    response = {
-        'location': {
-            'lat': lat,  # Analysis point (best usable location found)
-            'lng': lng,
-            'center_lat': center_lat,  # Original selected center
-            'center_lng': center_lng,
-            'address': address_info,
-            'digipin': digipin_info.get('digipin', '')
-        },
-        'business_type': business_type,
-        'radius': radius,
-        'filters_applied': filters,
-        'recommended_spots': recommended_spots,  # NEW: Recommended business locations
-        'competitors': {
-            'count': len(all_competitors),
-            'nearby': all_competitors  # Return ALL competitors for heatmap
-        },
-        'landmarks': {
-            'total': len(all_landmarks),
-            'by_category': {'nearby': len(all_landmarks)},
-            'list': all_landmarks  # Return all landmarks
-        },
-        'footfall_proxy': 'high' if analysis_result['breakdown']['footfall_proxy'] > 60 else 'medium' if analysis_result['breakdown']['footfall_proxy'] > 30 else 'low'
-    }
+    if not data:
+        return jsonify({'error': 'Request body is required'}), 400
+    
+    lat = data.get('lat')
+    lng = data.get('lng')
+    is_major_area = data.get('is_major', False)
+    radius = data.get('radius', 2500 if is_major_area else 1000)
+    business_types = data.get('business_types')
+    
+    if lat is None or lng is None:
+        return jsonify({'error': 'lat and lng are required'}), 400
+    
+    if not _valid_radius(radius):
+        return jsonify({'error': 'radius must be a positive number of meters'}), 400
+    
+    if business_types is not None and not isinstance(business_types, list):
+        return jsonify({'error': 'business_types must be a list'}), 400
+    
+    print(f"🏆 Comparison Request: lat={lat}, lng={lng}, radius={radius}m, types={business_types or 'all'}")
+    
+    try:
+        business_types = resolve_comparison_types(business_types)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        with analyze_queue.admit():
+            response = run_comparison(lat, lng, radius, business_types)
+    except QueueFull as e:
+        return _busy_response(e)
+    except ValidationError as e:
+        return jsonify({
+            'error': e.message,
+            'error_type': e.error_type,
+            'validation_failed': True
+        }), 400
     
     return jsonify(response)
 
@@ -533,6 +325,9 @@ def get_relevance_data():
         - business_type: The selected business type (optional)
         - landmark_type: Specific landmark type to get score for (optional)
     Returns relevance matrix or specific score with marker style.
+    
+    The full matrix response carries a strong ETag; revalidation with
+    If-None-Match returns 304.
     """
     business_type = request.args.get('business_type', 'other').lower()
     landmark_type = request.args.get('landmark_type')
@@ -548,22 +343,9 @@ def get_relevance_data():
             'marker_style': style
         })
     else:
-        # Return all scores for the business type
-        if business_type in RELEVANCE_MATRIX:
-            scores = RELEVANCE_MATRIX[business_type]
-        else:
-            scores = RELEVANCE_MATRIX['other']
-        
-        # Calculate styles for each landmark type
-        styles = {}
-        for ltype, score in scores.items():
-            styles[ltype] = get_marker_style(business_type, ltype)
-        
-        return jsonify({
-            'business_type': business_type,
-            'relevance_scores': scores,
-            'marker_styles': styles
-        })
+        # Return all scores for the business type (precomputed at import)
+        cached = get_relevance_response(business_type)
+        return conditional_response(cached['body'], cached['etag'], cached['mimetype'], RELEVANCE_MAX_AGE)
 
 
 @analysis_bp.route('/validate-location', methods=['POST'])
@@ -5,9 +5,13 @@ Handles autocomplete, reverse geocoding, and digipin endpoints.
 
 from flask import Blueprint, request, jsonify
 from services.latlong_service import latlong_service
+from utils import digipin
 
 location_bp = Blueprint('location', __name__)
 
+# Maximum number of points/codes accepted by the batch Digipin endpoint
+MAX_DIGIPIN_BATCH = 10000
+
 
 @location_bp.route('/autocomplete', methods=['GET'])
 def autocomplete():
@@ -100,3 +104,99 @@ def get_digipin():
     result = latlong_service.get_digipin(lat, lng)
     
     return jsonify(result)
+
+
+@location_bp.route('/digipin/decode', methods=['GET'])
+def decode_digipin():
+    """
+    GET /api/digipin/decode?code={digipin}
+    
+    Returns the center coordinate and cell bounds for a Digipin.
+    """
+    code = request.args.get('code', '')
+    
+    if not code:
+        return jsonify({'error': 'code parameter is required'}), 400
+    
+    try:
+        lat, lng = digipin.decode(code)
+        bounds = digipin.decode_bounds(code)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({
+        'digipin': code.upper(),
+        'lat': lat,
+        'lng': lng,
+        'bounds': bounds
+    })
+
+
+@location_bp.route('/digipin/batch', methods=['POST'])
+def digipin_batch():
+    """
+    POST /api/digipin/batch
+    
+    Encodes many points (or decodes many codes) in one call.
+    
+    Request body (encode):
+    {
+        "points": [{"lat": 12.9716, "lng": 77.5946}, ...]
+    }
+    
+    Request body (decode):
+    {
+        "codes": ["4P3-JK8-52C9", ...]
+    }
+    
+    Send one of the two, at most MAX_DIGIPIN_BATCH items. Points outside
+    the DIGIPIN bounding box and invalid codes get a per-item "error".
+    """
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({'error': 'Request body is required'}), 400
+    
+    points = data.get('points')
+    codes = data.get('codes')
+    
+    if points is None and codes is None:
+        return jsonify({'error': 'points or codes is required'}), 400
+    
+    if points is not None and codes is not None:
+        return jsonify({'error': 'Send either points or codes, not both'}), 400
+    
+    items = points if points is not None else codes
+    if not isinstance(items, list):
+        return jsonify({'error': 'points/codes must be a list'}), 400
+    
+    if len(items) > MAX_DIGIPIN_BATCH:
+        return jsonify({'error': f'Batch size exceeds limit of {MAX_DIGIPIN_BATCH}'}), 400
+    
+    if codes is not None:
+        decoded = digipin.decode_batch(codes)
+        return jsonify({
+            'count': len(decoded),
+            'results': [
+                {'digipin': code, 'lat': point[0], 'lng': point[1]} if point else
+                {'digipin': code, 'error': 'Invalid DIGIPIN'}
+                for code, point in zip(codes, decoded)
+            ]
+        })
+    
+    try:
+        lats = [float(p['lat']) for p in points]
+        lngs = [float(p['lng']) for p in points]
+    except (KeyError, TypeError, ValueError):
+        return jsonify({'error': 'Each point must have numeric lat and lng'}), 400
+    
+    encoded = digipin.encode_batch(lats, lngs)
+    
+    return jsonify({
+        'count': len(encoded),
+        'results': [
+            {'lat': lat, 'lng': lng, 'digipin': code} if code else
+            {'lat': lat, 'lng': lng, 'error': 'Outside the DIGIPIN bounding box'}
+            for lat, lng, code in zip(lats, lngs, encoded)
+        ]
+    })
@@ -0,0 +1,245 @@
+"""
+Hotspot IQ - Scoring Routes
+Handles bulk scoring of candidate sites, city-wide sweeps and multi-site placement.
+"""
+
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from services.places_service import parse_business_type
+from services.scoring_service import parse_points, iter_scores, load_region
+from services.tile_cache import TilesUnavailable, missing_tile_count
+from services.sweep_service import run_sweep, DEFAULT_CELL_SIZE
+from services.hex_service import get_hex_grid
+from services.placement_service import optimize_placement, DEFAULT_SERVICE_RADIUS
+from utils.geometry import parse_polygon
+from utils.payload import parse_flag
+
+scoring_bp = Blueprint('scoring', __name__)
+
+
+def _unavailable_response(error: TilesUnavailable):
+    """503 when none of the POI tiles a request needs could be loaded."""
+    return jsonify({'error': str(error), 'missing_tiles': error.missing}), 503
+
+
+def _parse_region(data: dict):
+    """
+    Read the region of a sweep-style request body.
+
+    Returns:
+        Tuple of (bounds, rings); exactly one is set
+
+    Raises:
+        ValueError: If neither bbox nor polygon is given or they are invalid
+    """
+    if data.get('polygon') is not None:
+        return None, parse_polygon(data['polygon'])
+
+    if data.get('bbox') is None:
+        raise ValueError('bbox or polygon is required')
+
+    bbox = data['bbox']
+    try:
+        if isinstance(bbox, list):
+            bbox = dict(zip(('south', 'west', 'north', 'east'), bbox))
+        bounds = {k: float(bbox[k]) for k in ('south', 'west', 'north', 'east')}
+    except (KeyError, TypeError) as e:
+        raise ValueError(f'Invalid bbox: {e}')
+    if bounds['south'] >= bounds['north'] or bounds['west'] >= bounds['east']:
+        raise ValueError('bbox must have south < north and west < east')
+    return bounds, None
+
+
+@scoring_bp.route('/score/batch', methods=['POST'])
+def score_batch_endpoint():
+    """
+    POST /api/score/batch
+
+    Scores many candidate points for one business type in a single call.
+
+    Request body:
+    {
+        "business_type": "cafe",
+        "points": [{"id": "site-1", "lat": 12.9716, "lng": 77.5946}, ...],
+        "stream": false
+    }
+
+    With "stream": true (or Accept: application/x-ndjson) results are
+    streamed as newline-delimited JSON, one point per line.
+
+    When some POI tiles could not be loaded the response has "partial": true
+    and "missing_tiles" (an X-Missing-Tiles header when streaming); 503 when
+    none could.
+    """
+    data = request.get_json()
+
+    if not data:
+        return jsonify({'error': 'Request body is required'}), 400
+
+    try:
+        business_type = parse_business_type(data.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        points = parse_points(data.get('points'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    stream = parse_flag(data.get('stream', False)) or request.accept_mimetypes.best == 'application/x-ndjson'
+
+    print(f"📦 Batch score request: {len(points)} point(s), business_type={business_type}, stream={stream}")
+
+    try:
+        region = load_region(points, business_type)
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+    missing = region[2]
+
+    if stream:
+        def generate():
+            for result in iter_scores(points, business_type, region=region):
+                yield current_app.json.dumps(result) + '\n'
+
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        if missing:
+            response.headers['X-Missing-Tiles'] = str(missing_tile_count(missing))
+        return response
+
+    results = list(iter_scores(points, business_type, region=region))
+    response = {
+        'business_type': business_type,
+        'count': len(results),
+        'results': results
+    }
+    if missing:
+        response['partial'] = True
+        response['missing_tiles'] = missing_tile_count(missing)
+    return jsonify(response)
+
+
+@scoring_bp.route('/sweep', methods=['POST'])
+def sweep():
+    """
+    POST /api/sweep
+
+    Scores a whole region cell by cell and returns ranked hotspot areas.
+
+    Request body:
+    {
+        "business_type": "cafe",
+        "bbox": {"south": 12.85, "west": 77.45, "north": 13.10, "east": 77.75},
+        "polygon": {"type": "Polygon", "coordinates": [[[lng, lat], ...]]},  // optional, instead of bbox
+        "cell_size": 250,
+        "top": 50
+    }
+    """
+    data = request.get_json()
+
+    if not data:
+        return jsonify({'error': 'Request body is required'}), 400
+
+    try:
+        business_type = parse_business_type(data.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        bounds, rings = _parse_region(data)
+        cell_size = float(data.get('cell_size', DEFAULT_CELL_SIZE))
+        top = min(int(data.get('top', 50)), 500)
+
+        result = run_sweep(business_type, bounds, rings, cell_size=cell_size, top=top)
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return jsonify(result)
+
+
+@scoring_bp.route('/hexgrid', methods=['GET'])
+def hexgrid():
+    """
+    GET /api/hexgrid?lat=12.97&lng=77.59&radius=1000&business_type=cafe
+                    &resolution=10&rollup=8&scoring_mode=relevance&boundary=true
+
+    Scores the cells of the global hexagonal grid around a point. Cell ids
+    are stable across requests, so cells already scored for an overlapping
+    area come from cache. With rollup, cells are also aggregated into their
+    parents at that coarser resolution.
+    """
+    lat = request.args.get('lat', type=float)
+    lng = request.args.get('lng', type=float)
+    if lat is None or lng is None:
+        return jsonify({'error': 'lat, lng and business_type are required'}), 400
+
+    try:
+        business_type = parse_business_type(request.args.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        result = get_hex_grid(
+            lat, lng,
+            radius=request.args.get('radius', 1000, type=float),
+            business_type=business_type,
+            resolution=request.args.get('resolution', type=int),
+            scoring_mode=request.args.get('scoring_mode'),
+            rollup=request.args.get('rollup', type=int),
+            boundary=parse_flag(request.args.get('boundary', 'false'))
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return jsonify(result)
+
+
+@scoring_bp.route('/placement', methods=['POST'])
+def placement():
+    """
+    POST /api/placement
+
+    Picks k sites for a chain in a region, maximizing the footfall they
+    capture net of competitors, without new sites eating into each other's
+    (or existing sites') catchments.
+
+    Request body:
+    {
+        "business_type": "cafe",
+        "bbox": {"south": 12.85, "west": 77.45, "north": 13.10, "east": 77.75},
+        "polygon": {...},                // optional, instead of bbox
+        "k": 5,
+        "service_radius": 800,           // catchment radius in meters
+        "cell_size": 250,
+        "existing": [{"lat": 12.97, "lng": 77.59}]   // optional current sites
+    }
+    """
+    data = request.get_json()
+
+    if not data:
+        return jsonify({'error': 'Request body is required'}), 400
+
+    try:
+        business_type = parse_business_type(data.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        bounds, rings = _parse_region(data)
+        existing = parse_points(data['existing']) if data.get('existing') else None
+
+        result = optimize_placement(
+            business_type, bounds, rings,
+            k=int(data.get('k', 5)),
+            service_radius=float(data.get('service_radius', DEFAULT_SERVICE_RADIUS)),
+            cell_size=float(data.get('cell_size', DEFAULT_CELL_SIZE)),
+            existing=existing
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return jsonify(result)
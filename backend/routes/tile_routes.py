@@ -0,0 +1,155 @@
+"""
+Hotspot IQ - Tile Routes
+Handles map layer endpoints (density heatmaps, vector tiles, marker clusters).
+"""
+
+from flask import Blueprint, Response, current_app, request, jsonify
+from services.heatmap_service import get_heatmap_tile
+from services.vector_tile_service import get_vector_tile
+from services.cluster_service import get_clusters
+from services.places_service import parse_business_type
+from services.tile_cache import TilesUnavailable
+from utils.http_cache import conditional_response
+
+tiles_bp = Blueprint('tiles', __name__)
+
+# Browsers and proxies may reuse tiles for this long (seconds)
+TILE_MAX_AGE = 3600
+
+
+def _unavailable_response(error: TilesUnavailable):
+    """503 when none of the POI tiles a layer needs could be loaded."""
+    return jsonify({'error': str(error), 'missing_tiles': error.missing}), 503
+
+
+def _tile_response(tile: dict) -> Response:
+    """
+    Build a cacheable tile response, answering 304 when the ETag matches.
+
+    Tiles built while POI tiles were missing are sent with no-store and no
+    ETag, so clients fetch them again once the data loads.
+    """
+    body = tile['body']
+    if tile['mimetype'] == 'application/json':
+        body = current_app.json.dumps(body)
+    if tile.get('partial'):
+        response = Response(body, mimetype=tile['mimetype'])
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    return conditional_response(body, tile['etag'], tile['mimetype'], TILE_MAX_AGE)
+
+
+def _heatmap(z: int, x: int, y: int, fmt: str):
+    try:
+        business_type = parse_business_type(request.args.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        tile = get_heatmap_tile(
+            z, x, y, business_type, fmt,
+            size=request.args.get('size', 256, type=int),
+            bandwidth=request.args.get('bandwidth', type=float),
+            max_density=request.args.get('max_density', type=float)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return _tile_response(tile)
+
+
+@tiles_bp.route('/heatmap/<int:z>/<int:x>/<int:y>', methods=['GET'])
+def heatmap_json(z, x, y):
+    """
+    GET /api/heatmap/{z}/{x}/{y}?business_type=cafe&size=256&bandwidth=250
+
+    Returns the competitor density of a map tile as a quantized uint8 array
+    (base64, row-major, north row first). value / 255 * max_density_per_km2
+    gives competitors per km².
+    """
+    return _heatmap(z, x, y, 'json')
+
+
+@tiles_bp.route('/heatmap/<int:z>/<int:x>/<int:y>.png', methods=['GET'])
+def heatmap_png(z, x, y):
+    """
+    GET /api/heatmap/{z}/{x}/{y}.png?business_type=cafe
+
+    Returns the competitor density of a map tile as a colored, transparent
+    PNG, ready to use as a Leaflet tile layer.
+    """
+    return _heatmap(z, x, y, 'png')
+
+
+@tiles_bp.route('/tiles/<int:z>/<int:x>/<int:y>.mvt', methods=['GET'])
+def vector_tile(z, x, y):
+    """
+    GET /api/tiles/{z}/{x}/{y}.mvt?business_type=cafe
+
+    Returns competitors and landmarks in a map tile as a Mapbox Vector Tile
+    with two point layers:
+        competitors: name, type
+        landmarks: name, category, relevance, opacity, scale, zIndex, tier
+    Low-relevance landmarks are only included from zoom 15.
+    """
+    try:
+        business_type = parse_business_type(request.args.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        tile = get_vector_tile(z, x, y, business_type)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return _tile_response(tile)
+
+
+@tiles_bp.route('/clusters', methods=['GET'])
+def clusters():
+    """
+    GET /api/clusters?lat=12.97&lng=77.59&radius=2500&business_type=cafe&zoom=14
+                     &bbox=south,west,north,east&layers=competitors,landmarks
+
+    Returns the competitor and landmark markers of an analysis area clustered
+    for the given zoom level, limited to the bbox when given. Clusters carry
+    count, dominant_category, per-category counts and the expansion_zoom at
+    which they split.
+    """
+    lat = request.args.get('lat', type=float)
+    lng = request.args.get('lng', type=float)
+    zoom = request.args.get('zoom', type=float)
+    if lat is None or lng is None or zoom is None:
+        return jsonify({'error': 'lat, lng, zoom and business_type are required'}), 400
+
+    try:
+        business_type = parse_business_type(request.args.get('business_type'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    radius = request.args.get('radius', 1000, type=int)
+    layers = request.args.get('layers')
+
+    bbox = None
+    if request.args.get('bbox'):
+        try:
+            south, west, north, east = (float(v) for v in request.args['bbox'].split(','))
+        except ValueError:
+            return jsonify({'error': 'bbox must be south,west,north,east'}), 400
+        bbox = {'south': south, 'west': west, 'north': north, 'east': east}
+
+    try:
+        result = get_clusters(
+            lat, lng, radius, business_type, zoom, bbox,
+            layers.split(',') if layers else None
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except TilesUnavailable as e:
+        return _unavailable_response(e)
+
+    return jsonify(result)
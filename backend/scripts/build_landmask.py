@@ -0,0 +1,168 @@
+"""
+Hotspot IQ - Land Mask Builder
+Rasterizes OSM land and inland water polygons into the memory-mapped mask
+read by utils/landmask.py.
+
+Inputs are GeoJSON files of Polygon/MultiPolygon features in lng/lat order,
+clipped to the mask area beforehand, for example:
+
+    # Coastline-derived land polygons (https://osmdata.openstreetmap.de/data/land-polygons.html)
+    ogr2ogr -f GeoJSON -clipsrc 68 6.5 97.5 37.5 land.geojson land_polygons.shp
+
+    # Lakes, reservoirs and riverbanks from an India extract
+    osmium tags-filter india-latest.osm.pbf nwr/natural=water nwr/waterway=riverbank -o water.osm.pbf
+    osmium export water.osm.pbf --geometry-types=polygon -o water.geojson
+
+Cells whose centers fall inside a polygon are set (holes follow the even-odd
+rule). The raster is written in bands of rows, so memory stays small even for
+fine resolutions.
+
+Usage (from backend/):
+    python scripts/build_landmask.py --land land.geojson --water water.geojson \
+        [--bbox 6.5,68,37.5,97.5] [--resolution 0.002] [--out data/landmask_india.bin]
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from config import Config
+from utils.landmask import write_header, INDIA_BOUNDS, HEADER_SIZE
+
+# Rows rasterized per band
+BAND_ROWS = 256
+
+
+def load_polygons(paths):
+    """
+    Read Polygon/MultiPolygon features as edge arrays.
+
+    Returns:
+        List of (south, north, west, east, edges) where edges is an (n, 4)
+        array of x1, y1, x2, y2 over all rings of the polygon
+    """
+    polygons = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        features = data.get('features', [data])
+        for feature in features:
+            geometry = feature.get('geometry') or {}
+            if geometry.get('type') == 'Polygon':
+                parts = [geometry['coordinates']]
+            elif geometry.get('type') == 'MultiPolygon':
+                parts = geometry['coordinates']
+            else:
+                continue
+
+            for rings in parts:
+                edges = []
+                for ring in rings:
+                    points = np.asarray([p[:2] for p in ring], dtype=np.float64)
+                    if len(points) < 3:
+                        continue
+                    closed = np.vstack([points, points[:1]]) if not np.array_equal(points[0], points[-1]) else points
+                    edges.append(np.hstack([closed[:-1], closed[1:]]))
+                if not edges:
+                    continue
+                edges = np.vstack(edges)
+                xs, ys = edges[:, [0, 2]], edges[:, [1, 3]]
+                polygons.append((ys.min(), ys.max(), xs.min(), xs.max(), edges))
+    return polygons
+
+
+def rasterize_band(polygons, row_lats: np.ndarray, west: float, lng_step: float, cols: int) -> np.ndarray:
+    """
+    Scanline-fill polygons into a band of rows.
+
+    Args:
+        polygons: Output of load_polygons()
+        row_lats: Latitude of each row's cell centers
+        west: West edge of the raster
+        lng_step: Cell width in degrees
+        cols: Raster width in cells
+
+    Returns:
+        Boolean (rows, cols) array, True where a cell center is inside any polygon
+    """
+    band_south, band_north = row_lats.min(), row_lats.max()
+    coverage = np.zeros((row_lats.size, cols + 1), dtype=np.int32)
+
+    for south, north, _, _, edges in polygons:
+        if north < band_south or south > band_north:
+            continue
+        rows = np.flatnonzero((row_lats >= south) & (row_lats <= north))
+        ys = row_lats[rows]
+        x1, y1, x2, y2 = edges[:, 0:1], edges[:, 1:2], edges[:, 2:3], edges[:, 3:4]
+
+        # Edge crossings of each row's scanline, sorted along the row
+        edge_idx, row_idx = np.nonzero((y1 > ys) != (y2 > ys))
+        if edge_idx.size == 0:
+            continue
+        x = (x1[edge_idx, 0] + (ys[row_idx] - y1[edge_idx, 0])
+             * (x2[edge_idx, 0] - x1[edge_idx, 0]) / (y2[edge_idx, 0] - y1[edge_idx, 0]))
+        order = np.lexsort((x, row_idx))
+        row_idx, x = row_idx[order], x[order]
+
+        # Even-odd: consecutive crossings pair up into inside spans
+        start_col = np.ceil((x[0::2] - west) / lng_step - 0.5).astype(np.int64)
+        end_col = np.floor((x[1::2] - west) / lng_step - 0.5).astype(np.int64)
+        span_rows = rows[row_idx[0::2]]
+        start_col, end_col = np.clip(start_col, 0, cols), np.clip(end_col, -1, cols - 1)
+        valid = start_col <= end_col
+
+        np.add.at(coverage, (span_rows[valid], start_col[valid]), 1)
+        np.add.at(coverage, (span_rows[valid], end_col[valid] + 1), -1)
+
+    return np.cumsum(coverage, axis=1)[:, :cols] > 0
+
+
+def build(land_paths, water_paths, bounds, resolution: float, out: str) -> None:
+    started = time.time()
+    rows = int(math.ceil((bounds['north'] - bounds['south']) / resolution))
+    cols = int(math.ceil((bounds['east'] - bounds['west']) / resolution))
+    bounds = dict(bounds, north=bounds['south'] + rows * resolution, east=bounds['west'] + cols * resolution)
+
+    land = load_polygons(land_paths)
+    water = load_polygons(water_paths)
+    print(f"📥 Loaded {len(land)} land and {len(water)} water polygons in {time.time() - started:.1f}s")
+    print(f"🧱 Rasterizing {rows}x{cols} cells at {resolution}° (~{resolution * 111000:.0f}m)")
+
+    row_bytes = (cols + 7) // 8
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'wb') as f:
+        write_header(f, bounds, rows, cols)
+        f.truncate(HEADER_SIZE + 2 * rows * row_bytes)
+
+        for band_start in range(0, rows, BAND_ROWS):
+            band_rows = np.arange(band_start, min(band_start + BAND_ROWS, rows))
+            row_lats = bounds['north'] - (band_rows + 0.5) * resolution
+            for plane, polygons in enumerate((land, water)):
+                mask = rasterize_band(polygons, row_lats, bounds['west'], resolution, cols)
+                f.seek(HEADER_SIZE + (plane * rows + band_start) * row_bytes)
+                f.write(np.packbits(mask, axis=1).tobytes())
+            print(f"   {min(band_start + BAND_ROWS, rows)}/{rows} rows", end='\r')
+
+    size_mb = os.path.getsize(out) / 1e6
+    print(f"\n✅ Wrote {out} ({size_mb:.1f} MB) in {time.time() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--land', action='append', required=True, help='GeoJSON land polygons (repeatable)')
+    parser.add_argument('--water', action='append', default=[], help='GeoJSON inland water polygons (repeatable)')
+    parser.add_argument('--bbox', help='south,west,north,east (default: India)')
+    parser.add_argument('--resolution', type=float, default=0.002, help='Cell size in degrees')
+    parser.add_argument('--out', default=Config.LANDMASK_PATH)
+    args = parser.parse_args()
+
+    bounds = INDIA_BOUNDS
+    if args.bbox:
+        bounds = dict(zip(('south', 'west', 'north', 'east'), (float(v) for v in args.bbox.split(','))))
+    build(args.land, args.water, bounds, args.resolution, args.out)
@@ -0,0 +1,700 @@
+"""
+Hotspot IQ - Analysis Service
+Runs the full location analysis pipeline behind /api/analyze.
+
+The pipeline lives here (rather than in the route) so it can also be driven
+by background jobs such as the MAJOR_AREAS warm-up. Completed analyses are
+cached per (DIGIPIN of center, business type, radius).
+
+run_comparison() reuses the same stages to rank every business type for an
+area from one shared landmark and competitor fetch.
+"""
+
+import re
+import math
+import copy
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from services.latlong_service import latlong_service
+from services.places_service import (
+    fetch_competitors, fetch_landmarks, prefetch_categories, competitor_categories, with_poi_context,
+    LANDMARK_CATEGORIES
+)
+from utils.relevance import relevance_scores, RELEVANCE_MATRIX, DEFAULT_RELEVANCE
+from services.validation_service import validate_and_fetch_data, ValidationError
+from services.cache_service import TTLCache, spatial_key
+from utils.request_budget import with_request_budget, current_budget, stage_allowed
+from utils.score_calculator import (
+    analyze_location, find_recommended_spots, calculate_grid_scores, get_score_interpretation,
+    resolve_scoring_mode
+)
+
+
+# Completed analysis responses
+_analysis_cache = TTLCache('analysis', Config.ANALYSIS_CACHE_TTL, Config.ANALYSIS_CACHE_MAX_ENTRIES)
+
+
+# Category detection keywords for landmarks
+LANDMARK_CATEGORY_KEYWORDS = {
+    'metro_station': ['metro', 'subway'],
+    'bus_stop': ['bus stop', 'bus stand', 'bus station'],
+    'railway_station': ['railway', 'train station', 'rail'],
+    'school': ['school', 'vidyalaya', 'vidya'],
+    'college': ['college', 'university', 'institute', 'iit', 'nit'],
+    'hospital': ['hospital', 'medical', 'clinic', 'healthcare'],
+    'mall': ['mall', 'plaza', 'shopping'],
+    'office': ['office', 'corporate', 'tech park', 'business'],
+    'residential': ['apartment', 'residency', 'housing', 'colony'],
+    'temple': ['temple', 'mandir', 'church', 'mosque', 'gurudwara', 'masjid'],
+    'park': ['park', 'garden', 'ground'],
+    'atm': ['atm', 'bank'],
+    'bar': ['bar', 'pub', 'brewery'],
+    'restaurant': ['restaurant', 'dhaba', 'food', 'kitchen', 'cafe', 'diner'],
+    'hotel': ['hotel', 'lodge', 'guest house', 'inn', 'oyo', 'capital o'],
+}
+
+
+def detect_landmark_category(name: str) -> str:
+    """Detect category from landmark name."""
+    name_lower = name.lower()
+    for category, keywords in LANDMARK_CATEGORY_KEYWORDS.items():
+        if any(kw in name_lower for kw in keywords):
+            return category
+    return 'default'
+
+
+def parse_landmarks_from_text(landmark_text, business_type=''):
+    """
+    Parse landmark info from reverse geocode response.
+    Example inputs: 
+        "< 0.5km from Cafe Noir, < 0.5km from Farzi Cafe"
+        "~ 0.5km from SDH Danapur, ~ 0.5km from Pizza Corner"
+    
+    Returns:
+        tuple: (all_landmarks, competitors_only)
+    """
+    if not landmark_text:
+        return [], []
+    
+    all_landmarks = []
+    competitors = []
+    
+    # Business type keywords to identify competitors
+    competitor_keywords = {
+        'cafe': ['cafe', 'coffee', 'tea', 'bakery', 'starbucks', 'barista', 'roasters', 'brew', 'chai'],
+        'restaurant': ['restaurant', 'food', 'kitchen', 'dhaba', 'biryani', 'pizza', 'burger', 'diner', 'sweets', 'corner', 'hotel', 'eatery', 'cuisine', 'tandoor', 'grill', 'chinese', 'mughlai'],
+        'gym': ['gym', 'fitness', 'yoga', 'sports', 'crossfit', 'health club', 'workout'],
+        'pharmacy': ['pharmacy', 'medical', 'chemist', 'medicine', 'drugstore', 'pharma', 'medico'],
+        'salon': ['salon', 'spa', 'beauty', 'hair', 'parlour', 'parlor', 'unisex', 'barber'],
+        'retail': ['store', 'mart', 'shop', 'retail', 'boutique', 'emporium', 'showroom'],
+        'grocery': ['grocery', 'kirana', 'supermarket', 'mart', 'provision', 'general store'],
+    }
+    
+    # Parse each landmark mention
+    parts = landmark_text.split(',')
+    for part in parts:
+        part = part.strip()
+        # Extract distance and name - handle variations like:
+        # "< 0.5km from X", "~ 0.5km from X", "> 0.5km from X", "0.5km from X"
+        match = re.match(r'[<>~]?\s*([\d.]+)\s*km\s+from\s+(.+)', part, re.IGNORECASE)
+        if match:
+            distance_km = float(match.group(1))
+            name = match.group(2).strip()
+            
+            # Determine category based on name
+            category = 'landmark'
+            keywords = competitor_keywords.get(business_type, [])
+            is_competitor = any(kw in name.lower() for kw in keywords)
+            
+            if is_competitor:
+                category = business_type
+            
+            landmark = {
+                'name': name,
+                'distance': int(distance_km * 1000),  # Convert to meters
+                'category': category,
+                'is_competitor': is_competitor
+            }
+            
+            # Add to all landmarks list
+            all_landmarks.append(landmark)
+            
+            # Also track competitors separately
+            if is_competitor:
+                competitors.append(landmark)
+    
+    return all_landmarks, competitors
+
+
+def _validate_area(center_lat: float, center_lng: float, business_type: str, radius: int) -> Tuple[float, float]:
+    """
+    Validate the selected area and pick the point to analyze.
+    
+    Returns:
+        (lat, lng) of the analysis point - the center, a nearby land point,
+        or the snapped on-road location when it is close enough
+        
+    Raises:
+        ValidationError: If the area fails validation
+    """
+    lat, lng = center_lat, center_lng
+    
+    # === AREA-BASED VALIDATION ===
+    # Validate the entire radius area, not just the center point
+    # This allows analysis even when center is in water, if there's land nearby
+    print(f"\n🛡️ Running area-based validation (radius={radius}m)...")
+    is_valid, validation_result = validate_and_fetch_data(lat, lng, business_type, radius=radius)
+    
+    if not is_valid:
+        error_message = validation_result.get('message', 'Location validation failed')
+        error_type = validation_result.get('error_type', 'validation_error')
+        print(f"❌ Area validation failed: {error_message}")
+        raise ValidationError(error_message, error_type)
+    
+    # Use the analysis point (best land location found within radius)
+    # This could be the center if it was valid, or a nearby land point if center was in water
+    analysis_point = validation_result.get('analysis_point', {})
+    if analysis_point.get('lat') and analysis_point.get('lng'):
+        lat, lng = analysis_point['lat'], analysis_point['lng']
+        print(f"📍 Using analysis point: ({lat}, {lng})")
+    
+    # Also check for snapped location (on-road point)
+    snapped_location = validation_result.get('snapped_location', {})
+    if snapped_location.get('lat') and snapped_location.get('lng'):
+        snap_lat, snap_lng = snapped_location['lat'], snapped_location['lng']
+        
+        # Calculate distance between analysis point and snapped
+        R = 6371000  # Earth radius in meters
+        dlat = math.radians(snap_lat - lat)
+        dlng = math.radians(snap_lng - lng)
+        a = math.sin(dlat/2)**2 + math.cos(math.radians(lat)) * math.cos(math.radians(snap_lat)) * math.sin(dlng/2)**2
+        snap_distance = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+        
+        # Use snapped if it's close to analysis point (within 100m)
+        if snap_distance < 100:
+            lat, lng = snap_lat, snap_lng
+            print(f"📍 Using snapped location: ({lat}, {lng}) - {snap_distance:.1f}m from analysis point")
+    
+    print(f"✅ Area validation passed!")
+    print(f"   Center: ({center_lat}, {center_lng})")
+    print(f"   Analysis point: ({lat}, {lng})")
+    # === END VALIDATION ===
+    
+    return lat, lng
+
+
+def _sample_landmarks(
+    center_lat: float,
+    center_lng: float,
+    lat: float,
+    lng: float,
+    radius: int,
+    business_type: str
+) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """
+    Collect landmarks from the LatLong reverse geocode and Landmarks APIs.
+    
+    Returns:
+        Tuple of (address_info, parsed_landmarks, nearby_landmarks)
+    """
+    # Get reverse geocode for address info (includes landmark text)
+    # Use the analysis point for more accurate address
+    address_info = latlong_service.reverse_geocode(lat, lng)
+    
+    # Parse landmarks from reverse geocode landmark field
+    parsed_landmarks, _ = parse_landmarks_from_text(
+        address_info.get('landmark', ''), 
+        business_type
+    )
+    
+    # Get landmarks from multiple sample points to cover the full radius
+    # Sample points: center + 4 cardinal directions + 4 diagonal directions
+    sample_offsets = [
+        (0, 0),  # Center
+        (0.7, 0), (-0.7, 0), (0, 0.7), (0, -0.7),  # Cardinal directions at 70% radius
+        (0.5, 0.5), (-0.5, 0.5), (0.5, -0.5), (-0.5, -0.5),  # Diagonals at 50% radius
+    ]
+    
+    # Convert radius to lat/lng offsets - use original center for sampling
+    lat_offset_per_m = 1 / 111000  # ~1 degree per 111km
+    lng_offset_per_m = 1 / (111000 * math.cos(math.radians(center_lat)))
+    
+    nearby_landmarks = []
+    landmark_names_seen = set()
+    
+    # Use center_lat/center_lng for sampling to cover the whole selected area
+    for lat_mult, lng_mult in sample_offsets:
+        # Points beyond the center are optional when the request budget is low
+        if (lat_mult, lng_mult) != (0, 0) and not stage_allowed('landmark_samples'):
+            break
+        
+        sample_lat = center_lat + (lat_mult * radius * lat_offset_per_m)
+        sample_lng = center_lng + (lng_mult * radius * lng_offset_per_m)
+        
+        # Get landmarks at this sample point
+        sample_landmarks = latlong_service.get_landmarks(sample_lat, sample_lng)
+        
+        for lm in sample_landmarks:
+            lm_name = lm.get('name', '').lower()
+            if lm_name and lm_name not in landmark_names_seen:
+                landmark_names_seen.add(lm_name)
+                nearby_landmarks.append(lm)
+    
+    return address_info, parsed_landmarks, nearby_landmarks
+
+
+def _combine_landmarks(
+    center_lat: float,
+    center_lng: float,
+    radius: int,
+    parsed_landmarks: List[Dict],
+    nearby_landmarks: List[Dict]
+) -> List[Dict]:
+    """
+    Merge LatLong landmarks with OSM landmarks and LatLong POIs, deduplicated by name.
+    
+    Returns:
+        Combined landmark list with categories
+    """
+    # Fetch landmarks using places_service for better area coverage
+    osm_landmarks = fetch_landmarks(center_lat, center_lng, radius)
+    
+    # Also fetch landmarks from LatLong POI API for additional data
+    latlong_poi_categories = ['hospital', 'school', 'hotel', 'bank', 'atm', 'mall', 'restaurant']
+    latlong_pois = []
+    for poi_cat in latlong_poi_categories:
+        if not stage_allowed('latlong_pois'):
+            break
+        try:
+            poi_result = latlong_service.get_poi(center_lat, center_lng, poi_cat, radius)
+            for poi in poi_result.get('pois', []):
+                latlong_pois.append({
+                    'name': poi.get('name', ''),
+                    'category': poi_cat,
+                    'lat': poi.get('lat', center_lat),
+                    'lng': poi.get('lng', center_lng)
+                })
+        except Exception as e:
+            print(f"⚠️ Error fetching POI {poi_cat}: {e}")
+    
+    print(f"📍 Found {len(latlong_pois)} POIs from LatLong API")
+    
+    # Combine all landmarks - start with parsed landmarks
+    all_landmarks = []
+    existing_names = set()
+    
+    # Add parsed landmarks with detected categories
+    for lm in parsed_landmarks:
+        lm_name = lm.get('name', '')
+        if lm_name.lower() not in existing_names:
+            # Detect category from name
+            lm['category'] = detect_landmark_category(lm_name)
+            all_landmarks.append(lm)
+            existing_names.add(lm_name.lower())
+    
+    # Add landmarks from Landmarks API with detected categories
+    for lm in nearby_landmarks:
+        lm_name = lm.get('name', '')
+        if lm_name.lower() not in existing_names:
+            lm['category'] = detect_landmark_category(lm_name)
+            all_landmarks.append(lm)
+            existing_names.add(lm_name.lower())
+    
+    # Add landmarks from OpenStreetMap (for better area coverage)
+    for lm in osm_landmarks:
+        lm_name = lm.get('name', '')
+        if lm_name.lower() not in existing_names:
+            # Convert places_service format to expected format
+            all_landmarks.append({
+                'name': lm_name,
+                'lat': lm.get('lat'),
+                'lng': lm.get('lng'),
+                'category': lm.get('type', 'landmark')
+            })
+            existing_names.add(lm_name.lower())
+    
+    # Add landmarks from LatLong POI API
+    for poi in latlong_pois:
+        poi_name = poi.get('name', '')
+        if poi_name.lower() not in existing_names:
+            all_landmarks.append(poi)
+            existing_names.add(poi_name.lower())
+    
+    print(f"🏛️ Total landmarks combined: {len(all_landmarks)}")
+    return all_landmarks
+
+
+def _format_competitors(
+    osm_competitors: List[Dict],
+    center_lat: float,
+    center_lng: float,
+    business_type: str
+) -> List[Dict]:
+    """Format competitors with their distance from center, nearest first."""
+    all_competitors = []
+    for comp in osm_competitors:
+        # Calculate approximate distance in meters from center
+        R = 6371000  # Earth's radius in meters
+        lat1, lon1 = math.radians(center_lat), math.radians(center_lng)
+        lat2, lon2 = math.radians(comp.get('lat', center_lat)), math.radians(comp.get('lng', center_lng))
+        dlat, dlon = lat2 - lat1, lon2 - lon1
+        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+        distance = int(R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a)))
+        
+        all_competitors.append({
+            'name': comp.get('name', 'Unknown'),
+            'category': business_type,
+            'lat': comp.get('lat'),
+            'lng': comp.get('lng'),
+            'distance': distance,
+            'is_competitor': True
+        })
+    
+    # Sort competitors by distance
+    all_competitors.sort(key=lambda x: x.get('distance', 9999))
+    return all_competitors
+
+
+def _landmarks_data(all_landmarks: List[Dict]) -> Dict:
+    """Landmarks structure expected by analyze_location()."""
+    return {
+        'by_category': {'nearby': {'count': len(all_landmarks), 'pois': all_landmarks}},
+        'total_count': len(all_landmarks),
+        'all_pois': all_landmarks
+    }
+
+
+def _flag_partial(response: Dict) -> bool:
+    """
+    Record in a response whether the request budget cut any stage short.
+    
+    Returns:
+        True if the response is partial (and should not be cached)
+    """
+    budget = current_budget()
+    partial = bool(budget and budget.partial)
+    response['partial'] = partial
+    if partial:
+        response['budget'] = budget.summary()
+        print(f"⏱️ Returning partial results: {response['budget']}")
+    return partial
+
+
+def analysis_cache_key(
+    lat: float,
+    lng: float,
+    business_type: str,
+    radius: int,
+    scoring_mode: Optional[str] = None
+) -> tuple:
+    """Cache key for an analysis of the area centered at (lat, lng)."""
+    return (spatial_key(lat, lng), business_type, int(radius), resolve_scoring_mode(scoring_mode))
+
+
+def get_cached_analysis(
+    lat: float,
+    lng: float,
+    business_type: str,
+    radius: int,
+    scoring_mode: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Return a previously computed analysis for this area, if still cached.
+    
+    Args:
+        lat: Center latitude
+        lng: Center longitude
+        business_type: Type of business
+        radius: Analysis radius in meters
+        scoring_mode: Grid scoring mode (default: Config.GRID_SCORING_MODE)
+        
+    Returns:
+        A copy of the cached analysis response, or None
+    """
+    cached = _analysis_cache.get(analysis_cache_key(lat, lng, business_type, radius, scoring_mode))
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def cache_analysis(lat: float, lng: float, business_type: str, radius: int, response: Dict,
+                   ttl: Optional[float] = None) -> None:
+    """
+    Store an analysis response for the area centered at (lat, lng), under its
+    scoring mode, for ttl seconds (default: ANALYSIS_CACHE_TTL).
+    """
+    key = analysis_cache_key(lat, lng, business_type, radius, response.get('scoring_mode'))
+    _analysis_cache.set(key, copy.deepcopy(response), ttl)
+
+
+@with_poi_context
+@with_request_budget
+def run_analysis(
+    lat: float,
+    lng: float,
+    business_type: str,
+    radius: int,
+    filters: Optional[List[str]] = None,
+    use_cache: bool = True,
+    scoring_mode: Optional[str] = None
+) -> Dict:
+    """
+    Perform comprehensive location analysis including opportunity score.
+    Uses area-based validation to consider the entire radius, not just center.
+    Runs under a request budget (see utils.request_budget); optional stages
+    cut short by it make the response partial, and partial responses are
+    not cached.
+    
+    Args:
+        lat: Center latitude of the selected area
+        lng: Center longitude of the selected area
+        business_type: Type of business being analyzed
+        radius: Analysis radius in meters
+        filters: Proximity filters echoed back in the response
+        use_cache: Serve/store the result from the analysis cache
+        scoring_mode: Grid scoring mode for recommended spots, 'keyword' or
+                      'relevance' (default: Config.GRID_SCORING_MODE)
+        
+    Returns:
+        The /api/analyze response body
+        
+    Raises:
+        ValidationError: If the area fails validation
+        ValueError: For an unknown scoring mode
+    """
+    filters = filters or []
+    scoring_mode = resolve_scoring_mode(scoring_mode)
+    
+    if use_cache:
+        cached = get_cached_analysis(lat, lng, business_type, radius, scoring_mode)
+        if cached is not None:
+            print(f"♻️ Serving cached analysis for ({lat}, {lng}), {business_type}, {radius}m")
+            cached['filters_applied'] = filters
+            return cached
+    
+    # Store original center for reference
+    center_lat, center_lng = lat, lng
+    
+    lat, lng = _validate_area(center_lat, center_lng, business_type, radius)
+    
+    address_info, parsed_landmarks, nearby_landmarks = _sample_landmarks(center_lat, center_lng, lat, lng, radius, business_type)
+    
+    # Fetch competitors using the new places_service (covers entire radius from center)
+    print(f"🔎 Fetching competitors: category={business_type}, radius={radius}m from center")
+    osm_competitors = fetch_competitors(center_lat, center_lng, radius, business_type)
+    
+    all_landmarks = _combine_landmarks(center_lat, center_lng, radius, parsed_landmarks, nearby_landmarks)
+    all_competitors = _format_competitors(osm_competitors, center_lat, center_lng, business_type)
+    
+    # Get Digipin using analysis point for accurate pincode
+    digipin_info = latlong_service.get_digipin(lat, lng)
+    
+    # Build landmarks structure for analysis
+    landmarks_data = _landmarks_data(all_landmarks)
+    
+    # Build competitors structure
+    competitors_data = {
+        'count': len(all_competitors),
+        'nearby': all_competitors
+    }
+    
+    # Perform analysis
+    analysis_result = analyze_location(landmarks_data, competitors_data, business_type)
+    
+    # Find recommended spots for business setup (search from center of selected area)
+    print(f"🎯 Finding recommended spots in the area...")
+    recommended_spots = find_recommended_spots(
+        center_lat=center_lat,
+        center_lng=center_lng,
+        radius=radius,
+        competitors=all_competitors,
+        landmarks=all_landmarks,
+        max_spots=5,
+        business_type=business_type,
+        scoring_mode=scoring_mode
+    )
+    print(f"✅ Found {len(recommended_spots)} recommended spots")
+    
+    # Compile response - return ALL competitors for heatmap accuracy
+    response = {
+        'location': {
+            'lat': lat,  # Analysis point (best usable location found)
+            'lng': lng,
+            'center_lat': center_lat,  # Original selected center
+            'center_lng': center_lng,
+            'address': address_info,
+            'digipin': digipin_info.get('digipin', '')
+        },
+        'business_type': business_type,
+        'radius': radius,
+        'filters_applied': filters,
+        'recommended_spots': recommended_spots,  # NEW: Recommended business locations
+        'scoring_mode': scoring_mode,
+        'competitors': {
+            'count': len(all_competitors),
+            'nearby': all_competitors  # Return ALL competitors for heatmap
+        },
+        'landmarks': {
+            'total': len(all_landmarks),
+            'by_category': {'nearby': len(all_landmarks)},
+            'list': all_landmarks  # Return all landmarks
+        },
+        'footfall_proxy': 'high' if analysis_result['breakdown']['footfall_proxy'] > 60 else 'medium' if analysis_result['breakdown']['footfall_proxy'] > 30 else 'low'
+    }
+    
+    if not _flag_partial(response):
+        cache_analysis(center_lat, center_lng, business_type, radius, response)
+    
+    return response
+
+
+def comparable_business_types() -> List[str]:
+    """Business types that can be ranked by run_comparison()."""
+    return [bt for bt in RELEVANCE_MATRIX if bt != 'other']
+
+
+def resolve_comparison_types(business_types: Optional[List[str]] = None) -> List[str]:
+    """
+    Validate the business types to compare, defaulting to all of them.
+    
+    Raises:
+        ValueError: If a business type is not in RELEVANCE_MATRIX
+    """
+    if not business_types:
+        return comparable_business_types()
+    
+    types = [bt.lower() if isinstance(bt, str) else bt for bt in business_types]
+    unknown = [str(bt) for bt in types if not isinstance(bt, str) or bt not in RELEVANCE_MATRIX]
+    if unknown:
+        raise ValueError(f"Unknown business type(s): {', '.join(unknown)}")
+    return list(dict.fromkeys(types))
+
+
+@with_poi_context
+@with_request_budget
+def run_comparison(
+    lat: float,
+    lng: float,
+    radius: int,
+    business_types: Optional[List[str]] = None,
+    use_cache: bool = True
+) -> Dict:
+    """
+    Score several business types for the same area and rank them.
+    
+    Landmarks don't depend on the business type, so they are collected once.
+    Competitor categories for all types are fetched with a single Overpass
+    query that seeds the places cache, after which each type is scored
+    locally. The cost is roughly that of one /api/analyze call.
+    
+    Each type gets:
+        - opportunity_score: the /api/analyze formula
+        - landmark_relevance: mean RELEVANCE_MATRIX score of the landmarks
+        - fit_score: opportunity_score scaled by (0.5 + landmark_relevance),
+          so an area of default relevance (0.5) keeps its opportunity score
+        - best_spot: highest scoring grid cell (not road-checked)
+    
+    Args:
+        lat: Center latitude of the selected area
+        lng: Center longitude of the selected area
+        radius: Analysis radius in meters
+        business_types: Types to compare (default: all in RELEVANCE_MATRIX)
+        use_cache: Serve/store the result from the analysis cache
+        
+    Returns:
+        Comparison with types ranked by fit_score
+        
+    Raises:
+        ValidationError: If the area fails validation
+        ValueError: If a business type is not in RELEVANCE_MATRIX
+    """
+    types = resolve_comparison_types(business_types)
+    
+    scoring_mode = resolve_scoring_mode()
+    cache_key = ('compare', spatial_key(lat, lng), int(radius), tuple(sorted(types)), scoring_mode)
+    if use_cache:
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            print(f"♻️ Serving cached comparison for ({lat}, {lng}), {radius}m")
+            return copy.deepcopy(cached)
+    
+    center_lat, center_lng = lat, lng
+    
+    # None of the RELEVANCE_MATRIX types need the heavy-logistics road check,
+    # so one validation covers all of them
+    lat, lng = _validate_area(center_lat, center_lng, 'other', radius)
+    
+    address_info, parsed_landmarks, nearby_landmarks = _sample_landmarks(center_lat, center_lng, lat, lng, radius, '')
+    
+    # One union query for every competitor and landmark category
+    categories = list(LANDMARK_CATEGORIES)
+    for business_type in types:
+        categories.extend(competitor_categories(business_type))
+    prefetch_categories(center_lat, center_lng, radius, categories)
+    
+    all_landmarks = _combine_landmarks(center_lat, center_lng, radius, parsed_landmarks, nearby_landmarks)
+    landmarks_data = _landmarks_data(all_landmarks)
+    landmark_categories = [lm.get('category', '') for lm in all_landmarks]
+    
+    ranking = []
+    for business_type in types:
+        osm_competitors = fetch_competitors(center_lat, center_lng, radius, business_type)
+        all_competitors = _format_competitors(osm_competitors, center_lat, center_lng, business_type)
+        competitors_data = {'count': len(all_competitors), 'nearby': all_competitors}
+        
+        analysis_result = analyze_location(landmarks_data, competitors_data, business_type)
+        opportunity_score = analysis_result['opportunity_score']
+        
+        relevance = (
+            float(relevance_scores(business_type, landmark_categories).mean())
+            if all_landmarks else DEFAULT_RELEVANCE
+        )
+        fit_score = min(100, round(opportunity_score * (0.5 + relevance)))
+        
+        grid = calculate_grid_scores(
+            center_lat, center_lng, radius, all_competitors, all_landmarks, grid_size=12,
+            business_type=business_type, scoring_mode=scoring_mode
+        )
+        best_cell = grid[0] if grid else None
+        
+        ranking.append({
+            'business_type': business_type,
+            'fit_score': fit_score,
+            'opportunity_score': opportunity_score,
+            'landmark_relevance': round(relevance, 3),
+            'interpretation': get_score_interpretation(fit_score),
+            'breakdown': analysis_result['breakdown'],
+            'competitors': {
+                'count': len(all_competitors),
+                'nearest_distance': all_competitors[0]['distance'] if all_competitors else None
+            },
+            'best_spot': {
+                'lat': round(best_cell['lat'], 6),
+                'lng': round(best_cell['lng'], 6),
+                'score': best_cell['opportunity_score'],
+                'nearby_competitors': best_cell['nearby_competitors'],
+                'nearby_landmarks': best_cell['nearby_landmarks']
+            } if best_cell else None
+        })
+    
+    ranking.sort(key=lambda r: (r['fit_score'], r['opportunity_score'], r['landmark_relevance']), reverse=True)
+    for i, entry in enumerate(ranking, 1):
+        entry['rank'] = i
+    
+    print(f"🏆 Compared {len(ranking)} business types: best fit is {ranking[0]['business_type'] if ranking else 'n/a'}")
+    
+    response = {
+        'location': {
+            'lat': lat,
+            'lng': lng,
+            'center_lat': center_lat,
+            'center_lng': center_lng,
+            'address': address_info,
+            'digipin': latlong_service.get_digipin(lat, lng).get('digipin', '')
+        },
+        'radius': radius,
+        'landmarks': {'total': len(all_landmarks)},
+        'ranking': ranking
+    }
+    
+    if not _flag_partial(response):
+        _analysis_cache.set(cache_key, copy.deepcopy(response))
+    return response
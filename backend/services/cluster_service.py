@@ -0,0 +1,147 @@
+"""
+Hotspot IQ - Cluster Service
+Server-side marker clustering for an analysis area.
+
+The competitors and landmarks around an analysis center are loaded from the
+tile cache and indexed once per (area, business type); the map then asks for
+the clusters in view at its current zoom as the user pans, instead of
+receiving and rendering every marker.
+"""
+
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from services.cache_service import TTLCache, spatial_key
+from services.tile_cache import (
+    get_region_pois, missing_tile_count, region_categories, merge_competitors, merge_landmarks
+)
+from utils.cluster_index import ClusterIndex
+from utils.score_calculator import haversine_matrix
+from utils.tiles import padded_bounds
+
+
+# Marker layers that can be clustered
+CLUSTER_LAYERS = ('competitors', 'landmarks')
+
+# Cluster radius in pixels of a 512px tile (supercluster's defaults: 40-60)
+CLUSTER_RADIUS_PX = 60
+
+# Largest analysis radius that can be indexed (meters)
+MAX_CLUSTER_RADIUS = 5000
+
+# Cluster indexes keyed by (DIGIPIN of center, radius, business type)
+_index_cache = TTLCache('cluster_index', Config.TILE_CACHE_TTL, 256)
+
+
+def _within(places: List[Dict], lat: float, lng: float, radius: float) -> List[Dict]:
+    """Places within radius meters of a point."""
+    if not places:
+        return []
+    distances = haversine_matrix(
+        np.array([lat]), np.array([lng]),
+        np.array([p['lat'] for p in places]), np.array([p['lng'] for p in places])
+    )[0]
+    return [p for p, d in zip(places, distances.tolist()) if d <= radius]
+
+
+def get_cluster_indexes(
+    lat: float, lng: float, radius: int, business_type: str
+) -> Tuple[Dict[str, ClusterIndex], bool]:
+    """
+    Build (or fetch from cache) the cluster indexes of an analysis area.
+
+    Indexes built while some POI tiles failed to load are not cached.
+
+    Args:
+        lat: Center latitude
+        lng: Center longitude
+        radius: Area radius in meters
+        business_type: Business type whose competitors are clustered
+
+    Returns:
+        Tuple of (dict of layer name -> ClusterIndex, whether POI tiles
+        were missing)
+
+    Raises:
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    business_type = business_type.lower()
+    cache_key = (spatial_key(lat, lng), int(radius), business_type)
+    cached = _index_cache.get(cache_key)
+    if cached is not None:
+        return cached, False
+
+    started = time.time()
+    bounds = padded_bounds(lat, lng, radius)
+    by_category, missing = get_region_pois(
+        bounds['south'], bounds['west'], bounds['north'], bounds['east'],
+        region_categories(business_type)
+    )
+
+    competitors = [
+        {'name': c['name'], 'lat': c['lat'], 'lng': c['lng'], 'category': c['category']}
+        for c in _within(merge_competitors(by_category, business_type), lat, lng, radius)
+    ]
+    landmarks = _within(merge_landmarks(by_category), lat, lng, radius)
+
+    indexes = {
+        'competitors': ClusterIndex(competitors, radius=CLUSTER_RADIUS_PX),
+        'landmarks': ClusterIndex(landmarks, radius=CLUSTER_RADIUS_PX),
+    }
+    print(f"🧮 Built cluster index: {len(competitors)} competitors, {len(landmarks)} landmarks "
+          f"in {(time.time() - started) * 1000:.0f}ms")
+
+    if missing:
+        print(f"⚠️ Cluster index built with {missing_tile_count(missing)} POI tile(s) missing, not cached")
+    else:
+        _index_cache.set(cache_key, indexes)
+    return indexes, bool(missing)
+
+
+def get_clusters(
+    lat: float,
+    lng: float,
+    radius: int,
+    business_type: str,
+    zoom: float,
+    bbox: Optional[Dict[str, float]] = None,
+    layers: Optional[List[str]] = None
+) -> Dict:
+    """
+    Get the marker clusters of an analysis area visible at a zoom level.
+
+    Args:
+        lat: Analysis center latitude
+        lng: Analysis center longitude
+        radius: Analysis radius in meters
+        business_type: Type of business being analyzed
+        zoom: Map zoom level
+        bbox: Optional viewport (south, west, north, east)
+        layers: Layers to return (default: all of CLUSTER_LAYERS)
+
+    Returns:
+        Dict with zoom and, per layer, a list of clusters and points;
+        partial is set when some POI tiles could not be loaded
+
+    Raises:
+        ValueError: For an unknown layer or out-of-range radius/zoom
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    layers = layers or list(CLUSTER_LAYERS)
+    unknown = [layer for layer in layers if layer not in CLUSTER_LAYERS]
+    if unknown:
+        raise ValueError(f"Unknown layer(s): {', '.join(unknown)}")
+    if not 0 < radius <= MAX_CLUSTER_RADIUS:
+        raise ValueError(f"radius must be between 1 and {MAX_CLUSTER_RADIUS}m")
+    if not 0 <= zoom <= 22:
+        raise ValueError("zoom must be between 0 and 22")
+
+    indexes, partial = get_cluster_indexes(lat, lng, radius, business_type)
+
+    result = {'zoom': zoom}
+    for layer in layers:
+        result[layer] = indexes[layer].get_clusters(zoom, bbox)
+    if partial:
+        result['partial'] = True
+    return result
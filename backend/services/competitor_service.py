@@ -5,6 +5,7 @@ Uses OpenStreetMap Overpass API via overpy to count competitors near a location.
 
 import overpy
 from typing import Dict, List, Optional
+from utils.request_budget import overpass_query
 
 
 # Map business categories to OpenStreetMap tags
@@ -176,7 +177,7 @@ def get_competitor_count(lat: float, lng: float, radius: int, category: str) ->
         api = overpy.Overpass()
         
         # Execute query with timeout
-        result = api.query(query)
+        result = api.query(overpass_query(query))
         
         # Count all results (nodes + ways + relations)
         count = len(result.nodes) + len(result.ways) + len(result.relations)
@@ -228,7 +229,7 @@ def get_competitors_detailed(lat: float, lng: float, radius: int, category: str)
     
     try:
         api = overpy.Overpass()
-        result = api.query(query)
+        result = api.query(overpass_query(query))
         
         competitors = []
         
@@ -315,7 +316,7 @@ def get_landmarks_from_osm(lat: float, lng: float, radius: int) -> List[Dict]:
         
         try:
             api = overpy.Overpass()
-            result = api.query(query)
+            result = api.query(overpass_query(query))
             
             # Process nodes
             for node in result.nodes:
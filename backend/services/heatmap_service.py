@@ -0,0 +1,213 @@
+"""
+Hotspot IQ - Heatmap Service
+Server-side competitor density rasters for map tiles.
+
+Each z/x/y tile is rendered as a Gaussian kernel density estimate of the
+competitors around it. The kernel is separable, so the whole raster is one
+(rows x competitors) @ (competitors x cols) matrix product. Densities are
+quantized to uint8 on a fixed scale (Config.HEATMAP_MAX_DENSITY), so
+neighbouring tiles match at their edges and payloads don't grow with the
+number of competitors. Rasters drawn while some POI tiles failed to load
+are marked partial and not cached.
+"""
+
+import base64
+import hashlib
+import math
+import numpy as np
+from typing import Dict, Tuple
+from config import Config
+from services.cache_service import TTLCache
+from services.places_service import competitor_categories
+from services.tile_cache import get_tiles_places, merge_competitors
+from utils.png import encode_png
+from utils.tiles import tile_bounds, tile_pixel_centers, tiles_covering, METERS_PER_DEGREE
+
+
+# Zoom range served (below the minimum a tile spans too many POI tiles)
+HEATMAP_MIN_ZOOM = 11
+HEATMAP_MAX_ZOOM = 19
+
+# Allowed raster sizes in pixels
+HEATMAP_SIZES = (64, 128, 256)
+
+# Kernel support in bandwidths - contributions beyond this are negligible
+KERNEL_CUTOFF = 3
+
+# Rendered rasters keyed by (z, x, y, business type, size, bandwidth, max density)
+_heatmap_cache = TTLCache('heatmap', Config.TILE_CACHE_TTL, Config.HEATMAP_CACHE_MAX_ENTRIES)
+
+
+def _heat_color(intensity: float) -> Tuple[int, int, int, int]:
+    """Green -> yellow -> orange -> red ramp, matching the map's HeatmapOverlay."""
+    if intensity < 0.25:
+        t = intensity / 0.25
+        r, g, b, a = 34 + t * 100, 197 - t * 50, 94 - t * 50, 0.3 + t * 0.1
+    elif intensity < 0.5:
+        t = (intensity - 0.25) / 0.25
+        r, g, b, a = 134 + t * 121, 147 + t * 53, 44 - t * 44, 0.4 + t * 0.1
+    elif intensity < 0.75:
+        t = (intensity - 0.5) / 0.25
+        r, g, b, a = 255, 200 - t * 100, 0, 0.5 + t * 0.1
+    else:
+        t = (intensity - 0.75) / 0.25
+        r, g, b, a = 255, 100 - t * 60, t * 50, 0.6 + t * 0.15
+    return round(r), round(g), round(b), round(a * 255)
+
+
+# Quantized value -> RGBA (value 0 stays fully transparent)
+HEAT_PALETTE = np.array([(0, 0, 0, 0)] + [_heat_color(v / 255) for v in range(1, 256)], dtype=np.uint8)
+
+
+def validate_tile(z: int, x: int, y: int) -> None:
+    """
+    Raises:
+        ValueError: If the tile is outside the served range
+    """
+    if not HEATMAP_MIN_ZOOM <= z <= HEATMAP_MAX_ZOOM:
+        raise ValueError(f"Zoom must be between {HEATMAP_MIN_ZOOM} and {HEATMAP_MAX_ZOOM}")
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError("Tile coordinates out of range")
+
+
+def density_raster(
+    z: int,
+    x: int,
+    y: int,
+    business_type: str,
+    size: int = 256,
+    bandwidth: float = None
+) -> Tuple[np.ndarray, int, bool]:
+    """
+    Compute the competitor density of a tile in competitors per km².
+
+    Args:
+        z, x, y: Tile coordinates
+        business_type: Business type whose competitors are counted
+        size: Raster width/height in pixels
+        bandwidth: Gaussian kernel bandwidth in meters
+
+    Returns:
+        Tuple of (float64 array of shape (size, size), north row first;
+        number of competitors that contributed; whether POI tiles under the
+        kernel support failed to load)
+    """
+    bandwidth = bandwidth or Config.HEATMAP_BANDWIDTH
+    bounds = tile_bounds(x, y, z)
+    center_lat = (bounds['south'] + bounds['north']) / 2
+
+    # Competitors within the kernel support around the tile
+    lat_pad = KERNEL_CUTOFF * bandwidth / METERS_PER_DEGREE
+    lng_pad = KERNEL_CUTOFF * bandwidth / (METERS_PER_DEGREE * math.cos(math.radians(center_lat)))
+    south, north = bounds['south'] - lat_pad, bounds['north'] + lat_pad
+    west, east = bounds['west'] - lng_pad, bounds['east'] + lng_pad
+
+    data_tiles = tiles_covering(south, west, north, east, Config.TILE_ZOOM)
+    by_category, missing = get_tiles_places(data_tiles, competitor_categories(business_type))
+    competitors = [
+        c for c in merge_competitors(by_category, business_type)
+        if south <= c['lat'] <= north and west <= c['lng'] <= east
+    ]
+
+    if not competitors:
+        return np.zeros((size, size)), 0, bool(missing)
+
+    pixel_lats, pixel_lngs = tile_pixel_centers(x, y, z, size)
+    comp_lats = np.array([c['lat'] for c in competitors])
+    comp_lngs = np.array([c['lng'] for c in competitors])
+
+    # Separable Gaussian: exp(-(dx² + dy²) / 2h²) = exp(-dy² / 2h²) * exp(-dx² / 2h²)
+    meters_per_lng = METERS_PER_DEGREE * math.cos(math.radians(center_lat))
+    dy = (pixel_lats[:, None] - comp_lats[None, :]) * METERS_PER_DEGREE
+    dx = (comp_lngs[:, None] - pixel_lngs[None, :]) * meters_per_lng
+    rows = np.exp(-0.5 * (dy / bandwidth) ** 2)
+    cols = np.exp(-0.5 * (dx / bandwidth) ** 2)
+
+    # Kernel integrates to 1 per competitor; scale m⁻² to km⁻²
+    density = (rows @ cols) * (1e6 / (2 * math.pi * bandwidth ** 2))
+    return density, len(competitors), bool(missing)
+
+
+def quantize(density: np.ndarray, max_density: float) -> np.ndarray:
+    """Map densities onto 0-255 with max_density as full scale."""
+    return np.clip(np.rint(density / max_density * 255), 0, 255).astype(np.uint8)
+
+
+def get_heatmap_tile(
+    z: int,
+    x: int,
+    y: int,
+    business_type: str,
+    fmt: str = 'json',
+    size: int = 256,
+    bandwidth: float = None,
+    max_density: float = None
+) -> Dict:
+    """
+    Render (or fetch from cache) a heatmap tile.
+
+    Args:
+        z, x, y: Tile coordinates
+        business_type: Business type whose competitors are counted
+        fmt: 'json' (base64 uint8 array) or 'png' (colored RGBA image)
+        size: Raster width/height in pixels (64, 128 or 256)
+        bandwidth: Kernel bandwidth in meters
+        max_density: Density (competitors/km²) mapped to 255
+
+    Returns:
+        Dict with 'body' (dict for json, bytes for png), 'etag', 'mimetype'
+        and 'partial' (some POI tiles failed to load; such tiles aren't cached)
+
+    Raises:
+        ValueError: For invalid tile, size or format
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    validate_tile(z, x, y)
+    if size not in HEATMAP_SIZES:
+        raise ValueError(f"size must be one of {HEATMAP_SIZES}")
+    if fmt not in ('json', 'png'):
+        raise ValueError("format must be 'json' or 'png'")
+
+    business_type = business_type.lower()
+    bandwidth = float(bandwidth or Config.HEATMAP_BANDWIDTH)
+    max_density = float(max_density or Config.HEATMAP_MAX_DENSITY)
+    if not 25 <= bandwidth <= 2000 or max_density <= 0:
+        raise ValueError("bandwidth must be 25-2000m and max_density positive")
+
+    cache_key = (z, x, y, business_type, size, bandwidth, max_density, fmt)
+    cached = _heatmap_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    density, competitor_count, partial = density_raster(z, x, y, business_type, size, bandwidth)
+    values = quantize(density, max_density)
+
+    if fmt == 'png':
+        body = encode_png(HEAT_PALETTE[values])
+        etag = hashlib.sha1(body).hexdigest()
+        mimetype = 'image/png'
+    else:
+        raw = values.tobytes()
+        etag = hashlib.sha1(raw).hexdigest()
+        body = {
+            'z': z,
+            'x': x,
+            'y': y,
+            'business_type': business_type,
+            'bounds': tile_bounds(x, y, z),
+            'width': size,
+            'height': size,
+            'encoding': 'uint8/base64',
+            'scale': {'max_density_per_km2': max_density, 'bandwidth_m': bandwidth},
+            'competitors': competitor_count,
+            'max_value': int(values.max()),
+            'data': base64.b64encode(raw).decode('ascii'),
+        }
+        if partial:
+            body['partial'] = True
+        mimetype = 'application/json'
+
+    tile = {'body': body, 'etag': etag, 'mimetype': mimetype, 'partial': partial}
+    if not partial:
+        _heatmap_cache.set(cache_key, tile)
+    return tile
@@ -0,0 +1,252 @@
+"""
+Hotspot IQ - Hex Grid Service
+Opportunity scores and POI aggregates on the global hexagonal grid.
+
+Each cell is scored at its center from tile-cached POIs padded by
+LANDMARK_PROXIMITY (see scoring_service), so a cell's result does not depend
+on which request asked for it. Results are cached per (cell, business type,
+scoring mode) and reused by every overlapping area; only cells missing from
+the cache are scored. Cells whose padded POI tiles did not all load are
+returned but not cached. Cells can be rolled up to any coarser resolution.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Set, Tuple
+from config import Config
+from services.cache_service import TTLCache
+from services.scoring_service import load_region, point_tiles
+from services.tile_cache import missing_tile_count
+from utils.hexgrid import (
+    cells_in_radius, cells_to_lat_lng, cells_to_parents, lat_lng_to_cells,
+    cell_boundary, cell_edge_meters, cell_area_m2, cell_resolution, cell_to_string, string_to_cell
+)
+from utils.score_calculator import score_points, point_score_records, get_spot_rating, resolve_scoring_mode
+
+
+# Finest and coarsest resolutions that can be scored. Coarser cells are
+# wider than the POI padding around their centers, so their aggregates
+# would miss places; get them with rollup instead.
+MIN_HEX_RESOLUTION = 8
+MAX_HEX_RESOLUTION = 12
+
+# Cell results keyed by (cell id, business type, scoring mode)
+_hex_cache = TTLCache('hex_cells', Config.TILE_CACHE_TTL, Config.HEX_CACHE_MAX_ENTRIES)
+
+
+def score_cells(
+    cells: np.ndarray, business_type: str, scoring_mode: str
+) -> Tuple[List[Dict], List[bool], Set[Tuple[int, int, str]]]:
+    """
+    Score cells at their centers and count the POIs inside them.
+
+    Args:
+        cells: Cell ids, all at one resolution
+        business_type: Type of business being analyzed
+        scoring_mode: Resolved scoring mode
+
+    Returns:
+        Tuple of (cell results in input order, whether every POI tile
+        around each cell loaded, missing (x, y, category) tile pairs)
+
+    Raises:
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    resolution = cell_resolution(int(cells[0]))
+    lats, lngs = cells_to_lat_lng(cells)
+    points = [{'lat': lat, 'lng': lng} for lat, lng in zip(lats.tolist(), lngs.tolist())]
+    competitors, landmarks, missing = load_region(points, business_type)
+
+    missing_tiles = {(x, y) for x, y, _ in missing}
+    complete = [
+        not missing_tiles or missing_tiles.isdisjoint(point_tiles(point['lat'], point['lng']))
+        for point in points
+    ]
+
+    scores = score_points(lats, lngs, competitors, landmarks, business_type=business_type, scoring_mode=scoring_mode)
+    records = point_score_records(lats, lngs, scores, landmarks)
+
+    # POIs inside each cell
+    competitor_counts: Dict[int, int] = {}
+    if competitors:
+        poi_cells = lat_lng_to_cells([c['lat'] for c in competitors], [c['lng'] for c in competitors], resolution)
+        for cell in poi_cells.tolist():
+            competitor_counts[cell] = competitor_counts.get(cell, 0) + 1
+
+    landmark_counts: Dict[int, Dict[str, int]] = {}
+    if landmarks:
+        poi_cells = lat_lng_to_cells([lm['lat'] for lm in landmarks], [lm['lng'] for lm in landmarks], resolution)
+        for cell, landmark in zip(poi_cells.tolist(), landmarks):
+            counts = landmark_counts.setdefault(cell, {})
+            counts[landmark['category']] = counts.get(landmark['category'], 0) + 1
+
+    results = []
+    for cell, record in zip(cells.tolist(), records):
+        rating, rating_color = get_spot_rating(record['opportunity_score'])
+        results.append({
+            'cell': cell_to_string(cell),
+            'resolution': resolution,
+            **record,
+            'rating': rating,
+            'rating_color': rating_color,
+            'competitors': competitor_counts.get(cell, 0),
+            'landmarks': landmark_counts.get(cell, {}),
+        })
+    return results, complete, missing
+
+
+def rollup_cells(cells: List[Dict], resolution: int) -> List[Dict]:
+    """
+    Aggregate cell results into their ancestors at a coarser resolution.
+
+    Args:
+        cells: Cell results from get_hex_grid(), all at one resolution
+        resolution: Target resolution
+
+    Returns:
+        Parent cells with mean/max opportunity, best child, summed POI
+        counts and coverage (share of the parent's children present),
+        sorted by mean opportunity
+    """
+    if not cells:
+        return []
+
+    ids = np.array([string_to_cell(c['cell']) for c in cells], dtype=np.int64)
+    parents = cells_to_parents(ids, resolution).tolist()
+    children_per_parent = 7 ** (cells[0]['resolution'] - resolution)
+
+    groups: Dict[int, List[Dict]] = {}
+    for parent, cell in zip(parents, cells):
+        groups.setdefault(parent, []).append(cell)
+
+    parent_ids = list(groups)
+    lats, lngs = cells_to_lat_lng(parent_ids)
+
+    rolled = []
+    for parent, lat, lng in zip(parent_ids, lats.tolist(), lngs.tolist()):
+        children = groups[parent]
+        best = max(children, key=lambda c: c['opportunity_score'])
+        landmarks: Dict[str, int] = {}
+        for child in children:
+            for category, count in child['landmarks'].items():
+                landmarks[category] = landmarks.get(category, 0) + count
+
+        rolled.append({
+            'cell': cell_to_string(parent),
+            'resolution': resolution,
+            'lat': lat,
+            'lng': lng,
+            'opportunity_score': round(sum(c['opportunity_score'] for c in children) / len(children), 1),
+            'max_opportunity_score': best['opportunity_score'],
+            'best_cell': best['cell'],
+            'children': len(children),
+            'coverage': round(len(children) / children_per_parent, 3),
+            'competitors': sum(c['competitors'] for c in children),
+            'landmarks': landmarks,
+        })
+
+    rolled.sort(key=lambda x: x['opportunity_score'], reverse=True)
+    return rolled
+
+
+def get_hex_grid(
+    lat: float,
+    lng: float,
+    radius: float,
+    business_type: str,
+    resolution: Optional[int] = None,
+    scoring_mode: Optional[str] = None,
+    rollup: Optional[int] = None,
+    boundary: bool = False
+) -> Dict:
+    """
+    Score the hexagonal cells of an area, reusing cached cells.
+
+    Args:
+        lat: Center latitude
+        lng: Center longitude
+        radius: Area radius in meters
+        business_type: Type of business being analyzed
+        resolution: Cell resolution (default: Config.HEX_RESOLUTION)
+        scoring_mode: 'keyword' or 'relevance' (default: Config.GRID_SCORING_MODE)
+        rollup: Optional coarser resolution to aggregate the cells into
+        boundary: Include each cell's corners
+
+    Returns:
+        Dict with cells sorted by opportunity, cache hit count and the
+        optional rollup; partial and missing_tiles are set when some POI
+        tiles could not be loaded
+
+    Raises:
+        ValueError: For an out-of-range resolution, rollup, radius or cell count
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    business_type = business_type.lower()
+    resolution = Config.HEX_RESOLUTION if resolution is None else resolution
+    mode = resolve_scoring_mode(scoring_mode)
+
+    if not MIN_HEX_RESOLUTION <= resolution <= MAX_HEX_RESOLUTION:
+        raise ValueError(f"resolution must be between {MIN_HEX_RESOLUTION} and {MAX_HEX_RESOLUTION}")
+    if rollup is not None and not 0 <= rollup < resolution:
+        raise ValueError("rollup must be a coarser resolution than resolution")
+    if radius <= 0:
+        raise ValueError("radius must be positive")
+
+    estimate = math.pi * radius ** 2 / cell_area_m2(resolution, lat)
+    if estimate > Config.MAX_HEX_CELLS:
+        raise ValueError(
+            f"About {int(estimate)} cells at resolution {resolution}; "
+            f"use a coarser resolution or a radius covering at most {Config.MAX_HEX_CELLS} cells"
+        )
+
+    cells = cells_in_radius(lat, lng, radius, resolution)
+    results: Dict[int, Dict] = {}
+    missing = []
+    for cell in cells.tolist():
+        cached = _hex_cache.get((cell, business_type, mode))
+        if cached is not None:
+            results[cell] = cached
+        else:
+            missing.append(cell)
+
+    print(f"⬡ Hex grid: {len(cells)} cell(s) at resolution {resolution}, {len(cells) - len(missing)} cached")
+
+    missing_pairs = set()
+    if missing:
+        scored, complete, missing_pairs = score_cells(np.array(missing, dtype=np.int64), business_type, mode)
+        for cell, result, cacheable in zip(missing, scored, complete):
+            # Cells scored against missing POI tiles are recomputed next time
+            if cacheable:
+                _hex_cache.set((cell, business_type, mode), result)
+            results[cell] = result
+
+    cell_results = sorted(results.values(), key=lambda x: x['opportunity_score'], reverse=True)
+    if boundary:
+        cell_results = [
+            {**result, 'boundary': [[round(a, 6), round(b, 6)] for a, b in cell_boundary(string_to_cell(result['cell']))]}
+            for result in cell_results
+        ]
+
+    response = {
+        'business_type': business_type,
+        'scoring_mode': mode,
+        'resolution': resolution,
+        'cell_edge_m': round(cell_edge_meters(resolution, lat), 1),
+        'count': len(cell_results),
+        'cached': len(cells) - len(missing),
+        'cells': cell_results,
+    }
+    if missing_pairs:
+        response['partial'] = True
+        response['missing_tiles'] = missing_tile_count(missing_pairs)
+    if rollup is not None:
+        response['rollup'] = {
+            'resolution': rollup,
+            'cells': rollup_cells(cell_results, rollup),
+        }
+    return response
+
+
+def hex_cache_stats() -> Dict:
+    """Size and hit/miss counters of the hex cell cache."""
+    return _hex_cache.stats()
@@ -15,6 +15,14 @@ Response Format (all endpoints):
 import requests
 from typing import List, Dict, Any, Optional
 from config import Config, COMPETITOR_MAPPING, FILTER_POI_MAPPING
+from utils import digipin
+from services.cache_service import TTLCache, spatial_key
+from utils.request_budget import upstream_timeout, BudgetExhausted
+
+
+# LatLong POI/landmark responses don't depend on the analysis radius, so they
+# are cached per point (DIGIPIN) and reused across radii
+_latlong_cache = TTLCache('latlong', Config.POI_CACHE_TTL, Config.POI_CACHE_MAX_ENTRIES)
 
 
 class LatLongService:
@@ -35,10 +43,11 @@ class LatLongService:
         url = f"{self.base_url}/{endpoint}.json"
         
         try:
+            timeout = upstream_timeout('latlong', 30)
             if method == 'GET':
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                response = requests.get(url, headers=self.headers, params=params, timeout=timeout)
             else:
-                response = requests.post(url, headers=self.headers, json=json_data, timeout=30)
+                response = requests.post(url, headers=self.headers, json=json_data, timeout=timeout)
             
             response.raise_for_status()
             
@@ -62,6 +71,9 @@ class LatLongService:
         except requests.exceptions.RequestException as e:
             print(f"LatLong API Error: {str(e)}")
             return {'success': False, 'error': str(e)}
+        except BudgetExhausted as e:
+            print(f"LatLong API skipped: {str(e)}")
+            return {'success': False, 'error': str(e)}
     
     # Major areas database for Indian cities
     MAJOR_AREAS = {
@@ -144,6 +156,42 @@ class LatLongService:
         ],
     }
     
+    @staticmethod
+    def _city_display(city: str) -> str:
+        """Display name for a MAJOR_AREAS city key."""
+        if city == 'bengaluru':
+            return 'Bengaluru'
+        return city.title()
+    
+    def iter_major_areas(self) -> List[Dict]:
+        """
+        List the curated major areas (alias cities and duplicates removed).
+        
+        Returns:
+            List of dicts with city, area and the display name used by autocomplete
+        """
+        areas = []
+        seen = set()
+        
+        for city, city_areas in self.MAJOR_AREAS.items():
+            # Skip alias entries (like 'bangalore' which duplicates 'bengaluru')
+            if city == 'bangalore':
+                continue
+            
+            for area in city_areas:
+                area_key = f"{area.lower()}_{city}"
+                if area_key in seen:
+                    continue
+                seen.add(area_key)
+                
+                areas.append({
+                    'city': city,
+                    'area': area,
+                    'name': f"{area}, {self._city_display(city)}"
+                })
+        
+        return areas
+    
     def autocomplete(self, query: str, lat: float = None, lng: float = None, limit: int = 10) -> List[Dict]:
         """
         Get location suggestions for autocomplete - prioritizes major areas.
@@ -174,9 +222,7 @@ class LatLongService:
                 area_lower = area.lower()
                 if area_lower.startswith(query_lower) or query_lower in area_lower:
                     # Determine city name for display
-                    city_display = city.title()
-                    if city == 'bengaluru':
-                        city_display = 'Bengaluru'
+                    city_display = self._city_display(city)
                     
                     # Create unique key to avoid duplicates
                     area_key = f"{area_lower}_{city}"
@@ -423,7 +469,7 @@ class LatLongService:
                 'User-Agent': 'HotspotIQ/1.0 (contact@hotspotiq.com)'  # Required by Nominatim
             }
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = requests.get(url, params=params, headers=headers, timeout=upstream_timeout('nominatim', 10))
             response.raise_for_status()
             data = response.json()
             
@@ -655,6 +701,11 @@ class LatLongService:
         Returns:
             Dict with count and list of nearby POIs
         """
+        cache_key = ('poi', spatial_key(lat, lng), category)
+        cached = _latlong_cache.get(cache_key)
+        if cached is not None:
+            return {'count': cached['count'], 'pois': [dict(poi) for poi in cached['pois']]}
+        
         params = {
             'latitude': lat,
             'longitude': lng,
@@ -680,9 +731,11 @@ class LatLongService:
                     'distance': 0
                 })
         
+        _latlong_cache.set(cache_key, {'count': len(pois), 'pois': pois})
+        
         return {
             'count': len(pois),
-            'pois': pois
+            'pois': [dict(poi) for poi in pois]
         }
     
     def get_landmarks(self, lat: float, lng: float) -> List[Dict]:
@@ -699,6 +752,11 @@ class LatLongService:
         Returns:
             List of landmarks with name, coordinates
         """
+        cache_key = ('landmarks', spatial_key(lat, lng))
+        cached = _latlong_cache.get(cache_key)
+        if cached is not None:
+            return [dict(landmark) for landmark in cached]
+        
         params = {
             'lat': lat,
             'lon': lng
@@ -722,7 +780,9 @@ class LatLongService:
                     'category': 'landmark'  # Default category
                 })
         
-        return landmarks
+        _latlong_cache.set(cache_key, landmarks)
+        
+        return [dict(landmark) for landmark in landmarks]
     
     def get_competitors(self, lat: float, lng: float, business_type: str, radius: int = 1000) -> Dict:
         """
@@ -921,8 +981,9 @@ class LatLongService:
         """
         Get Digipin (Digital Address Code) for a location.
         
-        Note: DIGIPIN API may not be available. We generate a placeholder
-        based on coordinates that resembles India Post's DIGIPIN format.
+        Computed locally using India Post's DIGIPIN grid encoding, so the
+        same point always yields the same code on every worker. This makes
+        the code usable as a stable spatial key for caching and sharding.
         
         Args:
             lat: Latitude
@@ -931,35 +992,14 @@ class LatLongService:
         Returns:
             Dict with digipin code and formatted address
         """
-        # Generate a pseudo-DIGIPIN based on coordinates
-        # Real DIGIPIN would come from India Post service
-        # Format: XX-YYYY where XX is state code approximation, YYYY is area code
-        
-        # Approximate state from coordinates
-        state_codes = {
-            'KA': (12.0, 15.5, 74.0, 78.5),  # Karnataka
-            'MH': (15.5, 22.0, 72.0, 80.5),  # Maharashtra  
-            'TN': (8.0, 13.5, 76.0, 80.5),   # Tamil Nadu
-            'DL': (28.0, 29.0, 76.5, 77.5),  # Delhi
-            'UP': (23.5, 30.5, 77.0, 84.5),  # Uttar Pradesh
-            'WB': (21.5, 27.5, 85.5, 89.5),  # West Bengal
-            'BR': (24.0, 27.5, 83.0, 88.5),  # Bihar
-            'GJ': (20.0, 24.5, 68.0, 74.5),  # Gujarat
-            'RJ': (23.0, 30.0, 69.5, 78.0),  # Rajasthan
-            'KL': (8.0, 12.8, 74.5, 77.5),   # Kerala
-        }
-        
-        state_code = 'XX'
-        for code, (lat_min, lat_max, lng_min, lng_max) in state_codes.items():
-            if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
-                state_code = code
-                break
-        
-        # Generate area code from coordinates
-        area_code = abs(hash((round(lat, 4), round(lng, 4)))) % 10000
+        try:
+            code = digipin.encode(lat, lng)
+        except ValueError:
+            # Outside India's DIGIPIN bounding box
+            code = ''
         
         return {
-            'digipin': f'{state_code}-{area_code:04d}',
+            'digipin': code,
             'formatted_address': f'{lat:.6f}, {lng:.6f}'
         }
     
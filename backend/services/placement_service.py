@@ -0,0 +1,161 @@
+"""
+Hotspot IQ - Placement Service
+Chooses where a chain should open k new sites in a region.
+
+The region is scored cell by cell like a sweep. Each cell's footfall,
+shared with the competitors already around it, is the demand to capture;
+every scored cell is a candidate site. utils.placement then picks sites
+with lazy greedy maximum coverage, so new sites are spread to cover
+distinct demand instead of stacking on the single best street, and demand
+already served by the chain's existing sites is not counted again.
+"""
+
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from services.cache_service import spatial_key
+from services.sweep_service import score_region, DEFAULT_CELL_SIZE
+from services.tile_cache import missing_tile_count
+from utils.placement import coverage_matrix, covered_by, lazy_greedy
+from utils.score_calculator import get_spot_rating
+
+
+# Catchment radius limits in meters
+DEFAULT_SERVICE_RADIUS = 800
+MIN_SERVICE_RADIUS = 100
+MAX_SERVICE_RADIUS = 5000
+
+
+def demand_weights(records: List[Dict]) -> np.ndarray:
+    """
+    Demand a new site can win in each cell.
+
+    Footfall is split evenly between the new site and the competitors
+    already within COMPETITOR_PROXIMITY of the cell.
+    """
+    footfall = np.array([r['footfall_score'] for r in records], dtype=np.float64)
+    competitors = np.array([r['nearby_competitors'] for r in records], dtype=np.float64)
+    return footfall / (1 + competitors)
+
+
+def optimize_placement(
+    business_type: str,
+    bounds: Dict[str, float],
+    rings: Optional[List[List[Tuple[float, float]]]] = None,
+    k: int = 5,
+    service_radius: float = DEFAULT_SERVICE_RADIUS,
+    cell_size: float = DEFAULT_CELL_SIZE,
+    existing: Optional[List[Dict]] = None
+) -> Dict:
+    """
+    Pick k sites in a region maximizing covered demand.
+
+    Args:
+        business_type: Type of business being placed
+        bounds: Region bounding box (south, west, north, east)
+        rings: Optional polygon rings; cells outside are skipped
+        k: Number of new sites
+        service_radius: Catchment radius of a site in meters
+        cell_size: Spacing between cell centers in meters
+        existing: The chain's current sites ({lat, lng}); their coverage
+            counts as already captured
+
+    Returns:
+        Dict with ranked sites (captured, standalone and cannibalized
+        demand), coverage totals and optimizer statistics; partial and
+        missing_tiles are set when some POI tiles could not be loaded
+
+    Raises:
+        ValueError: For out-of-range parameters or too large a region
+        TilesUnavailable: If no tile could be loaded at all
+    """
+    if not 1 <= k <= Config.MAX_PLACEMENT_SITES:
+        raise ValueError(f"k must be between 1 and {Config.MAX_PLACEMENT_SITES}")
+    if not MIN_SERVICE_RADIUS <= service_radius <= MAX_SERVICE_RADIUS:
+        raise ValueError(f"service_radius must be between {MIN_SERVICE_RADIUS} and {MAX_SERVICE_RADIUS}m")
+
+    started = time.time()
+    region = score_region(business_type, bounds, rings, cell_size, max_cells=Config.MAX_PLACEMENT_CELLS)
+    records = region['records']
+
+    lats = np.array([r['lat'] for r in records])
+    lngs = np.array([r['lng'] for r in records])
+    weights = demand_weights(records)
+
+    # Best cells first, so the candidate cap keeps the most promising ones
+    ranked = np.argsort([-r['opportunity_score'] for r in records], kind='stable')
+    candidates = ranked[:Config.MAX_PLACEMENT_CANDIDATES]
+
+    optimize_started = time.time()
+    indptr, indices, data = coverage_matrix(lats[candidates], lngs[candidates], lats, lngs, service_radius)
+
+    covered = None
+    if existing:
+        covered = covered_by(
+            *coverage_matrix(
+                [site['lat'] for site in existing], [site['lng'] for site in existing],
+                lats, lngs, service_radius
+            ),
+            n_demand=lats.size
+        )
+    existing_demand = float((weights * covered).sum()) if covered is not None else 0.0
+
+    result = lazy_greedy(indptr, indices, data, weights, k, covered)
+    optimize_seconds = time.time() - optimize_started
+
+    total_demand = float(weights.sum())
+    sites = []
+    for rank, pick in enumerate(result['picks'], 1):
+        cell = records[int(candidates[pick['index']])]
+        rating, rating_color = get_spot_rating(cell['opportunity_score'])
+        sites.append({
+            'rank': rank,
+            'lat': round(cell['lat'], 6),
+            'lng': round(cell['lng'], 6),
+            'digipin': spatial_key(cell['lat'], cell['lng']),
+            'captured_demand': round(pick['gain'], 1),
+            'standalone_demand': round(pick['standalone'], 1),
+            'cannibalized_demand': round(pick['standalone'] - pick['gain'], 1),
+            'opportunity_score': cell['opportunity_score'],
+            'footfall_score': cell['footfall_score'],
+            'nearby_competitors': cell['nearby_competitors'],
+            'min_competitor_distance': cell['min_competitor_distance'],
+            'landmark_names': cell['landmark_names'],
+            'rating': rating,
+            'rating_color': rating_color,
+        })
+
+    covered_demand = float((weights * result['covered']).sum())
+    elapsed = time.time() - started
+    print(f"✅ Placement done in {elapsed:.1f}s: {len(sites)} site(s) from {candidates.size} candidates, "
+          f"{result['evaluations']} gain evaluations")
+
+    response = {
+        'business_type': business_type,
+        'bounds': region['bounds'],
+        'cell_size': region['cell_size'],
+        'service_radius': service_radius,
+        'scoring_mode': region['scoring_mode'],
+        'k': k,
+        'sites': sites,
+        'coverage': {
+            'total_demand': round(total_demand, 1),
+            'existing_demand': round(existing_demand, 1),
+            'new_demand': round(covered_demand - existing_demand, 1),
+            'covered_share': round(covered_demand / total_demand, 3) if total_demand else 0.0,
+        },
+        'stats': {
+            **region['stats'],
+            'candidates': int(candidates.size),
+            'coverage_pairs': int(indices.size),
+            'gain_evaluations': result['evaluations'],
+            'greedy_evaluations': int(candidates.size) * len(sites),
+            'optimize_seconds': round(optimize_seconds, 3),
+            'total_seconds': round(elapsed, 2),
+        },
+    }
+    if region['missing']:
+        response['partial'] = True
+        response['missing_tiles'] = missing_tile_count(region['missing'])
+    return response
@@ -2,11 +2,23 @@
 Hotspot IQ - Places Service
 Fetches nearby businesses using OpenStreetMap Overpass API.
 Provides clean, reliable competitor data for heatmap generation.
+
+Places that other steps of the same request already fetched (the area
+viability check pulls every amenity and shop in the radius) are shared
+through a per-request POIContext, so the analysis does not ask Overpass
+for them again.
 """
 
+import functools
 import overpy
+import re
 import time
-from typing import List, Dict, Optional
+from contextvars import ContextVar
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
+from config import Config, COMPETITOR_MAPPING
+from services.cache_service import TTLCache, spatial_key
+from utils.score_calculator import haversine_distance
+from utils.request_budget import overpass_query, mark_degraded, BudgetExhausted
 
 
 # Category mapping: user keywords -> OpenStreetMap tags
@@ -38,8 +50,151 @@ OVERPASS_ENDPOINTS = [
     "https://maps.mail.ru/osm/tools/overpass/api/interpreter",
 ]
 
+# Related categories searched alongside the primary one for competitors
+RELATED_CATEGORIES: Dict[str, List[str]] = {
+    "cafe": ["fast_food", "bakery"],
+    "restaurant": ["fast_food"],
+    "gym": [],
+    "pharmacy": ["clinic"],
+    "hotel": [],
+    "hospital": ["clinic"],
+    "salon": ["beauty"],
+}
+
+# Categories that make up the landmark layer
+LANDMARK_CATEGORIES = ["school", "college", "hospital", "bank", "atm"]
+
+# Fetched places keyed by (DIGIPIN of center, category), with the radius covered
+_radius_cache = TTLCache('places_radius', Config.POI_CACHE_TTL, Config.POI_CACHE_MAX_ENTRIES)
+
+
+class POIContext:
+    """
+    Places fetched earlier in the current request.
+
+    Each area is a circle in which every element carrying one of its tag
+    keys was fetched, e.g. all amenity=* and shop=* within 2km. A category
+    whose tag key an area covers can then be answered from it locally.
+    """
+
+    def __init__(self):
+        self.areas: List[Dict] = []
+
+    def add(self, lat: float, lng: float, radius: float, tag_keys: Iterable[str], places: List[Dict]) -> None:
+        """Record a circle of places ({name, lat, lng, tags}) complete for tag_keys."""
+        self.areas.append({'lat': lat, 'lng': lng, 'radius': radius, 'tag_keys': set(tag_keys), 'places': places})
+
+    def _area_for(self, lat: float, lng: float, radius: float, tag_key: str) -> Optional[Dict]:
+        for area in self.areas:
+            if tag_key in area['tag_keys'] and \
+                    haversine_distance(lat, lng, area['lat'], area['lng']) + radius <= area['radius']:
+                return area
+        return None
+
+    def covers(self, lat: float, lng: float, radius: float, category: str) -> bool:
+        """Whether places of category within radius can be answered locally."""
+        return self._area_for(lat, lng, radius, _resolve_tag(category)[0]) is not None
+
+    def coverage(self, lat: float, lng: float, radius: float, category: str) -> Optional[Dict]:
+        """
+        The area covering places of category within radius, as a radius cache
+        entry: {lat, lng, radius, places} with every place of category the area
+        holds, not yet filtered by distance. None if no area covers them.
+        """
+        tag_key, tag_value = _resolve_tag(category)
+        area = self._area_for(lat, lng, radius, tag_key)
+        if area is None:
+            return None
+        return {
+            "lat": area['lat'],
+            "lng": area['lng'],
+            "radius": area['radius'],
+            "places": [
+                {"name": place["name"], "lat": place["lat"], "lng": place["lng"], "type": category}
+                for place in area['places']
+                if place["tags"].get(tag_key) == tag_value
+            ],
+        }
+
+    def places(self, lat: float, lng: float, radius: float, category: str) -> Optional[List[Dict]]:
+        """Places of category within radius, or None if no area covers them."""
+        covering = self.coverage(lat, lng, radius, category)
+        return None if covering is None else _within(covering["places"], lat, lng, radius)
+
+
+_poi_context: ContextVar[Optional[POIContext]] = ContextVar('poi_context', default=None)
+
+
+def with_poi_context(func: Callable) -> Callable:
+    """Run func with a fresh POIContext shared by everything it calls."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _poi_context.set(POIContext())
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _poi_context.reset(token)
+    return wrapper
+
+
+def share_places(lat: float, lng: float, radius: float, tag_keys: Iterable[str], result) -> int:
+    """
+    Offer an Overpass result to the current request's POIContext.
+
+    Args:
+        lat: Latitude of the queried circle's center
+        lng: Longitude of the queried circle's center
+        radius: Radius of the queried circle in meters
+        tag_keys: Tag keys for which the query fetched every element
+            (e.g. node/way/relation["amenity"] around the circle)
+        result: overpy Result fetched with 'out center'
+
+    Returns:
+        Number of named places shared (0 outside a POIContext)
+    """
+    context = _poi_context.get()
+    if context is None:
+        return 0
+
+    tag_keys = tuple(tag_keys)
+    places = []
+    for element, el_lat, el_lng in (
+        [(node, node.lat, node.lon) for node in result.nodes]
+        + [(way, way.center_lat, way.center_lon) for way in result.ways]
+        + [(rel, getattr(rel, 'center_lat', None), getattr(rel, 'center_lon', None)) for rel in result.relations]
+    ):
+        tags = element.tags
+        if tags.get("name") and el_lat and el_lng and any(key in tags for key in tag_keys):
+            places.append({
+                "name": tags["name"],
+                "lat": float(el_lat),
+                "lng": float(el_lng),
+                "tags": {key: tags[key] for key in tag_keys if key in tags},
+            })
+
+    context.add(lat, lng, radius, tag_keys, places)
+    return len(places)
+
 
-def _build_query(lat: float, lng: float, radius: int, tag_key: str, tag_value: str) -> str:
+def _resolve_tag(category: str) -> Tuple[str, str]:
+    """Map a category keyword to its OSM (tag_key, tag_value) pair."""
+    tag_info = CATEGORY_MAPPING.get(category.lower())
+    
+    if not tag_info:
+        print(f"⚠️ Unknown category '{category}', defaulting to amenity search")
+        return "amenity", category.lower()
+    
+    return list(tag_info.keys())[0], list(tag_info.values())[0]
+
+
+def _build_query(
+    lat: float, 
+    lng: float, 
+    radius: int, 
+    tag_key: str, 
+    tag_value: str,
+    exclude: Optional[Tuple[float, float, float]] = None
+) -> str:
     """
     Build an Overpass QL query for nodes, ways, and relations.
     
@@ -49,63 +204,51 @@ def _build_query(lat: float, lng: float, radius: int, tag_key: str, tag_value: s
         radius: Search radius in meters
         tag_key: OSM tag key (e.g., "amenity")
         tag_value: OSM tag value (e.g., "cafe")
+        exclude: Optional (lat, lng, radius) circle already fetched; matching
+                 elements inside it are subtracted so only the annulus is returned
         
     Returns:
         Overpass QL query string
     """
-    query = f"""
+    def _selectors(s_lat: float, s_lng: float, s_radius: float) -> str:
+        return f"""
+            node["{tag_key}"="{tag_value}"](around:{s_radius},{s_lat},{s_lng});
+            way["{tag_key}"="{tag_value}"](around:{s_radius},{s_lat},{s_lng});
+            relation["{tag_key}"="{tag_value}"](around:{s_radius},{s_lat},{s_lng});"""
+    
+    if exclude:
+        query = f"""
     [out:json][timeout:10];
     (
-        node["{tag_key}"="{tag_value}"](around:{radius},{lat},{lng});
-        way["{tag_key}"="{tag_value}"](around:{radius},{lat},{lng});
-        relation["{tag_key}"="{tag_value}"](around:{radius},{lat},{lng});
+        ({_selectors(lat, lng, radius)}
+        );
+        - ({_selectors(*exclude)}
+        );
+    );
+    out center;
+    """
+        return query
+    
+    query = f"""
+    [out:json][timeout:10];
+    ({_selectors(lat, lng, radius)}
     );
     out center;
     """
     return query
 
 
-def fetch_nearby_places(
-    lat: float, 
-    lng: float, 
-    radius: int = 1000, 
-    category: str = "cafe",
-    max_retries: int = 3
-) -> List[Dict]:
+def _query_overpass(query: str, max_retries: int = 3):
     """
-    Fetch nearby places of a specific category using OpenStreetMap Overpass API.
-    Includes retry logic with multiple API endpoints to handle rate limiting.
+    Execute an Overpass query against the available endpoints with retries.
     
     Args:
-        lat: Latitude of the center point
-        lng: Longitude of the center point
-        radius: Search radius in meters (default: 1000m)
-        category: Business category keyword (default: "cafe")
-        max_retries: Maximum retry attempts (default: 3)
+        query: Overpass QL query string
+        max_retries: Maximum retry attempts per endpoint
         
     Returns:
-        List of places with name, lat, lng, and type.
-        Only returns places that have a name.
-        
-    Example:
-        places = fetch_nearby_places(12.9716, 77.5946, 2500, "cafe")
-        # Returns: [{"name": "Starbucks", "lat": 12.97, "lng": 77.59, "type": "cafe"}, ...]
+        overpy Result, or None if every endpoint failed
     """
-    # Get OSM tag for the category
-    tag_info = CATEGORY_MAPPING.get(category.lower())
-    
-    if not tag_info:
-        print(f"⚠️ Unknown category '{category}', defaulting to amenity search")
-        tag_key = "amenity"
-        tag_value = category.lower()
-    else:
-        tag_key = list(tag_info.keys())[0]
-        tag_value = list(tag_info.values())[0]
-    
-    # Build the query
-    query = _build_query(lat, lng, radius, tag_key, tag_value)
-    
-    # Try each endpoint with retries
     last_error = None
     for endpoint_idx, endpoint in enumerate(OVERPASS_ENDPOINTS):
         for attempt in range(max_retries):
@@ -119,48 +262,11 @@ def fetch_nearby_places(
                     print(f"⏳ Waiting {delay}s before retry {attempt + 1}...")
                     time.sleep(delay)
                 
-                result = api.query(query)
-                
-                places = []
-                
-                # Process nodes (points)
-                for node in result.nodes:
-                    name = node.tags.get("name")
-                    if name:  # Only include places with names
-                        places.append({
-                            "name": name,
-                            "lat": float(node.lat),
-                            "lng": float(node.lon),
-                            "type": category
-                        })
+                return api.query(overpass_query(query))
                 
-                # Process ways (buildings/areas) - use center coordinates
-                for way in result.ways:
-                    name = way.tags.get("name")
-                    if name and way.center_lat and way.center_lon:
-                        places.append({
-                            "name": name,
-                            "lat": float(way.center_lat),
-                            "lng": float(way.center_lon),
-                            "type": category
-                        })
-                
-                # Process relations - use center if available
-                for relation in result.relations:
-                    name = relation.tags.get("name")
-                    if name:
-                        rel_lat = getattr(relation, 'center_lat', None)
-                        rel_lng = getattr(relation, 'center_lon', None)
-                        if rel_lat and rel_lng:
-                            places.append({
-                                "name": name,
-                                "lat": float(rel_lat),
-                                "lng": float(rel_lng),
-                                "type": category
-                            })
-                
-                print(f"✅ Found {len(places)} {category}(s) within {radius}m radius")
-                return places
+            except BudgetExhausted as e:
+                print(f"⏱️ {e}")
+                return None
                 
             except overpy.exception.OverpassTooManyRequests:
                 last_error = "Rate limited"
@@ -178,7 +284,360 @@ def fetch_nearby_places(
                 break  # Move to next endpoint on other errors
     
     print(f"❌ All Overpass API attempts failed: {last_error}")
-    return []
+    mark_degraded('overpass')
+    return None
+
+
+def _extract_places(result, classify: Callable[[Dict], List[str]]) -> List[Dict]:
+    """
+    Convert an overpy result into named places.
+    
+    Args:
+        result: overpy Result
+        classify: Maps an element's tags to the categories it belongs to;
+                  the element is emitted once per category
+        
+    Returns:
+        List of places with name, lat, lng, type
+    """
+    places = []
+    
+    def _add(tags: Dict, lat, lng) -> None:
+        for category in classify(tags):
+            places.append({
+                "name": tags["name"],
+                "lat": float(lat),
+                "lng": float(lng),
+                "type": category
+            })
+    
+    # Process nodes (points)
+    for node in result.nodes:
+        if node.tags.get("name"):  # Only include places with names
+            _add(node.tags, node.lat, node.lon)
+    
+    # Process ways (buildings/areas) - use center coordinates
+    for way in result.ways:
+        if way.tags.get("name") and way.center_lat and way.center_lon:
+            _add(way.tags, way.center_lat, way.center_lon)
+    
+    # Process relations - use center if available
+    for relation in result.relations:
+        if relation.tags.get("name"):
+            rel_lat = getattr(relation, 'center_lat', None)
+            rel_lng = getattr(relation, 'center_lon', None)
+            if rel_lat and rel_lng:
+                _add(relation.tags, rel_lat, rel_lng)
+    
+    return places
+
+
+def _run_places_query(query: str, category: str, max_retries: int = 3) -> Optional[List[Dict]]:
+    """
+    Execute a single-category Overpass query.
+    
+    Args:
+        query: Overpass QL query string
+        category: Category label attached to each place as "type"
+        max_retries: Maximum retry attempts per endpoint
+        
+    Returns:
+        List of named places, or None if every endpoint failed
+    """
+    result = _query_overpass(query, max_retries)
+    if result is None:
+        return None
+    return _extract_places(result, lambda tags: [category])
+
+
+def _regex_literal(value: str) -> str:
+    """Escape a tag value for use as a literal inside a quoted Overpass regex."""
+    return re.escape(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _run_union_query(
+    tags: Dict[Tuple[str, str], List[str]],
+    area: str,
+    max_retries: int = 3
+) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Fetch several categories with one Overpass query and split them by tag.
+    
+    Args:
+        tags: (tag_key, tag_value) -> category names sharing that tag
+        area: Overpass area filter, e.g. "around:1000,12.97,77.59" or "s,w,n,e"
+        max_retries: Maximum retry attempts per endpoint
+        
+    Returns:
+        Dict of category -> places, or None if every endpoint failed
+    """
+    # One regex selector per tag key keeps the union query short; values are
+    # escaped so each still matches exactly, as an "=" selector would
+    values_by_key: Dict[str, List[str]] = {}
+    for tag_key, tag_value in tags:
+        values_by_key.setdefault(tag_key, []).append(_regex_literal(tag_value))
+    
+    selectors = ""
+    for tag_key, values in values_by_key.items():
+        pattern = "|".join(sorted(values))
+        for element in ("node", "way", "relation"):
+            selectors += f"""
+            {element}["{tag_key}"~"^({pattern})$"]({area});"""
+    
+    query = f"""
+    [out:json][timeout:25];
+    ({selectors}
+    );
+    out center;
+    """
+    
+    def _classify(element_tags: Dict) -> List[str]:
+        matched = []
+        for (tag_key, tag_value), names in tags.items():
+            if element_tags.get(tag_key) == tag_value:
+                matched.extend(names)
+        return matched
+    
+    result = _query_overpass(query, max_retries)
+    if result is None:
+        return None
+    
+    by_category: Dict[str, List[Dict]] = {category: [] for names in tags.values() for category in names}
+    for place in _extract_places(result, _classify):
+        by_category[place["type"]].append(place)
+    return by_category
+
+
+def _group_tags(categories: List[str]) -> Dict[Tuple[str, str], List[str]]:
+    """Group category keywords by the OSM tag they resolve to."""
+    tags: Dict[Tuple[str, str], List[str]] = {}
+    for category in dict.fromkeys(c.lower() for c in categories):
+        tags.setdefault(_resolve_tag(category), []).append(category)
+    return tags
+
+
+def _within(places: List[Dict], lat: float, lng: float, radius: float) -> List[Dict]:
+    """Copy the places lying within radius meters of (lat, lng)."""
+    return [
+        dict(place) for place in places
+        if haversine_distance(lat, lng, place["lat"], place["lng"]) <= radius
+    ]
+
+
+def fetch_nearby_places(
+    lat: float, 
+    lng: float, 
+    radius: int = 1000, 
+    category: str = "cafe",
+    max_retries: int = 3
+) -> List[Dict]:
+    """
+    Fetch nearby places of a specific category using OpenStreetMap Overpass API.
+    Includes retry logic with multiple API endpoints to handle rate limiting.
+    
+    Results are cached per (DIGIPIN of center, category) together with the
+    radius they cover. A request whose circle lies inside a cached circle is
+    answered by local distance filtering; a larger request only fetches the
+    annulus outside the cached circle and merges it in.
+    
+    The cache keeps everything Overpass returned for the circle and filters
+    on read. Overpass matches ways and relations that intersect the circle,
+    while the filter uses their center, so a way crossing the edge with its
+    center outside is only returned once a larger circle includes that
+    center; the annulus query excludes it, so it must already be cached.
+    
+    Args:
+        lat: Latitude of the center point
+        lng: Longitude of the center point
+        radius: Search radius in meters (default: 1000m)
+        category: Business category keyword (default: "cafe")
+        max_retries: Maximum retry attempts (default: 3)
+        
+    Returns:
+        List of places with name, lat, lng, and type.
+        Only returns places that have a name.
+        
+    Example:
+        places = fetch_nearby_places(12.9716, 77.5946, 2500, "cafe")
+        # Returns: [{"name": "Starbucks", "lat": 12.97, "lng": 77.59, "type": "cafe"}, ...]
+    """
+    # Get OSM tag for the category
+    tag_key, tag_value = _resolve_tag(category)
+    
+    cache_key = (spatial_key(lat, lng), category.lower())
+    cached = _radius_cache.get(cache_key)
+    
+    # Already fetched by an earlier step of this request
+    context = _poi_context.get()
+    covering = context.coverage(lat, lng, radius, category) if context else None
+    if covering is not None:
+        shared = _within(covering["places"], lat, lng, radius)
+        print(f"🔗 Served {len(shared)} {category}(s) within {radius}m from this request's earlier fetch")
+        if not cached or cached["radius"] < covering["radius"]:
+            _radius_cache.set(cache_key, covering)
+        return shared
+    
+    exclude = None
+    if cached:
+        # The cached circle may be centered a few meters away (same DIGIPIN cell)
+        offset = haversine_distance(lat, lng, cached["lat"], cached["lng"])
+        
+        if offset + radius <= cached["radius"]:
+            places = _within(cached["places"], lat, lng, radius)
+            print(f"♻️ Served {len(places)} {category}(s) within {radius}m from cached {cached['radius']}m fetch")
+            return places
+        
+        exclude = (cached["lat"], cached["lng"], cached["radius"])
+    
+    # Build the query (annulus only if a smaller circle is already cached)
+    query = _build_query(lat, lng, radius, tag_key, tag_value, exclude=exclude)
+    
+    fetched = _run_places_query(query, category, max_retries)
+    if fetched is None:
+        # Upstream failed - fall back to whatever the cache covers, which
+        # misses the annulus, so the response is incomplete
+        if cached:
+            mark_degraded('places')
+            return _within(cached["places"], lat, lng, radius)
+        return []
+    
+    covered = radius
+    if cached:
+        print(f"➕ Fetched {len(fetched)} {category}(s) in annulus {cached['radius']}-{radius}m")
+        # The annulus excludes the circle named in the query, not everything
+        # cached, so drop places already present
+        seen = {(p["name"], p["lat"], p["lng"]) for p in cached["places"]}
+        merged = cached["places"] + [p for p in fetched if (p["name"], p["lat"], p["lng"]) not in seen]
+        # The merged set covers both circles; around the new center that is
+        # at least the old circle minus the offset between the centers
+        covered = max(radius, cached["radius"] - offset)
+    else:
+        merged = fetched
+    
+    # Cached unfiltered, see above
+    _radius_cache.set(cache_key, {
+        "lat": lat,
+        "lng": lng,
+        "radius": covered,
+        "places": merged,
+    })
+    
+    places = _within(merged, lat, lng, radius)
+    print(f"✅ Found {len(places)} {category}(s) within {radius}m radius")
+    return places
+
+
+def parse_business_type(business_type) -> str:
+    """
+    Validate a business type sent by a client.
+
+    Returns:
+        The lowercased business type
+
+    Raises:
+        ValueError: If it is missing, not a string, or not a known business
+            type or category (COMPETITOR_MAPPING / CATEGORY_MAPPING)
+    """
+    if not business_type:
+        raise ValueError("business_type is required")
+    if not isinstance(business_type, str):
+        raise ValueError("business_type must be a string")
+    business_type = business_type.strip().lower()
+    if business_type not in COMPETITOR_MAPPING and business_type not in CATEGORY_MAPPING:
+        raise ValueError(f"Unknown business_type '{business_type}'")
+    return business_type
+
+
+def competitor_categories(business_type: str) -> List[str]:
+    """Categories fetch_competitors() queries for a business type."""
+    business_type = business_type.lower()
+    return [business_type] + RELATED_CATEGORIES.get(business_type, [])
+
+
+def prefetch_categories(
+    lat: float,
+    lng: float,
+    radius: int,
+    categories: List[str],
+    max_retries: int = 3
+) -> List[str]:
+    """
+    Fetch several categories with a single Overpass query.
+    
+    Elements are split by their tags into one result set per category and
+    stored in the radius cache, so subsequent fetch_nearby_places() calls
+    for these categories are answered locally. Categories whose cached
+    circle or the request's POIContext already covers the request are left
+    out of the query.
+    
+    Args:
+        lat: Latitude of the center point
+        lng: Longitude of the center point
+        radius: Search radius in meters
+        categories: Category keywords to fetch
+        max_retries: Maximum retry attempts (default: 3)
+        
+    Returns:
+        Categories that were fetched (empty if all were cached or upstream failed)
+    """
+    center_key = spatial_key(lat, lng)
+    context = _poi_context.get()
+    missing = []
+    
+    for category in dict.fromkeys(c.lower() for c in categories):
+        if context and context.covers(lat, lng, radius, category):
+            continue
+        cached = _radius_cache.get((center_key, category))
+        if cached:
+            offset = haversine_distance(lat, lng, cached["lat"], cached["lng"])
+            if offset + radius <= cached["radius"]:
+                continue
+        missing.append(category)
+    
+    if not missing:
+        return []
+    
+    by_category = _run_union_query(_group_tags(missing), f"around:{radius},{lat},{lng}", max_retries)
+    if by_category is None:
+        return []
+    
+    for category, places in by_category.items():
+        _radius_cache.set((center_key, category), {
+            "lat": lat,
+            "lng": lng,
+            "radius": radius,
+            "places": places,  # Unfiltered, as in fetch_nearby_places()
+        })
+    
+    print(f"✅ Prefetched {len(by_category)} categories in one query: "
+          f"{sum(len(p) for p in by_category.values())} places within {radius}m")
+    return list(by_category)
+
+
+def fetch_places_in_bbox(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    categories: List[str],
+    max_retries: int = 3
+) -> Optional[Dict[str, List[Dict]]]:
+    """
+    Fetch several categories inside a bounding box with a single Overpass query.
+    
+    Args:
+        south, west, north, east: Bounding box in degrees
+        categories: Category keywords to fetch
+        max_retries: Maximum retry attempts (default: 3)
+        
+    Returns:
+        Dict of category -> places, or None if every endpoint failed
+    """
+    by_category = _run_union_query(_group_tags(categories), f"{south},{west},{north},{east}", max_retries)
+    if by_category is not None:
+        print(f"✅ Fetched {sum(len(p) for p in by_category.values())} places "
+              f"in bbox ({south:.4f},{west:.4f},{north:.4f},{east:.4f}) for {len(by_category)} categories")
+    return by_category
 
 
 def fetch_competitors(
@@ -215,17 +674,7 @@ def fetch_competitors(
             competitors.append(place)
     
     # Extended search for related categories
-    related_categories = {
-        "cafe": ["fast_food", "bakery"],
-        "restaurant": ["fast_food"],
-        "gym": [],
-        "pharmacy": ["clinic"],
-        "hotel": [],
-        "hospital": ["clinic"],
-        "salon": ["beauty"],
-    }
-    
-    extra_categories = related_categories.get(business_type.lower(), [])
+    extra_categories = RELATED_CATEGORIES.get(business_type.lower(), [])
     for extra_cat in extra_categories:
         extra_places = fetch_nearby_places(lat, lng, radius, extra_cat)
         for place in extra_places:
@@ -252,12 +701,10 @@ def fetch_landmarks(lat: float, lng: float, radius: int) -> List[Dict]:
     Returns:
         List of landmarks with name, lat, lng, type
     """
-    landmark_categories = ["school", "college", "hospital", "bank", "atm"]
-    
     landmarks = []
     seen_names = set()
     
-    for category in landmark_categories:
+    for category in LANDMARK_CATEGORIES:
         places = fetch_nearby_places(lat, lng, radius, category)
         for place in places:
             name_key = place["name"].lower()
@@ -0,0 +1,131 @@
+"""
+Hotspot IQ - Scoring Service
+Scores many candidate sites at once from tile-cached POIs.
+
+POIs are fetched once for the union of tiles around all points, then every
+point is scored with the vectorized grid scorer. Only POIs within
+LANDMARK_PROXIMITY of a point can change its score (the competitor distance
+bonus is capped at that distance too), so padding each point by it makes the
+scores independent of how points are batched. min_competitor_distance is
+exact up to that distance; beyond it the nearest competitor may lie in a tile
+that was not loaded, so larger values are upper bounds.
+
+Tiles whose fetch failed are reported back by load_region() so callers can
+flag their results partial.
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from config import Config
+from services.tile_cache import (
+    get_tiles_places, missing_tile_count, region_categories, merge_competitors, merge_landmarks
+)
+from utils.score_calculator import score_points, point_score_records, get_spot_rating, LANDMARK_PROXIMITY
+from utils.tiles import padded_bounds, tiles_covering
+
+
+def parse_points(points) -> List[Dict]:
+    """
+    Validate a list of {lat, lng[, id]} points.
+
+    Raises:
+        ValueError: If the list is empty, too large or has invalid points
+    """
+    if not isinstance(points, list) or not points:
+        raise ValueError('points must be a non-empty list')
+
+    if len(points) > Config.MAX_SCORE_BATCH:
+        raise ValueError(f'At most {Config.MAX_SCORE_BATCH} points per request')
+
+    parsed = []
+    for i, point in enumerate(points):
+        try:
+            lat, lng = float(point['lat']), float(point['lng'])
+        except (TypeError, KeyError, ValueError):
+            raise ValueError(f'points[{i}] must have numeric lat and lng')
+
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise ValueError(f'points[{i}] is out of range')
+
+        parsed.append({'id': point.get('id', i), 'lat': lat, 'lng': lng})
+    return parsed
+
+
+def point_tiles(lat: float, lng: float) -> List[Tuple[int, int]]:
+    """POI tiles within LANDMARK_PROXIMITY of a point, i.e. those its score depends on."""
+    bounds = padded_bounds(lat, lng, LANDMARK_PROXIMITY)
+    return tiles_covering(bounds['south'], bounds['west'], bounds['north'], bounds['east'], Config.TILE_ZOOM)
+
+
+def load_region(points: List[Dict], business_type: str) -> Tuple[List[Dict], List[Dict], Set[Tuple[int, int, str]]]:
+    """
+    Fetch competitors and landmarks for the tiles around all points.
+
+    Returns:
+        Tuple of (competitors, landmarks, (x, y, category) tile pairs that
+        could not be loaded)
+
+    Raises:
+        TilesUnavailable: If no tile could be loaded at all
+    """
+    tiles = set()
+    for point in points:
+        tiles.update(point_tiles(point['lat'], point['lng']))
+
+    by_category, missing = get_tiles_places(tiles, region_categories(business_type))
+    competitors = merge_competitors(by_category, business_type)
+    landmarks = merge_landmarks(by_category)
+
+    print(f"🧱 Loaded {len(tiles)} tile(s): {len(competitors)} competitors, {len(landmarks)} landmarks")
+    if missing:
+        print(f"⚠️ {missing_tile_count(missing)} tile(s) missing, scores near them are partial")
+    return competitors, landmarks, missing
+
+
+def iter_scores(
+    points: List[Dict],
+    business_type: str,
+    chunk_size: int = 500,
+    region: Optional[Tuple[List[Dict], List[Dict], Set]] = None
+) -> Iterator[Dict]:
+    """
+    Score points in chunks, yielding one result per point in input order.
+
+    Args:
+        points: Parsed points from parse_points()
+        business_type: Type of business being analyzed
+        chunk_size: Points scored per vectorized pass
+        region: load_region() result for the points (loaded here if omitted)
+
+    Yields:
+        Point results with opportunity score, rating and nearby counts
+    """
+    competitors, landmarks, _ = region or load_region(points, business_type)
+
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start:start + chunk_size]
+        lats = [p['lat'] for p in chunk]
+        lngs = [p['lng'] for p in chunk]
+
+        scores = score_points(lats, lngs, competitors, landmarks, business_type=business_type)
+        for point, record in zip(chunk, point_score_records(lats, lngs, scores, landmarks)):
+            rating, rating_color = get_spot_rating(record['opportunity_score'])
+            yield {
+                'id': point['id'],
+                **record,
+                'rating': rating,
+                'rating_color': rating_color,
+            }
+
+
+def score_batch(points: List[Dict], business_type: str) -> List[Dict]:
+    """
+    Score all points and return results in input order.
+
+    Args:
+        points: Parsed points from parse_points()
+        business_type: Type of business being analyzed
+
+    Returns:
+        List of point results
+    """
+    return list(iter_scores(points, business_type))
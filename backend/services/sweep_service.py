@@ -0,0 +1,315 @@
+"""
+Hotspot IQ - Sweep Service
+City-wide opportunity sweeps over a bounding box or polygon.
+
+The region is tiled into square cells, POIs are loaded for every touched map
+tile through the tile cache (blocks fetched concurrently), and cells are
+scored with the vectorized grid scorer in a process pool. Each scoring task
+covers a block of tiles and only receives the POIs around that block, so work
+and memory grow with the area rather than with cells x POIs of the whole city.
+"""
+
+import math
+import time
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from services.cache_service import spatial_key
+from services.tile_cache import (
+    check_available, ensure_tiles, read_tiles, missing_tile_count, region_categories, merge_competitors, merge_landmarks
+)
+from utils.geometry import points_in_polygon, polygon_bounds
+from utils.score_calculator import (
+    score_points, point_score_records, get_spot_rating, haversine_distance, resolve_scoring_mode,
+    LANDMARK_PROXIMITY
+)
+from utils.tiles import lat_lng_to_tiles, tile_width_meters, METERS_PER_DEGREE
+
+
+# Default spacing between cell centers in meters
+DEFAULT_CELL_SIZE = 250
+MIN_CELL_SIZE = 50
+
+# Tiles per side handled by one scoring task
+SWEEP_BLOCK = 4
+
+# Scoring processes are forked once and reused across sweeps
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if Config.SWEEP_SCORE_WORKERS <= 1:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=Config.SWEEP_SCORE_WORKERS)
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def build_cells(
+    bounds: Dict[str, float],
+    cell_size: float,
+    rings: Optional[List[List[Tuple[float, float]]]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lay a grid of cell centers over a bounding box, optionally clipped to a polygon.
+
+    Args:
+        bounds: Dict with south, west, north, east
+        cell_size: Spacing between cell centers in meters
+        rings: Optional parsed polygon rings
+
+    Returns:
+        Tuple of (lats, lngs) arrays of cell centers
+    """
+    mid_lat = (bounds['south'] + bounds['north']) / 2
+    lat_step = cell_size / METERS_PER_DEGREE
+    lng_step = cell_size / (METERS_PER_DEGREE * math.cos(math.radians(mid_lat)))
+
+    lat_centers = np.arange(bounds['south'] + lat_step / 2, bounds['north'], lat_step)
+    lng_centers = np.arange(bounds['west'] + lng_step / 2, bounds['east'], lng_step)
+
+    grid_lngs, grid_lats = np.meshgrid(lng_centers, lat_centers)
+    lats, lngs = grid_lats.ravel(), grid_lngs.ravel()
+
+    if rings is not None:
+        inside = points_in_polygon(lats, lngs, rings)
+        lats, lngs = lats[inside], lngs[inside]
+
+    return lats, lngs
+
+
+def estimate_cells(bounds: Dict[str, float], cell_size: float) -> int:
+    """Number of cells the bounding box grid would have before polygon clipping."""
+    mid_lat = (bounds['south'] + bounds['north']) / 2
+    height = (bounds['north'] - bounds['south']) * METERS_PER_DEGREE
+    width = (bounds['east'] - bounds['west']) * METERS_PER_DEGREE * math.cos(math.radians(mid_lat))
+    return math.ceil(height / cell_size) * math.ceil(width / cell_size)
+
+
+def _score_task(task: Tuple) -> Tuple[np.ndarray, List[Dict]]:
+    """Score one block of cells (runs in a worker process)."""
+    indices, lats, lngs, competitors, landmarks, business_type, scoring_mode = task
+    scores = score_points(
+        lats, lngs, competitors, landmarks, max_landmark_names=3,
+        business_type=business_type, scoring_mode=scoring_mode
+    )
+    return indices, point_score_records(lats, lngs, scores, landmarks)
+
+
+def _run_tasks(tasks: List[Tuple]) -> List[Tuple[np.ndarray, List[Dict]]]:
+    """Run scoring tasks in the process pool, falling back to in-process scoring."""
+    executor = _get_executor() if len(tasks) > 1 else None
+    if executor is not None:
+        try:
+            return list(executor.map(_score_task, tasks))
+        except (BrokenProcessPool, OSError) as e:
+            print(f"⚠️ Scoring pool failed ({e}), scoring in-process")
+            _reset_executor()
+    return [_score_task(task) for task in tasks]
+
+
+def _pick_hotspots(records: List[Dict], top: int, spacing: float) -> List[Dict]:
+    """Greedy top-N cells that are at least `spacing` meters apart."""
+    ranked = sorted(records, key=lambda r: r['opportunity_score'], reverse=True)
+    hotspots = []
+    for cell in ranked:
+        if len(hotspots) >= top or cell['opportunity_score'] <= 0:
+            break
+        if any(haversine_distance(cell['lat'], cell['lng'], h['lat'], h['lng']) < spacing for h in hotspots):
+            continue
+        hotspots.append(cell)
+    return hotspots
+
+
+def score_region(
+    business_type: str,
+    bounds: Dict[str, float],
+    rings: Optional[List[List[Tuple[float, float]]]] = None,
+    cell_size: float = DEFAULT_CELL_SIZE,
+    max_cells: Optional[int] = None
+) -> Dict:
+    """
+    Score every cell of a region.
+
+    Args:
+        business_type: Type of business being analyzed
+        bounds: Region bounding box (south, west, north, east)
+        rings: Optional polygon rings; cells outside are skipped
+        cell_size: Spacing between cell centers in meters
+        max_cells: Cell limit (default: Config.MAX_SWEEP_CELLS)
+
+    Returns:
+        Dict with bounds, cell_size, scoring_mode, cell records (in grid
+        order), the (x, y, category) tile pairs that could not be loaded
+        and fetch/scoring statistics
+
+    Raises:
+        ValueError: If the region needs too many cells or tiles
+        TilesUnavailable: If no tile could be loaded at all
+    """
+    started = time.time()
+    cell_size = max(float(cell_size), MIN_CELL_SIZE)
+    max_cells = Config.MAX_SWEEP_CELLS if max_cells is None else max_cells
+
+    if rings is not None:
+        bounds = polygon_bounds(rings)
+
+    if estimate_cells(bounds, cell_size) > max_cells:
+        raise ValueError(f"Region too large: more than {max_cells} cells at {cell_size:.0f}m")
+
+    lats, lngs = build_cells(bounds, cell_size, rings)
+    if lats.size == 0:
+        raise ValueError("Region contains no cells")
+
+    # Tiles holding the cells, dilated so every POI within LANDMARK_PROXIMITY is loaded
+    zoom = Config.TILE_ZOOM
+    mid_lat = (bounds['south'] + bounds['north']) / 2
+    dilation = math.ceil(LANDMARK_PROXIMITY / tile_width_meters(mid_lat, zoom))
+
+    cell_x, cell_y = lat_lng_to_tiles(lats, lngs, zoom)
+    cell_tiles = set(zip(cell_x.tolist(), cell_y.tolist()))
+    needed = {
+        (x + dx, y + dy)
+        for x, y in cell_tiles
+        for dx in range(-dilation, dilation + 1)
+        for dy in range(-dilation, dilation + 1)
+    }
+    if len(needed) > Config.MAX_SWEEP_TILES:
+        raise ValueError(f"Region too large: needs {len(needed)} tiles (limit {Config.MAX_SWEEP_TILES})")
+
+    print(f"🧹 Scoring region: {lats.size} cells at {cell_size:.0f}m over {len(needed)} tiles, business_type={business_type}")
+
+    categories = region_categories(business_type)
+    scoring_mode = resolve_scoring_mode()
+    queries, failed_queries = ensure_tiles(needed, categories, max_workers=Config.SWEEP_FETCH_WORKERS)
+    fetched_at = time.time()
+
+    # One scoring task per block of tiles, with only the POIs around that block
+    block_x, block_y = cell_x // SWEEP_BLOCK, cell_y // SWEEP_BLOCK
+    block_ids = block_x * (2 ** zoom) + block_y
+    tasks = []
+    missing = set()
+    for block_id in np.unique(block_ids):
+        indices = np.flatnonzero(block_ids == block_id)
+        bx, by = int(block_x[indices[0]]), int(block_y[indices[0]])
+        block_tiles = [
+            (x, y)
+            for x in range(bx * SWEEP_BLOCK - dilation, (bx + 1) * SWEEP_BLOCK + dilation)
+            for y in range(by * SWEEP_BLOCK - dilation, (by + 1) * SWEEP_BLOCK + dilation)
+            if (x, y) in needed
+        ]
+        by_category, block_missing = read_tiles(block_tiles, categories)
+        missing |= block_missing
+        competitors = merge_competitors(by_category, business_type)
+        landmarks = merge_landmarks(by_category)
+        tasks.append((indices, lats[indices], lngs[indices], competitors, landmarks, business_type, scoring_mode))
+
+    check_available(missing, len(needed) * len(categories))
+    if missing:
+        print(f"⚠️ {missing_tile_count(missing)} of {len(needed)} tile(s) failed to load, sweep is partial")
+
+    records: List[Optional[Dict]] = [None] * lats.size
+    for indices, block_records in _run_tasks(tasks):
+        for i, record in zip(indices.tolist(), block_records):
+            records[i] = record
+
+    return {
+        'bounds': bounds,
+        'cell_size': cell_size,
+        'scoring_mode': scoring_mode,
+        'records': records,
+        'missing': missing,
+        'stats': {
+            'cells': int(lats.size),
+            'tiles': len(needed),
+            'tile_queries': queries,
+            'failed_tile_queries': failed_queries,
+            'scoring_tasks': len(tasks),
+            'fetch_seconds': round(fetched_at - started, 2),
+        },
+    }
+
+
+def run_sweep(
+    business_type: str,
+    bounds: Dict[str, float],
+    rings: Optional[List[List[Tuple[float, float]]]] = None,
+    cell_size: float = DEFAULT_CELL_SIZE,
+    top: int = 50,
+    spacing: Optional[float] = None
+) -> Dict:
+    """
+    Score every cell of a region and return ranked hotspot areas.
+
+    Args:
+        business_type: Type of business being analyzed
+        bounds: Region bounding box (south, west, north, east)
+        rings: Optional polygon rings; cells outside are skipped
+        cell_size: Spacing between cell centers in meters
+        top: Number of hotspots to return
+        spacing: Minimum distance between hotspots (default: max(500m, 2 cells))
+
+    Returns:
+        Dict with hotspots and sweep statistics; partial and missing_tiles
+        are set when some POI tiles could not be loaded
+
+    Raises:
+        ValueError: If the region needs too many cells or tiles
+        TilesUnavailable: If no tile could be loaded at all
+    """
+    started = time.time()
+    region = score_region(business_type, bounds, rings, cell_size)
+    cell_size = region['cell_size']
+    spacing = spacing if spacing is not None else max(500.0, 2 * cell_size)
+
+    records = region['records']
+    scores = np.array([r['opportunity_score'] for r in records])
+    hotspots = _pick_hotspots(records, top, spacing)
+
+    for rank, cell in enumerate(hotspots, 1):
+        rating, rating_color = get_spot_rating(cell['opportunity_score'])
+        cell.update({
+            'rank': rank,
+            'lat': round(cell['lat'], 6),
+            'lng': round(cell['lng'], 6),
+            'digipin': spatial_key(cell['lat'], cell['lng']),
+            'rating': rating,
+            'rating_color': rating_color,
+        })
+
+    elapsed = time.time() - started
+    print(f"✅ Sweep done in {elapsed:.1f}s: {len(hotspots)} hotspots, {region['stats']['scoring_tasks']} scoring tasks")
+
+    response = {
+        'business_type': business_type,
+        'bounds': region['bounds'],
+        'cell_size': cell_size,
+        'scoring_mode': region['scoring_mode'],
+        'hotspots': hotspots,
+        'stats': {
+            **region['stats'],
+            'scored_positive': int((scores > 0).sum()),
+            'mean_score': round(float(scores.mean()), 1),
+            'p90_score': round(float(np.percentile(scores, 90)), 1),
+            'max_score': round(float(scores.max()), 1),
+            'total_seconds': round(elapsed, 2),
+        },
+    }
+    if region['missing']:
+        response['partial'] = True
+        response['missing_tiles'] = missing_tile_count(region['missing'])
+    return response
@@ -0,0 +1,239 @@
+"""
+Hotspot IQ - Tile Cache
+OpenStreetMap POIs cached per slippy map tile and category.
+
+Places are stored per (zoom, x, y, category) at Config.TILE_ZOOM, so any
+request touching the same ~1km tiles - batch scoring, sweeps, heatmaps,
+vector tiles - shares the same upstream fetches. Missing tiles are fetched
+in rectangular blocks with one Overpass bbox query per block.
+
+A block whose fetch fails leaves its tiles uncached. Readers get those
+(x, y, category) pairs back as missing, so results built without them can
+be flagged partial and kept out of downstream caches; when nothing at all
+could be loaded, TilesUnavailable is raised instead.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set, Tuple
+from config import Config
+from services.cache_service import TTLCache
+from services.places_service import fetch_places_in_bbox, competitor_categories, LANDMARK_CATEGORIES
+from utils.tiles import lat_lng_to_tile, tile_bounds, tiles_covering
+
+
+# Places keyed by (zoom, x, y, category)
+_tile_cache = TTLCache('tiles', Config.TILE_CACHE_TTL, Config.TILE_CACHE_MAX_ENTRIES)
+
+# Missing tiles are fetched in blocks of at most TILE_BLOCK x TILE_BLOCK tiles
+TILE_BLOCK = 8
+
+
+class TilesUnavailable(Exception):
+    """None of the requested POI tiles are cached and fetching them failed."""
+
+    def __init__(self, missing: int):
+        self.missing = missing
+        super().__init__(f"POI data unavailable: {missing} tile(s) could not be loaded")
+
+
+def _tile_key(x: int, y: int, category: str) -> Tuple[int, int, int, str]:
+    return (Config.TILE_ZOOM, x, y, category)
+
+
+def _fetch_block(block_tiles: Dict[Tuple[int, int], List[str]]) -> bool:
+    """Fetch one block of tiles with a single bbox query and cache every tile in it."""
+    zoom = Config.TILE_ZOOM
+    block_categories = list(dict.fromkeys(c for missing in block_tiles.values() for c in missing))
+    xs = [x for x, _ in block_tiles]
+    ys = [y for _, y in block_tiles]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+
+    # Tile rows grow southwards
+    north = tile_bounds(min_x, min_y, zoom)['north']
+    west = tile_bounds(min_x, min_y, zoom)['west']
+    south = tile_bounds(max_x, max_y, zoom)['south']
+    east = tile_bounds(max_x, max_y, zoom)['east']
+
+    by_category = fetch_places_in_bbox(south, west, north, east, block_categories)
+    if by_category is None:
+        print(f"⚠️ Tile block fetch failed for {len(block_tiles)} tile(s), serving cached data only")
+        return False
+
+    buckets: Dict[Tuple[int, int, str], List[Dict]] = {}
+    for category, places in by_category.items():
+        for place in places:
+            x, y = lat_lng_to_tile(place['lat'], place['lng'], zoom)
+            buckets.setdefault((x, y, category), []).append(place)
+
+    # Every tile in the rectangle is now fully covered for these categories
+    for x in range(min_x, max_x + 1):
+        for y in range(min_y, max_y + 1):
+            for category in block_categories:
+                _tile_cache.set(_tile_key(x, y, category), buckets.get((x, y, category), []))
+    return True
+
+
+def ensure_tiles(tiles: Iterable[Tuple[int, int]], categories: List[str], max_workers: int = 1) -> Tuple[int, int]:
+    """
+    Fetch every (tile, category) pair that is not cached yet.
+
+    Args:
+        tiles: (x, y) tile indices at Config.TILE_ZOOM
+        categories: Category keywords
+        max_workers: Blocks fetched concurrently (keep low - Overpass rate limits)
+
+    Returns:
+        Tuple of (Overpass queries issued, queries that failed)
+    """
+    categories = list(dict.fromkeys(c.lower() for c in categories))
+
+    # Group missing tiles into blocks so neighbouring tiles share one query
+    blocks: Dict[Tuple[int, int], Dict[Tuple[int, int], List[str]]] = {}
+    for x, y in set(tiles):
+        missing = [c for c in categories if _tile_cache.get(_tile_key(x, y, c)) is None]
+        if missing:
+            blocks.setdefault((x // TILE_BLOCK, y // TILE_BLOCK), {})[(x, y)] = missing
+
+    if max_workers > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(blocks))) as executor:
+            fetched = list(executor.map(_fetch_block, blocks.values()))
+    else:
+        fetched = [_fetch_block(block_tiles) for block_tiles in blocks.values()]
+
+    return len(blocks), fetched.count(False)
+
+
+def read_tiles(
+    tiles: Iterable[Tuple[int, int]],
+    categories: List[str]
+) -> Tuple[Dict[str, List[Dict]], Set[Tuple[int, int, str]]]:
+    """
+    Read places of the given categories from cached tiles, without fetching.
+
+    Returns:
+        Tuple of (dict of category -> list of place copies, set of
+        (x, y, category) pairs that are not cached)
+    """
+    result: Dict[str, List[Dict]] = {category.lower(): [] for category in categories}
+    missing: Set[Tuple[int, int, str]] = set()
+    for x, y in dict.fromkeys(tiles):
+        for category in result:
+            places = _tile_cache.get(_tile_key(x, y, category))
+            if places is None:
+                missing.add((x, y, category))
+            else:
+                result[category].extend(dict(place) for place in places)
+    return result, missing
+
+
+def get_tiles_places(
+    tiles: Iterable[Tuple[int, int]],
+    categories: List[str],
+    max_workers: int = 1
+) -> Tuple[Dict[str, List[Dict]], Set[Tuple[int, int, str]]]:
+    """
+    Get places of the given categories in a set of tiles.
+
+    Args:
+        tiles: (x, y) tile indices at Config.TILE_ZOOM
+        categories: Category keywords
+        max_workers: Missing blocks fetched concurrently
+
+    Returns:
+        Tuple of (dict of category -> list of place copies (name, lat, lng,
+        type), set of (x, y, category) pairs whose fetch failed)
+
+    Raises:
+        TilesUnavailable: If no pair could be loaded at all
+    """
+    tiles = list(dict.fromkeys(tiles))
+    categories = list(dict.fromkeys(c.lower() for c in categories))
+    ensure_tiles(tiles, categories, max_workers)
+
+    result, missing = read_tiles(tiles, categories)
+    check_available(missing, len(tiles) * len(categories))
+    return result, missing
+
+
+def check_available(missing: Set[Tuple[int, int, str]], requested: int) -> None:
+    """
+    Raises:
+        TilesUnavailable: If all requested (tile, category) pairs are missing
+    """
+    if requested and len(missing) >= requested:
+        raise TilesUnavailable(missing_tile_count(missing))
+
+
+def missing_tile_count(missing: Set[Tuple[int, int, str]]) -> int:
+    """Number of distinct tiles with at least one missing category."""
+    return len({(x, y) for x, y, _ in missing})
+
+
+def get_region_pois(
+    south: float, west: float, north: float, east: float, categories: List[str]
+) -> Tuple[Dict[str, List[Dict]], Set[Tuple[int, int, str]]]:
+    """
+    Get places of the given categories in the tiles covering a bounding box.
+
+    Places in the covering tiles but slightly outside the box are included.
+
+    Returns:
+        Tuple of (dict of category -> list of place copies, missing pairs)
+
+    Raises:
+        TilesUnavailable: If no tile could be loaded at all
+    """
+    tiles = tiles_covering(south, west, north, east, Config.TILE_ZOOM)
+    return get_tiles_places(tiles, categories)
+
+
+def region_categories(business_type: str) -> List[str]:
+    """Competitor and landmark categories needed to score a business type."""
+    return competitor_categories(business_type) + LANDMARK_CATEGORIES
+
+
+def _position(place: Dict) -> Tuple[float, float, str]:
+    """Sort key giving merged lists the same order whichever tiles were loaded."""
+    return (place['lat'], place['lng'], place['name'])
+
+
+def merge_competitors(by_category: Dict[str, List[Dict]], business_type: str) -> List[Dict]:
+    """
+    Flatten the competitor categories of a business type into one list.
+
+    Unlike fetch_competitors(), places are deduplicated by name *and*
+    position so branches of the same chain across a region are all kept.
+    Each competitor's own category is kept under 'category'.
+    """
+    competitors = []
+    seen = set()
+    for category in competitor_categories(business_type):
+        for place in sorted(by_category.get(category, []), key=_position):
+            key = (place['name'].lower(), round(place['lat'], 5), round(place['lng'], 5))
+            if key not in seen:
+                seen.add(key)
+                competitors.append({**place, 'type': business_type, 'category': category})
+    return competitors
+
+
+def merge_landmarks(by_category: Dict[str, List[Dict]]) -> List[Dict]:
+    """Flatten landmark categories into the analysis landmark format."""
+    landmarks = []
+    seen = set()
+    for category in LANDMARK_CATEGORIES:
+        for place in sorted(by_category.get(category, []), key=_position):
+            key = (place['name'].lower(), round(place['lat'], 5), round(place['lng'], 5))
+            if key not in seen:
+                seen.add(key)
+                landmarks.append({
+                    'name': place['name'],
+                    'lat': place['lat'],
+                    'lng': place['lng'],
+                    'category': place.get('type', category)
+                })
+    return landmarks
+
+
+def tile_cache_stats() -> Dict:
+    """Size and hit/miss counters of the tile cache."""
+    return _tile_cache.stats()
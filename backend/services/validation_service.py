@@ -7,7 +7,7 @@ This allows analysis even when the center is in water, as long as there's
 usable land within the selected radius.
 
 Performs four levels of validation:
-1. Water Body Check - Detect if location is in ocean/lake/river
+1. Water Body Check - Detect if location is in ocean/lake/river (local land mask, Overpass fallback)
 2. Roadway Access Check - Using LatLong Snap to Roads API + Overpass fallback
 3. Ghost Town Check - Using Overpass API for amenities
 4. Road Quality Check - For heavy logistics businesses
@@ -17,8 +17,14 @@ import math
 import requests
 import overpy
 import time
+import numpy as np
 from typing import Dict, Tuple, Optional, List
 from config import Config
+from services.cache_service import TTLCache
+from services.places_service import share_places
+from utils.landmask import get_landmask, LAND, UNKNOWN, WATER_TYPES
+from utils.tiles import lat_lng_to_tile, tile_bounds
+from utils.request_budget import overpass_query, upstream_timeout, cap_overpass_timeout
 
 
 # Business types requiring heavy logistics (need major roads)
@@ -41,6 +47,30 @@ OVERPASS_ENDPOINTS = [
     "https://maps.mail.ru/osm/tools/overpass/api/interpreter",
 ]
 
+# Search distances (meters) of the point water/land checks; the bulk
+# sample-point probe applies the same distances locally
+WATER_FEATURE_DISTANCE = 50
+SEA_PLACE_DISTANCE = 200
+COASTLINE_DISTANCE = 500
+LAND_FEATURE_DISTANCE = 200
+AMENITY_DISTANCE = 300
+
+# Tag keys the area viability query fetches completely; its named places
+# are shared with the rest of the request (see places_service.POIContext)
+VIABILITY_SHARED_TAGS = ('amenity', 'shop')
+
+# Checks whose verdicts are cached per map tile
+VALIDATION_CHECKS = ('roadway', 'viability', 'road_quality')
+
+# Errors caused by unreachable upstreams rather than the location; never cached
+TRANSIENT_ERROR_TYPES = ('verification_failed', 'api_error')
+
+# Road quality looks ~50m around the point, so it is cached on finer tiles
+ROAD_QUALITY_ZOOM_OFFSET = 2
+
+# Verdicts keyed by (check, zoom, x, y, *parameters)
+_validation_cache = TTLCache('validation', Config.VALIDATION_CACHE_TTL, Config.VALIDATION_CACHE_MAX_ENTRIES)
+
 
 class ValidationError(Exception):
     """Custom exception for location validation failures."""
@@ -116,18 +146,25 @@ def _is_point_in_water(lat: float, lng: float) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_in_water: bool, water_type: Optional[str])
     """
+    # Local mask lookup when the point is covered
+    landmask = get_landmask()
+    if landmask is not None:
+        cell_class = landmask.classify_point(lat, lng)
+        if cell_class != UNKNOWN:
+            return cell_class != LAND, WATER_TYPES.get(cell_class)
+    
     try:
         query = f"""
         [out:json][timeout:10];
         (
-            way["natural"="water"](around:50,{lat},{lng});
-            relation["natural"="water"](around:50,{lat},{lng});
-            way["natural"="coastline"](around:500,{lat},{lng});
-            way["water"](around:50,{lat},{lng});
-            relation["water"](around:50,{lat},{lng});
-            way["waterway"~"river|stream|canal"](around:50,{lat},{lng});
-            way["place"~"sea|ocean"](around:200,{lat},{lng});
-            relation["place"~"sea|ocean"](around:200,{lat},{lng});
+            way["natural"="water"](around:{WATER_FEATURE_DISTANCE},{lat},{lng});
+            relation["natural"="water"](around:{WATER_FEATURE_DISTANCE},{lat},{lng});
+            way["natural"="coastline"](around:{COASTLINE_DISTANCE},{lat},{lng});
+            way["water"](around:{WATER_FEATURE_DISTANCE},{lat},{lng});
+            relation["water"](around:{WATER_FEATURE_DISTANCE},{lat},{lng});
+            way["waterway"~"river|stream|canal"](around:{WATER_FEATURE_DISTANCE},{lat},{lng});
+            way["place"~"sea|ocean"](around:{SEA_PLACE_DISTANCE},{lat},{lng});
+            relation["place"~"sea|ocean"](around:{SEA_PLACE_DISTANCE},{lat},{lng});
         );
         out body;
         """
@@ -135,7 +172,7 @@ def _is_point_in_water(lat: float, lng: float) -> Tuple[bool, Optional[str]]:
         for endpoint in OVERPASS_ENDPOINTS[:2]:  # Use fewer endpoints for speed
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 water_features = len(result.ways) + len(result.relations)
                 
@@ -174,15 +211,22 @@ def _is_point_on_land(lat: float, lng: float) -> bool:
         lng: Longitude
         
     Returns:
-        True if land features found nearby
+        True if land features found nearby (with the land mask: True if the
+        point is on land)
     """
+    landmask = get_landmask()
+    if landmask is not None:
+        cell_class = landmask.classify_point(lat, lng)
+        if cell_class != UNKNOWN:
+            return cell_class == LAND
+    
     try:
         query = f"""
         [out:json][timeout:10];
         (
-            way["highway"](around:200,{lat},{lng});
-            way["building"](around:200,{lat},{lng});
-            node["amenity"](around:300,{lat},{lng});
+            way["highway"](around:{LAND_FEATURE_DISTANCE},{lat},{lng});
+            way["building"](around:{LAND_FEATURE_DISTANCE},{lat},{lng});
+            node["amenity"](around:{AMENITY_DISTANCE},{lat},{lng});
         );
         out count;
         """
@@ -190,7 +234,7 @@ def _is_point_on_land(lat: float, lng: float) -> bool:
         for endpoint in OVERPASS_ENDPOINTS[:2]:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 total = len(result.nodes) + len(result.ways)
                 return total > 0
@@ -204,6 +248,168 @@ def _is_point_on_land(lat: float, lng: float) -> bool:
         return False
 
 
+def _element_segments(element: Dict) -> np.ndarray:
+    """
+    Line segments of an Overpass JSON way or relation fetched with geometry.
+
+    Returns:
+        (n, 4) array of lat1, lng1, lat2, lng2 (relation members are joined,
+        so split multipolygon rings still close up)
+    """
+    lines = [element.get('geometry')] if element['type'] == 'way' else [
+        member.get('geometry') for member in element.get('members', []) if member.get('type') == 'way'
+    ]
+    segments = []
+    for line in lines:
+        points = np.array([(p['lat'], p['lon']) for p in line or [] if p], dtype=np.float64).reshape(-1, 2)
+        if len(points) >= 2:
+            segments.append(np.hstack([points[:-1], points[1:]]))
+    return np.vstack(segments) if segments else np.empty((0, 4))
+
+
+def _segment_distances(ys: np.ndarray, xs: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """Distance from each point to the nearest segment, in the units of the inputs."""
+    if segments.shape[0] == 0:
+        return np.full(ys.shape, np.inf)
+    y1, x1, y2, x2 = (segments[:, i][None, :] for i in range(4))
+    py, px = ys[:, None], xs[:, None]
+    dy, dx = y2 - y1, x2 - x1
+    length2 = dy ** 2 + dx ** 2
+    t = np.clip(((py - y1) * dy + (px - x1) * dx) / np.where(length2 > 0, length2, 1), 0, 1)
+    return np.hypot(py - (y1 + t * dy), px - (x1 + t * dx)).min(axis=1)
+
+
+def _segments_contain(ys: np.ndarray, xs: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """Even-odd test of points against the rings formed by a set of segments."""
+    if segments.shape[0] == 0:
+        return np.zeros(ys.shape, dtype=bool)
+    y1, x1, y2, x2 = (segments[:, i][None, :] for i in range(4))
+    py, px = ys[:, None], xs[:, None]
+    crosses = (y1 > py) != (y2 > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    return ((crosses & (px < x_cross)).sum(axis=1) % 2) == 1
+
+
+def _probe_sample_points(
+    center_lat: float,
+    center_lng: float,
+    radius: int,
+    sample_points: List[Tuple[float, float]]
+) -> Optional[List[Tuple[float, float, float]]]:
+    """
+    Find which sample points are on land with a single Overpass query.
+
+    Fetches the water and land features around the whole radius once, with
+    geometry, and applies the per-point checks of _is_point_in_water and
+    _is_point_on_land to every sample point locally. Water areas also count
+    when a point lies inside them, not only near their outline.
+
+    Args:
+        center_lat: Center latitude
+        center_lng: Center longitude
+        radius: Radius in meters
+        sample_points: Points from _generate_sample_points()
+
+    Returns:
+        List of (lat, lng, distance from center) for the land points, nearest
+        first, or None if Overpass could not be reached
+    """
+    water_radius = radius + WATER_FEATURE_DISTANCE
+    query = f"""
+    [out:json][timeout:25];
+    (
+        way["natural"="water"](around:{water_radius},{center_lat},{center_lng});
+        relation["natural"="water"](around:{water_radius},{center_lat},{center_lng});
+        way["water"](around:{water_radius},{center_lat},{center_lng});
+        relation["water"](around:{water_radius},{center_lat},{center_lng});
+        way["waterway"~"river|stream|canal"](around:{water_radius},{center_lat},{center_lng});
+        way["natural"="coastline"](around:{radius + COASTLINE_DISTANCE},{center_lat},{center_lng});
+        way["place"~"sea|ocean"](around:{radius + SEA_PLACE_DISTANCE},{center_lat},{center_lng});
+        relation["place"~"sea|ocean"](around:{radius + SEA_PLACE_DISTANCE},{center_lat},{center_lng});
+        way["highway"](around:{radius + LAND_FEATURE_DISTANCE},{center_lat},{center_lng});
+    );
+    out tags geom;
+    way["building"](around:{radius + LAND_FEATURE_DISTANCE},{center_lat},{center_lng});
+    out ids center;
+    node["amenity"](around:{radius + AMENITY_DISTANCE},{center_lat},{center_lng});
+    out skel;
+    """
+
+    elements = None
+    for endpoint in OVERPASS_ENDPOINTS[:2]:
+        try:
+            timeout = upstream_timeout('overpass', 30)
+            response = requests.post(endpoint, data={'data': cap_overpass_timeout(query, timeout)}, timeout=timeout)
+            if response.status_code == 200:
+                elements = response.json().get('elements', [])
+                break
+        except Exception:
+            continue
+    if elements is None:
+        return None
+
+    # Work in local meters around the center
+    lng_scale = 111000 * math.cos(math.radians(center_lat))
+
+    def project(lats, lngs):
+        return (np.asarray(lats, dtype=np.float64) - center_lat) * 111000, \
+            (np.asarray(lngs, dtype=np.float64) - center_lng) * lng_scale
+
+    def project_segments(segments):
+        y1, x1 = project(segments[:, 0], segments[:, 1])
+        y2, x2 = project(segments[:, 2], segments[:, 3])
+        return np.column_stack([y1, x1, y2, x2])
+
+    ys, xs = project([p[0] for p in sample_points], [p[1] for p in sample_points])
+    in_water = np.zeros(len(sample_points), dtype=bool)
+    road_segments, building_points, amenity_points = [], [], []
+
+    for element in elements:
+        tags = element.get('tags', {})
+        if element['type'] == 'node':
+            amenity_points.append((element['lat'], element['lon']))
+            continue
+        if 'center' in element:
+            building_points.append((element['center']['lat'], element['center']['lon']))
+            continue
+
+        segments = project_segments(_element_segments(element))
+        if tags.get('highway'):
+            road_segments.append(segments)
+        elif tags.get('natural') == 'coastline':
+            in_water |= _segment_distances(ys, xs, segments) <= COASTLINE_DISTANCE
+        elif tags.get('place') in ('sea', 'ocean'):
+            in_water |= _segment_distances(ys, xs, segments) <= SEA_PLACE_DISTANCE
+            in_water |= _segments_contain(ys, xs, segments)
+        else:
+            in_water |= _segment_distances(ys, xs, segments) <= WATER_FEATURE_DISTANCE
+            is_area = element['type'] == 'relation' or (
+                len(segments) >= 3 and np.allclose(segments[0, :2], segments[-1, 2:])
+            )
+            if is_area and not tags.get('waterway'):
+                in_water |= _segments_contain(ys, xs, segments)
+
+    near_land = np.zeros(len(sample_points), dtype=bool)
+    if road_segments:
+        near_land |= _segment_distances(ys, xs, np.vstack(road_segments)) <= LAND_FEATURE_DISTANCE
+    for points, distance in ((building_points, LAND_FEATURE_DISTANCE), (amenity_points, AMENITY_DISTANCE)):
+        if points:
+            py, px = project([p[0] for p in points], [p[1] for p in points])
+            nearest = np.hypot(ys[:, None] - py[None, :], xs[:, None] - px[None, :]).min(axis=1)
+            near_land |= nearest <= distance
+
+    print(f"   📦 Probed {len(sample_points)} sample points against {len(elements)} features in one query")
+
+    land_points = [
+        (point_lat, point_lng, _calculate_distance(center_lat, center_lng, point_lat, point_lng))
+        for (point_lat, point_lng), on_land in zip(sample_points, (near_land & ~in_water).tolist())
+        if on_land
+    ]
+    land_points.sort(key=lambda p: p[2])
+    return land_points
+
+
 def _find_best_land_point(center_lat: float, center_lng: float, radius: int) -> Optional[Tuple[float, float]]:
     """
     Find the best land point within the radius.
@@ -221,22 +427,30 @@ def _find_best_land_point(center_lat: float, center_lng: float, radius: int) ->
     
     sample_points = _generate_sample_points(center_lat, center_lng, radius)
     
-    # Track which points are on land
-    land_points = []
-    
-    for point_lat, point_lng in sample_points:
-        is_water, _ = _is_point_in_water(point_lat, point_lng)
+    # With the land mask, classify every sample point in one read and fall
+    # back to the nearest land cell when none of them is on land
+    landmask = get_landmask()
+    if landmask is not None and landmask.covers(center_lat, center_lng, radius):
+        classes = landmask.classify([p[0] for p in sample_points], [p[1] for p in sample_points])
+        land_points = [
+            (point_lat, point_lng, _calculate_distance(center_lat, center_lng, point_lat, point_lng))
+            for (point_lat, point_lng), cell_class in zip(sample_points, classes.tolist())
+            if cell_class == LAND
+        ]
+        if not land_points:
+            nearest = landmask.nearest_land(center_lat, center_lng, radius)
+            land_points = [nearest] if nearest else []
         
-        if not is_water:
-            # Check if there's land infrastructure
-            if _is_point_on_land(point_lat, point_lng):
-                distance_from_center = _calculate_distance(center_lat, center_lng, point_lat, point_lng)
-                land_points.append((point_lat, point_lng, distance_from_center))
-                print(f"   ✅ Found land at ({point_lat:.5f}, {point_lng:.5f}), {distance_from_center:.0f}m from center")
+        if land_points:
+            best = min(land_points, key=lambda p: p[2])
+            print(f"   📍 Best land point (land mask): ({best[0]:.5f}, {best[1]:.5f}), {best[2]:.0f}m from center")
+            return (best[0], best[1])
+        return None
+    
+    # Otherwise one Overpass query for the whole radius, ranked by distance from center
+    land_points = _probe_sample_points(center_lat, center_lng, radius, sample_points)
     
     if land_points:
-        # Sort by distance from center (prefer closer points)
-        land_points.sort(key=lambda x: x[2])
         best = land_points[0]
         print(f"   📍 Best land point: ({best[0]:.5f}, {best[1]:.5f}), {best[2]:.0f}m from center")
         return (best[0], best[1])
@@ -323,6 +537,24 @@ def check_water_body(lat: float, lng: float) -> Dict:
     """
     print(f"🌊 Checking if location ({lat}, {lng}) is in water body...")
     
+    landmask = get_landmask()
+    if landmask is not None:
+        cell_class = landmask.classify_point(lat, lng)
+        if cell_class != UNKNOWN and cell_class != LAND:
+            print(f"   ❌ Location is in {WATER_TYPES[cell_class]} (land mask)")
+            raise ValidationError(
+                f"Location is in {WATER_TYPES[cell_class]}. No business can be established here.",
+                "water_body"
+            )
+        if cell_class == LAND:
+            print(f"   ✅ No water body detected at location (land mask)")
+            return {
+                'valid': True,
+                'is_water': False,
+                'water_type': None,
+                'message': 'Location is not in water'
+            }
+    
     try:
         # Query to check if point is within any water body
         # Using a small radius to detect if we're IN water
@@ -348,7 +580,7 @@ def check_water_body(lat: float, lng: float) -> Dict:
         for endpoint in OVERPASS_ENDPOINTS:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 water_features = len(result.ways) + len(result.relations)
                 print(f"   📊 Found {water_features} water features nearby")
@@ -447,7 +679,7 @@ def _verify_land_exists(lat: float, lng: float) -> Dict:
         for endpoint in OVERPASS_ENDPOINTS:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 total_features = len(result.nodes) + len(result.ways)
                 print(f"   📊 Found {total_features} land features within 2km")
@@ -489,6 +721,112 @@ def _verify_land_exists(lat: float, lng: float) -> Dict:
         )
 
 
+def _tile_key(check: str, lat: float, lng: float, zoom: Optional[int] = None, *params) -> Tuple:
+    """Cache key of a check for the map tile holding a point."""
+    zoom = Config.VALIDATION_TILE_ZOOM if zoom is None else zoom
+    x, y = lat_lng_to_tile(lat, lng, zoom)
+    return (check, zoom, x, y) + params
+
+
+def _cached_verdict(key: Tuple, label: str, check) -> Dict:
+    """
+    Run a check once per cache key.
+
+    Passed results are cached for VALIDATION_CACHE_TTL and failures for
+    VALIDATION_FAIL_CACHE_TTL; failures caused by unreachable upstreams are
+    not cached, so the next request tries again.
+
+    Args:
+        key: Cache key from _tile_key()
+        label: Check name for logging
+        check: Callable running the check; returns a result or raises ValidationError
+
+    Raises:
+        ValidationError: If the check (or its cached verdict) fails
+    """
+    verdict = _validation_cache.get(key)
+    if verdict is not None:
+        print(f"   ♻️ {label} verdict from cache")
+        if verdict['error']:
+            raise ValidationError(*verdict['error'])
+        return {**verdict['result'], 'cached': True}
+
+    try:
+        result = check()
+    except ValidationError as e:
+        if e.error_type not in TRANSIENT_ERROR_TYPES:
+            _validation_cache.set(
+                key, {'result': None, 'error': (e.message, e.error_type)}, ttl=Config.VALIDATION_FAIL_CACHE_TTL
+            )
+        raise
+
+    _validation_cache.set(key, {'result': result, 'error': None})
+    return result
+
+
+def _remember_road_distance(
+    lat: float,
+    lng: float,
+    lower: float,
+    upper: float,
+    snapped: Optional[Tuple[float, float]] = None,
+    failed: bool = False
+) -> None:
+    """Cache bounds on the distance from a point to its nearest road."""
+    _validation_cache.set(
+        _tile_key('roadway', lat, lng),
+        {'lat': lat, 'lng': lng, 'lower': lower, 'upper': upper, 'snapped': snapped},
+        ttl=Config.VALIDATION_FAIL_CACHE_TTL if failed else None
+    )
+
+
+def _cached_road_access(lat: float, lng: float, max_distance: float) -> Optional[Dict]:
+    """
+    Answer a roadway check from the distance cached for the point's tile.
+
+    The distance to the nearest road changes by at most the distance moved,
+    so the cached bounds shifted by the gap between the two points still
+    decide the check when they are far enough from max_distance.
+
+    Returns:
+        Roadway result, or None if the cached bounds cannot decide
+
+    Raises:
+        ValidationError: If the cached bounds prove there is no road in range
+    """
+    entry = _validation_cache.get(_tile_key('roadway', lat, lng))
+    if entry is None:
+        return None
+
+    shift = _calculate_distance(lat, lng, entry['lat'], entry['lng'])
+    if entry['upper'] + shift <= max_distance:
+        if entry['snapped']:
+            snapped_lat, snapped_lng = entry['snapped']
+            distance = _calculate_distance(lat, lng, snapped_lat, snapped_lng)
+            message = f"Location is {distance:.0f}m from nearest road"
+        else:
+            snapped_lat, snapped_lng, distance = lat, lng, 0
+            message = "Road access verified"
+        print(f"   ♻️ Road access from cache (road within {entry['upper'] + shift:.0f}m)")
+        return {
+            'valid': True,
+            'snapped_lat': snapped_lat,
+            'snapped_lng': snapped_lng,
+            'distance': distance,
+            'message': message,
+            'cached': True
+        }
+
+    if entry['lower'] - shift > max_distance:
+        print(f"   ♻️ No road access from cache (nearest road over {entry['lower'] - shift:.0f}m)")
+        raise ValidationError(
+            f"Location is not accessible by road. Nearest road is more than {max_distance:.0f}m away.",
+            "roadway_access"
+        )
+
+    return None
+
+
 def check_roadway_access(lat: float, lng: float, max_distance: float = 100.0) -> Dict:
     """
     Step A: Check if location is accessible by road using LatLong Snap to Roads API.
@@ -506,6 +844,10 @@ def check_roadway_access(lat: float, lng: float, max_distance: float = 100.0) ->
     """
     print(f"🛣️ Checking roadway access...")
     
+    cached = _cached_road_access(lat, lng, max_distance)
+    if cached is not None:
+        return cached
+    
     try:
         # LatLong Snap to Roads API
         url = f"{Config.LATLONG_BASE_URL}/v4/snap.json"
@@ -519,7 +861,7 @@ def check_roadway_access(lat: float, lng: float, max_distance: float = 100.0) ->
             'coordinates': f"[{lat},{lng}]"
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=15)
+        response = requests.get(url, headers=headers, params=params, timeout=upstream_timeout('latlong', 15))
         
         if response.status_code == 200:
             data = response.json()
@@ -539,6 +881,10 @@ def check_roadway_access(lat: float, lng: float, max_distance: float = 100.0) ->
                     
                     print(f"   📍 Snap result: ({lat}, {lng}) -> ({snapped_lat}, {snapped_lng}), Distance: {distance:.1f}m")
                     
+                    _remember_road_distance(
+                        lat, lng, distance, distance, (snapped_lat, snapped_lng), failed=distance > max_distance
+                    )
+                    
                     if distance > max_distance:
                         raise ValidationError(
                             f"Location is not accessible by road. Nearest road is {distance:.0f}m away.",
@@ -580,7 +926,7 @@ def _fallback_road_check(lat: float, lng: float, max_distance: float = 100.0) ->
         for endpoint in OVERPASS_ENDPOINTS:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 road_count = len(result.ways)
                 print(f"   📊 Found {road_count} roads within {max_distance}m")
@@ -594,20 +940,23 @@ def _fallback_road_check(lat: float, lng: float, max_distance: float = 100.0) ->
                     );
                     out body;
                     """
-                    result_extended = api.query(query_extended)
+                    result_extended = api.query(overpass_query(query_extended))
                     
                     if len(result_extended.ways) == 0:
+                        _remember_road_distance(lat, lng, max(1000, max_distance), math.inf, failed=True)
                         raise ValidationError(
                             "Location is not accessible by road. No roads found within 1km.",
                             "roadway_access"
                         )
                     else:
+                        _remember_road_distance(lat, lng, max_distance, math.inf, failed=True)
                         raise ValidationError(
                             f"Location is not accessible by road. Nearest road is more than {max_distance:.0f}m away.",
                             "roadway_access"
                         )
                 
                 print(f"   ✅ Road access verified via Overpass")
+                _remember_road_distance(lat, lng, 0, max_distance)
                 return {
                     'valid': True,
                     'snapped_lat': lat,
@@ -643,6 +992,7 @@ def _fallback_road_check(lat: float, lng: float, max_distance: float = 100.0) ->
 def check_area_viability(lat: float, lng: float, radius: int = 2000, min_amenities: int = 5) -> Dict:
     """
     Step B: Ghost Town Check - Verify area has sufficient development/amenities.
+    Verdicts are cached per map tile, radius and threshold.
     
     Args:
         lat: Latitude of the location
@@ -658,17 +1008,30 @@ def check_area_viability(lat: float, lng: float, radius: int = 2000, min_ameniti
     """
     print(f"🏘️ Checking area viability (min {min_amenities} amenities in {radius}m)...")
     
+    return _cached_verdict(
+        _tile_key('viability', lat, lng, None, radius, min_amenities),
+        'Area viability',
+        lambda: _count_area_amenities(lat, lng, radius, min_amenities)
+    )
+
+
+def _count_area_amenities(lat: float, lng: float, radius: int, min_amenities: int) -> Dict:
+    """Run the ghost town check against Overpass (see check_area_viability)."""
+
     try:
         # Query for various amenities that indicate developed area
-        # Use 'out body;' to get actual elements we can count
+        # 'out center' gives countable elements with positions, and the named
+        # shops and amenities are reused as the request's landmarks/competitors
         query = f"""
         [out:json][timeout:20];
         (
             // Commercial establishments
             node["shop"](around:{radius},{lat},{lng});
             way["shop"](around:{radius},{lat},{lng});
+            relation["shop"](around:{radius},{lat},{lng});
             node["amenity"](around:{radius},{lat},{lng});
             way["amenity"](around:{radius},{lat},{lng});
+            relation["amenity"](around:{radius},{lat},{lng});
             // Offices/commercial buildings
             node["office"](around:{radius},{lat},{lng});
             way["office"](around:{radius},{lat},{lng});
@@ -676,18 +1039,21 @@ def check_area_viability(lat: float, lng: float, radius: int = 2000, min_ameniti
             // Residential (indicates population)
             node["building"](around:{radius},{lat},{lng});
         );
-        out body;
+        out center;
         """
         
         for endpoint in OVERPASS_ENDPOINTS:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 # Count all elements
                 total_count = len(result.nodes) + len(result.ways) + len(result.relations)
                 
                 print(f"   📊 Found {total_count} amenities/buildings within {radius}m")
+                shared = share_places(lat, lng, radius, VIABILITY_SHARED_TAGS, result)
+                if shared:
+                    print(f"   🔗 Shared {shared} named shops/amenities with the analysis")
                 
                 if total_count < min_amenities:
                     raise ValidationError(
@@ -731,9 +1097,16 @@ def check_area_viability(lat: float, lng: float, radius: int = 2000, min_ameniti
         )
 
 
+def logistics_class(business_type: str) -> str:
+    """'heavy' for business types matching HEAVY_LOGISTICS_BUSINESSES, else 'light'."""
+    business_lower = business_type.lower().replace('-', '_').replace(' ', '_')
+    return 'heavy' if any(heavy in business_lower for heavy in HEAVY_LOGISTICS_BUSINESSES) else 'light'
+
+
 def check_road_quality(lat: float, lng: float, business_type: str, radius: int = 50) -> Dict:
     """
     Step C: Road Quality Check - For heavy logistics businesses.
+    Verdicts are cached per map tile and logistics class, not business type.
     
     Args:
         lat: Latitude of the location
@@ -748,14 +1121,7 @@ def check_road_quality(lat: float, lng: float, business_type: str, radius: int =
         ValidationError: If road infrastructure is insufficient for business type
     """
     # Only check for heavy logistics businesses
-    business_lower = business_type.lower().replace('-', '_').replace(' ', '_')
-    
-    is_heavy_logistics = any(
-        heavy in business_lower 
-        for heavy in HEAVY_LOGISTICS_BUSINESSES
-    )
-    
-    if not is_heavy_logistics:
+    if logistics_class(business_type) != 'heavy':
         print(f"🛣️ Road quality check not required for {business_type}")
         return {
             'valid': True,
@@ -765,6 +1131,15 @@ def check_road_quality(lat: float, lng: float, business_type: str, radius: int =
     
     print(f"🛣️ Checking road quality for heavy logistics business...")
     
+    return _cached_verdict(
+        _tile_key('road_quality', lat, lng, Config.VALIDATION_TILE_ZOOM + ROAD_QUALITY_ZOOM_OFFSET, 'heavy', radius),
+        'Road quality',
+        lambda: _check_heavy_road_quality(lat, lng, radius)
+    )
+
+
+def _check_heavy_road_quality(lat: float, lng: float, radius: int) -> Dict:
+    """Check for roads fit for heavy logistics against Overpass (see check_road_quality)."""
     try:
         query = f"""
         [out:json][timeout:10];
@@ -775,7 +1150,7 @@ def check_road_quality(lat: float, lng: float, business_type: str, radius: int =
         for endpoint in OVERPASS_ENDPOINTS:
             try:
                 api = overpy.Overpass(url=endpoint)
-                result = api.query(query)
+                result = api.query(overpass_query(query))
                 
                 if not result.ways:
                     raise ValidationError(
@@ -835,6 +1210,42 @@ def check_road_quality(lat: float, lng: float, business_type: str, radius: int =
         )
 
 
+def invalidate_validation_cache(
+    bounds: Optional[Dict[str, float]] = None,
+    checks: Optional[List[str]] = None
+) -> int:
+    """
+    Drop cached validation verdicts.
+
+    Args:
+        bounds: Only drop tiles intersecting this box (south, west, north, east)
+        checks: Only drop these checks (see VALIDATION_CHECKS)
+
+    Returns:
+        Number of entries removed
+    """
+    def matches(key: Tuple) -> bool:
+        check, zoom, x, y = key[:4]
+        if checks and check not in checks:
+            return False
+        if bounds is None:
+            return True
+        tile = tile_bounds(x, y, zoom)
+        return (
+            tile['south'] <= bounds['north'] and tile['north'] >= bounds['south']
+            and tile['west'] <= bounds['east'] and tile['east'] >= bounds['west']
+        )
+
+    removed = _validation_cache.invalidate(matches)
+    print(f"🧹 Invalidated {removed} cached validation verdict(s)")
+    return removed
+
+
+def validation_cache_stats() -> Dict:
+    """Size and hit/miss counters of the validation verdict cache."""
+    return _validation_cache.stats()
+
+
 def validate_location(lat: float, lng: float, business_type: str) -> Dict:
     """
     Master validation function - validates location for business analysis.
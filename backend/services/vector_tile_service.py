@@ -0,0 +1,170 @@
+"""
+Hotspot IQ - Vector Tile Service
+Competitors and landmarks served as Mapbox Vector Tiles.
+
+Tiles are cut from the POI tile cache, so panning the map only loads the
+tiles in view and shares upstream fetches with batch scoring, sweeps and
+heatmaps. Features carry only what the map draws: name, category and, for
+landmarks, the relevance-based style from get_marker_style().
+"""
+
+import hashlib
+import numpy as np
+from typing import Dict, List
+from config import Config
+from services.cache_service import TTLCache
+from services.relevance_service import get_marker_style
+from services.tile_cache import get_tiles_places, region_categories, merge_competitors, merge_landmarks
+from utils.mvt import encode_tile, DEFAULT_EXTENT
+from utils.tiles import project_to_tile, tile_bounds, tiles_covering
+
+
+# Zoom range served (below the minimum a tile spans too many POI tiles)
+MVT_MIN_ZOOM = 13
+MVT_MAX_ZOOM = 20
+
+# Points this far outside the tile (in grid units) are still included, so
+# markers straddling a tile edge are drawn on both sides
+MVT_BUFFER = 64
+
+# Below this zoom, landmarks with low relevance are left out
+LOW_RELEVANCE_MIN_ZOOM = 15
+
+MVT_MIMETYPE = 'application/vnd.mapbox-vector-tile'
+
+# Encoded tiles keyed by (z, x, y, business type)
+_vector_tile_cache = TTLCache('vector_tiles', Config.TILE_CACHE_TTL, Config.VECTOR_TILE_CACHE_MAX_ENTRIES)
+
+
+def validate_tile(z: int, x: int, y: int) -> None:
+    """
+    Raises:
+        ValueError: If the tile is outside the served range
+    """
+    if not MVT_MIN_ZOOM <= z <= MVT_MAX_ZOOM:
+        raise ValueError(f"Zoom must be between {MVT_MIN_ZOOM} and {MVT_MAX_ZOOM}")
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError("Tile coordinates out of range")
+
+
+def _project(places: List[Dict], z: int, x: int, y: int) -> List[Dict]:
+    """Attach tile grid coordinates to places, dropping those beyond the buffer."""
+    if not places:
+        return []
+    px, py = project_to_tile(
+        [p['lat'] for p in places], [p['lng'] for p in places], x, y, z, DEFAULT_EXTENT
+    )
+    inside = (
+        (px >= -MVT_BUFFER) & (px <= DEFAULT_EXTENT + MVT_BUFFER) &
+        (py >= -MVT_BUFFER) & (py <= DEFAULT_EXTENT + MVT_BUFFER)
+    )
+    return [
+        {'place': places[i], 'x': int(px[i]), 'y': int(py[i])}
+        for i in np.flatnonzero(inside)
+    ]
+
+
+def _competitor_features(competitors: List[Dict], z: int, x: int, y: int) -> List[Dict]:
+    return [
+        {
+            'id': i,
+            'x': item['x'],
+            'y': item['y'],
+            'properties': {
+                'name': item['place']['name'],
+                'type': item['place']['type'],
+            },
+        }
+        for i, item in enumerate(_project(competitors, z, x, y), 1)
+    ]
+
+
+def _landmark_features(landmarks: List[Dict], business_type: str, z: int, x: int, y: int) -> List[Dict]:
+    styles: Dict[str, Dict] = {}
+    features = []
+
+    for item in _project(landmarks, z, x, y):
+        landmark = item['place']
+        category = landmark['category']
+        if category not in styles:
+            styles[category] = get_marker_style(business_type, category)
+        style = styles[category]
+
+        if style['isLowRelevance'] and z < LOW_RELEVANCE_MIN_ZOOM:
+            continue
+
+        if style['isHighRelevance']:
+            tier = 'high'
+        elif style['isMediumRelevance']:
+            tier = 'medium'
+        else:
+            tier = 'low'
+
+        features.append({
+            'id': len(features) + 1,
+            'x': item['x'],
+            'y': item['y'],
+            'properties': {
+                'name': landmark['name'],
+                'category': category,
+                'relevance': float(style['relevance']),
+                'opacity': float(style['opacity']),
+                'scale': float(style['scale']),
+                'zIndex': style['zIndex'],
+                'tier': tier,
+            },
+        })
+
+    # Draw order: the renderer paints later features on top
+    features.sort(key=lambda f: f['properties']['zIndex'])
+    return features
+
+
+def get_vector_tile(z: int, x: int, y: int, business_type: str) -> Dict:
+    """
+    Build (or fetch from cache) the vector tile for a map tile.
+
+    Layers:
+        competitors: name, type
+        landmarks: name, category, relevance, opacity, scale, zIndex, tier
+
+    Args:
+        z, x, y: Tile coordinates
+        business_type: Business type whose competitors and relevance are used
+
+    Returns:
+        Dict with 'body' (tile bytes), 'etag', 'mimetype' and 'partial' (some
+        POI tiles failed to load; such tiles aren't cached)
+
+    Raises:
+        ValueError: For an invalid tile
+        TilesUnavailable: If no POI tile could be loaded
+    """
+    validate_tile(z, x, y)
+    business_type = business_type.lower()
+
+    cache_key = (z, x, y, business_type)
+    cached = _vector_tile_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # POI tiles under this tile, padded by the buffer
+    bounds = tile_bounds(x, y, z)
+    lat_pad = (bounds['north'] - bounds['south']) * MVT_BUFFER / DEFAULT_EXTENT
+    lng_pad = (bounds['east'] - bounds['west']) * MVT_BUFFER / DEFAULT_EXTENT
+    data_tiles = tiles_covering(
+        bounds['south'] - lat_pad, bounds['west'] - lng_pad,
+        bounds['north'] + lat_pad, bounds['east'] + lng_pad,
+        Config.TILE_ZOOM
+    )
+    by_category, missing = get_tiles_places(data_tiles, region_categories(business_type))
+
+    body = encode_tile({
+        'competitors': _competitor_features(merge_competitors(by_category, business_type), z, x, y),
+        'landmarks': _landmark_features(merge_landmarks(by_category), business_type, z, x, y),
+    })
+
+    tile = {'body': body, 'etag': hashlib.sha1(body).hexdigest(), 'mimetype': MVT_MIMETYPE, 'partial': bool(missing)}
+    if not missing:
+        _vector_tile_cache.set(cache_key, tile)
+    return tile
@@ -0,0 +1,434 @@
+"""
+Hotspot IQ - Warm-up Service
+Precomputes analyses for the curated MAJOR_AREAS x business types matrix.
+
+The job runs in a background thread at a controlled rate so upstream APIs
+(LatLong, Overpass) aren't flooded. Every analysis goes through the normal
+pipeline, which stores the result in the analysis cache and the underlying
+POI sets in the fetch caches.
+
+Progress and finished results are persisted next to the state file, so a
+restarted server resumes the matrix where it stopped and restores already
+computed analyses into the cache without calling any upstream API.
+
+Warm-up results are cached for WARMUP_CACHE_TTL. With WARMUP_LOOP the job
+keeps walking the matrix and recomputes each result before it expires; a
+full pass has to fit inside the TTL for that to work, which start() checks.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from config import Config, COMPETITOR_MAPPING
+from services.latlong_service import latlong_service
+from services.analysis_service import run_analysis, get_cached_analysis, cache_analysis
+from services.validation_service import ValidationError, TRANSIENT_ERROR_TYPES
+
+
+# Radius used by the frontend for major areas
+MAJOR_AREA_RADIUS = 2500
+
+
+class WarmupJob:
+    """Background job that walks the MAJOR_AREAS x business type matrix."""
+
+    def __init__(self, state_file: str = None, rate_per_minute: float = None,
+                 cache_ttl: float = None, loop: bool = None):
+        self.state_file = state_file or Config.WARMUP_STATE_FILE
+        self.results_dir = os.path.join(os.path.dirname(self.state_file), 'warmup_results')
+        self.rate_per_minute = rate_per_minute or Config.WARMUP_RATE_PER_MIN
+        self.cache_ttl = cache_ttl or Config.WARMUP_CACHE_TTL
+        self.loop = Config.WARMUP_LOOP if loop is None else loop
+        # item id -> when its persisted result was computed
+        self._saved_at: Dict[str, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+        self._progress = {
+            'running': False,
+            'pass': 0,
+            'total': 0,
+            'computed': 0,
+            'restored': 0,
+            'invalid': 0,
+            'failed': 0,
+            'current': None,
+            'started_at': None,
+            'finished_at': None,
+            'next_pass_at': None,
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict:
+        """Load persisted progress (completed items, failures, geocodes)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return {
+                'completed': state.get('completed', []),
+                'invalid': state.get('invalid', {}),
+                'failed': state.get('failed', {}),
+                'coordinates': state.get('coordinates', {}),
+            }
+        except (OSError, ValueError):
+            return {'completed': [], 'invalid': {}, 'failed': {}, 'coordinates': {}}
+
+    def _write_json(self, path: str, data) -> None:
+        """Write JSON atomically so a crash never leaves a torn file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _save_state(self) -> None:
+        try:
+            self._write_json(self.state_file, self._state)
+        except OSError as e:
+            print(f"⚠️ Could not save warm-up state: {e}")
+
+    def _result_path(self, item_id: str) -> str:
+        digest = hashlib.sha1(item_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.results_dir, f"{digest}.json")
+
+    def _save_result(self, item: Dict, coords: Dict, response: Dict) -> None:
+        saved_at = time.time()
+        self._saved_at[item['id']] = saved_at
+        try:
+            self._write_json(self._result_path(item['id']), {
+                'coords': coords,
+                'saved_at': saved_at,
+                'response': response,
+            })
+        except OSError as e:
+            print(f"⚠️ Could not save warm-up result for {item['id']}: {e}")
+
+    def _restore_result(self, item: Dict, max_age: float) -> bool:
+        """
+        Load a persisted result into the analysis cache for the rest of its TTL.
+
+        Args:
+            item: Warm-up item
+            max_age: Results older than this (seconds) are due for a refresh
+                     and are not restored
+
+        Returns:
+            True if a fresh enough result was restored
+        """
+        try:
+            with open(self._result_path(item['id']), 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        saved_at = stored.get('saved_at', 0)
+        age = time.time() - saved_at
+        if age > max_age:
+            return False
+
+        self._saved_at[item['id']] = saved_at
+        coords = stored['coords']
+        cache_analysis(coords['lat'], coords['lng'], item['business_type'], item['radius'],
+                       stored['response'], ttl=self.cache_ttl - age)
+        return True
+
+    # ------------------------------------------------------------------
+    # Matrix
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def build_matrix(cities: List[str] = None, business_types: List[str] = None,
+                     radius: int = MAJOR_AREA_RADIUS) -> List[Dict]:
+        """
+        Build the list of warm-up items.
+
+        Args:
+            cities: Optional subset of MAJOR_AREAS cities
+            business_types: Optional subset of COMPETITOR_MAPPING keys
+            radius: Analysis radius in meters
+
+        Returns:
+            List of items with id, city, area, name, business_type, radius
+        """
+        types = business_types or list(COMPETITOR_MAPPING.keys())
+        city_filter = {c.lower() for c in cities} if cities else None
+
+        items = []
+        for area in latlong_service.iter_major_areas():
+            if city_filter and area['city'] not in city_filter:
+                continue
+            for business_type in types:
+                items.append({
+                    'id': f"{area['city']}:{area['area']}:{business_type}:{radius}",
+                    'city': area['city'],
+                    'area': area['area'],
+                    'name': area['name'],
+                    'business_type': business_type,
+                    'radius': radius,
+                })
+        return items
+
+    def _resolve_coordinates(self, name: str) -> Optional[Dict]:
+        """Geocode an area name the same way the frontend does, memoized in state."""
+        coords = self._state['coordinates'].get(name)
+        if coords:
+            return coords
+
+        result = latlong_service.geocode(name)
+        if 'error' in result or not result.get('lat') or not result.get('lng'):
+            return None
+
+        coords = {'lat': result['lat'], 'lng': result['lng']}
+        self._state['coordinates'][name] = coords
+        return coords
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _interval(self) -> float:
+        """Seconds between upstream analyses at the configured rate."""
+        return 60.0 / self.rate_per_minute if self.rate_per_minute > 0 else 0
+
+    def pass_seconds(self, count: int) -> float:
+        """Worst-case duration of one pass over count items (all recomputed)."""
+        return count * self._interval()
+
+    def _check_rate(self, count: int) -> None:
+        """Warn when a pass can't finish before the first results expire."""
+        pass_seconds = self.pass_seconds(count)
+        if pass_seconds <= self.cache_ttl:
+            return
+
+        min_rate = count * 60.0 / self.cache_ttl
+        print(f"⚠️ Warm-up of {count} items takes ~{pass_seconds / 3600:.1f}h at "
+              f"{self.rate_per_minute}/min, longer than WARMUP_CACHE_TTL "
+              f"({self.cache_ttl / 3600:.1f}h) - results will expire before they are refreshed. "
+              f"Raise WARMUP_RATE_PER_MIN to at least {min_rate:.1f} or WARMUP_CACHE_TTL.")
+
+    def _next_refresh_in(self, items: List[Dict], refresh_after: float) -> Optional[float]:
+        """Seconds until the oldest warm result of items is due, None if there are none."""
+        due = [self._saved_at[item['id']] + refresh_after for item in items if item['id'] in self._saved_at]
+        if not due:
+            return None
+        return max(min(due) - time.time(), 0)
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def start(self, cities: List[str] = None, business_types: List[str] = None,
+              radius: int = MAJOR_AREA_RADIUS, resume: bool = True) -> bool:
+        """
+        Start the warm-up in a background thread.
+
+        Args:
+            cities: Optional subset of cities
+            business_types: Optional subset of business types
+            radius: Analysis radius in meters
+            resume: Reuse results and verdicts persisted by a previous run
+
+        Returns:
+            False if a run is already in progress
+        """
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return False
+
+            if not resume:
+                self._state['completed'] = []
+                self._state['invalid'] = {}
+                self._state['failed'] = {}
+
+            items = self.build_matrix(cities, business_types, radius)
+            self._check_rate(len(items))
+            self._stop_event.clear()
+            self._progress.update({
+                'running': True,
+                'pass': 0,
+                'total': len(items),
+                'current': None,
+                'finished_at': None,
+                'next_pass_at': None,
+            })
+
+            self._thread = threading.Thread(target=self.run, args=(items,), daemon=True, name='warmup')
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        """Ask the running job to stop after the current item."""
+        self._stop_event.set()
+
+    def join(self, timeout: float = None) -> None:
+        """Block until the background run finishes."""
+        if self._thread:
+            self._thread.join(timeout)
+
+    def run(self, items: List[Dict]) -> None:
+        """
+        Process warm-up items at the configured rate, pass after pass with
+        WARMUP_LOOP, until stopped.
+
+        Each pass recomputes results older than WARMUP_CACHE_TTL minus one
+        pass, so they are refreshed before they expire; younger ones are only
+        restored. Between passes the job sleeps until the oldest result is due.
+        """
+        refresh_after = max(self.cache_ttl - self.pass_seconds(len(items)), 0)
+
+        print(f"🔥 Warm-up started: {len(items)} items, {self.rate_per_minute}/min, "
+              f"refresh after {refresh_after / 3600:.1f}h")
+
+        while True:
+            attempted = self._run_pass(items, refresh_after)
+            if not self.loop or self._stop_event.is_set():
+                break
+
+            # A pass that called no upstream API means everything is warm -
+            # sleep until the oldest result needs refreshing
+            wait = 0.0
+            if not attempted:
+                wait = self._next_refresh_in(items, refresh_after)
+                if wait is None:
+                    break
+            self._progress['next_pass_at'] = time.time() + wait
+            if self._stop_event.wait(max(wait, self._interval())):
+                break
+
+        self._progress.update({
+            'running': False,
+            'current': None,
+            'finished_at': time.time(),
+            'next_pass_at': None,
+        })
+
+    def _run_pass(self, items: List[Dict], refresh_after: float) -> int:
+        """
+        Walk the matrix once.
+
+        Args:
+            items: Warm-up items
+            refresh_after: Age (seconds) past which a result is recomputed
+
+        Returns:
+            Number of items that needed upstream calls
+        """
+        interval = self._interval()
+        completed = set(self._state['completed'])
+        attempted = 0
+
+        self._progress.update({
+            'pass': self._progress['pass'] + 1,
+            'computed': 0,
+            'restored': 0,
+            'invalid': 0,
+            'failed': 0,
+            'started_at': time.time(),
+            'next_pass_at': None,
+        })
+
+        for item in items:
+            if self._stop_event.is_set():
+                break
+
+            # Areas that failed validation before won't pass now - skip them
+            if item['id'] in self._state['invalid']:
+                self._progress['invalid'] += 1
+                continue
+
+            # Finished earlier and not yet due - restore locally, no upstream calls
+            refresh = item['id'] in completed
+            if refresh and self._restore_result(item, refresh_after):
+                self._progress['restored'] += 1
+                continue
+
+            self._progress['current'] = item['id']
+            started = time.time()
+            attempted += 1
+
+            try:
+                coords = self._resolve_coordinates(item['name'])
+                if coords is None:
+                    raise ValueError(f"Could not geocode '{item['name']}'")
+
+                # A due result may still sit in the analysis cache - bypass it
+                response = None if refresh else get_cached_analysis(
+                    coords['lat'], coords['lng'], item['business_type'], item['radius'])
+                if response is None:
+                    response = run_analysis(coords['lat'], coords['lng'], item['business_type'], item['radius'],
+                                            use_cache=False)
+
+                # Budget-truncated analyses are not cached - retry on the next run
+                if response.get('partial'):
+                    raise ValueError("Analysis was partial (request budget exhausted)")
+
+                cache_analysis(coords['lat'], coords['lng'], item['business_type'], item['radius'],
+                               response, ttl=self.cache_ttl)
+                self._save_result(item, coords, response)
+                if item['id'] not in completed:
+                    completed.add(item['id'])
+                    self._state['completed'].append(item['id'])
+                self._state['failed'].pop(item['id'], None)
+                self._progress['computed'] += 1
+
+            except ValidationError as e:
+                # Upstream outages aren't verdicts on the area - retry those
+                if e.error_type in TRANSIENT_ERROR_TYPES:
+                    print(f"⚠️ Warm-up validation unavailable for {item['id']}: {e.message}")
+                    self._state['failed'][item['id']] = e.message
+                    self._progress['failed'] += 1
+                else:
+                    self._state['invalid'][item['id']] = e.message
+                    self._state['failed'].pop(item['id'], None)
+                    self._progress['invalid'] += 1
+
+            except Exception as e:
+                print(f"⚠️ Warm-up failed for {item['id']}: {e}")
+                self._state['failed'][item['id']] = str(e)
+                self._progress['failed'] += 1
+
+            self._save_state()
+
+            # Throttle to the configured upstream rate
+            remaining = interval - (time.time() - started)
+            if remaining > 0 and self._stop_event.wait(remaining):
+                break
+
+        self._progress['current'] = None
+        print(f"🔥 Warm-up pass {self._progress['pass']} finished: {self._progress['computed']} computed, "
+              f"{self._progress['restored']} restored, {self._progress['invalid']} invalid, "
+              f"{self._progress['failed']} failed")
+        return attempted
+
+    def status(self) -> Dict:
+        """Return progress of the current (or last) pass."""
+        progress = dict(self._progress)
+        processed = progress['computed'] + progress['restored'] + progress['invalid'] + progress['failed']
+        progress['processed'] = processed
+        progress['percent'] = round(100 * processed / progress['total'], 1) if progress['total'] else 0.0
+
+        if progress['running'] and progress['computed'] and progress['started_at']:
+            elapsed = time.time() - progress['started_at']
+            per_item = elapsed / progress['computed']
+            progress['eta_seconds'] = round(per_item * (progress['total'] - processed))
+        else:
+            progress['eta_seconds'] = None
+
+        progress['completed_total'] = len(self._state['completed'])
+        progress['failed_items'] = dict(list(self._state['failed'].items())[-20:])
+        progress['rate_per_minute'] = self.rate_per_minute
+        progress['pass_seconds'] = round(self.pass_seconds(progress['total']))
+        progress['cache_ttl'] = self.cache_ttl
+        progress['loop'] = self.loop
+        return progress
+
+
+# Create singleton instance
+warmup_job = WarmupJob()
@@ -0,0 +1,238 @@
+"""
+Hotspot IQ - Admission Control
+Upstream quotas and the bounded queue in front of the analysis endpoints.
+
+Every upstream (Overpass, LatLong, Nominatim) gets a token bucket sized to
+its quota: calls beyond the burst wait for the next token instead of
+hitting the upstream and being rate limited, so bursts of requests settle
+at the quota rate rather than all retrying at once. Calls that would wait
+longer than UPSTREAM_MAX_WAIT are refused. Waits are reserved in arrival
+order.
+
+Analyses go through an AdmissionQueue: a fixed number run at once, a
+bounded number wait in FIFO order, and anything beyond that is turned away
+immediately with a Retry-After estimate from recent service times.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional
+from config import Config
+
+
+# Recent queue/service times kept for metrics and Retry-After estimates
+METRICS_WINDOW = 200
+
+# Retry-After bounds in seconds
+MIN_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket; a rate of 0 means unlimited."""
+
+    def __init__(self, name: str, rate_per_minute: float, burst: int):
+        self.name = name
+        self.rate_per_minute = rate_per_minute
+        self.capacity = max(1, burst)
+        self._rate = rate_per_minute / 60.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self, max_wait: float) -> bool:
+        """
+        Take a token, waiting up to max_wait seconds for one.
+
+        Returns:
+            True once a token is taken, False if it would take longer than max_wait
+        """
+        if self._rate <= 0:
+            return True
+
+        with self._lock:
+            self._refill()
+            wait = max(0.0, (1 - self._tokens) / self._rate)
+            if wait > max_wait:
+                self.rejected += 1
+                return False
+            # Reserve the token now so later callers queue behind this one
+            self._tokens -= 1
+            self.granted += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def stats(self) -> Dict:
+        """Quota, tokens available and grant/delay/reject counters."""
+        with self._lock:
+            self._refill()
+            return {
+                'name': self.name,
+                'rate_per_minute': self.rate_per_minute,
+                'burst': self.capacity,
+                'tokens': round(self._tokens, 2),
+                'granted': self.granted,
+                'delayed': self.delayed,
+                'rejected': self.rejected,
+                'wait_seconds': round(self.wait_seconds, 2),
+            }
+
+
+class QueueFull(Exception):
+    """An analysis was turned away; retry after retry_after seconds."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Server busy, retry in {retry_after}s")
+
+
+class AdmissionQueue:
+    """Runs at most max_active jobs at once with a bounded FIFO wait queue."""
+
+    def __init__(self, name: str, max_active: int, max_waiting: int, max_wait: float):
+        self.name = name
+        self.max_active = max(1, max_active)
+        self.max_waiting = max(0, max_waiting)
+        self.max_wait = max_wait
+        self.active = 0
+        self._waiters: Deque[threading.Event] = deque()
+        self._lock = threading.Lock()
+        self._queue_times: Deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._service_times: Deque[float] = deque(maxlen=METRICS_WINDOW)
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _retry_after(self) -> int:
+        """Seconds until a slot is likely free for a newcomer (lock held)."""
+        if not self._service_times:
+            return MIN_RETRY_AFTER * 5
+        service = sum(self._service_times) / len(self._service_times)
+        estimate = service * (len(self._waiters) + 1) / self.max_active
+        return int(min(MAX_RETRY_AFTER, max(MIN_RETRY_AFTER, math.ceil(estimate))))
+
+    @contextmanager
+    def admit(self):
+        """
+        Hold a slot for the duration of the block.
+
+        Yields:
+            Seconds spent waiting in the queue
+
+        Raises:
+            QueueFull: If the queue is full, or no slot frees up within max_wait
+        """
+        arrived = time.monotonic()
+        waiter: Optional[threading.Event] = None
+
+        with self._lock:
+            if self.active < self.max_active and not self._waiters:
+                self.active += 1
+            elif len(self._waiters) >= self.max_waiting:
+                self.rejected += 1
+                raise QueueFull(self._retry_after())
+            else:
+                waiter = threading.Event()
+                self._waiters.append(waiter)
+
+        if waiter is not None and not waiter.wait(self.max_wait):
+            with self._lock:
+                # The slot may have been handed over just after the timeout
+                if not waiter.is_set():
+                    self._waiters.remove(waiter)
+                    self.timed_out += 1
+                    raise QueueFull(self._retry_after())
+
+        started = time.monotonic()
+        with self._lock:
+            self.admitted += 1
+            self._queue_times.append(started - arrived)
+
+        try:
+            yield started - arrived
+        finally:
+            with self._lock:
+                self._service_times.append(time.monotonic() - started)
+                if self._waiters:
+                    # Hand the slot straight to the longest waiter
+                    self._waiters.popleft().set()
+                else:
+                    self.active -= 1
+
+    def stats(self) -> Dict:
+        """Occupancy, counters and recent queue/service times in seconds."""
+        with self._lock:
+            queue_times = sorted(self._queue_times)
+            service_times = list(self._service_times)
+            return {
+                'name': self.name,
+                'active': self.active,
+                'waiting': len(self._waiters),
+                'max_active': self.max_active,
+                'max_waiting': self.max_waiting,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'queue_seconds': {
+                    'mean': round(sum(queue_times) / len(queue_times), 3) if queue_times else 0.0,
+                    'p95': round(queue_times[int(0.95 * (len(queue_times) - 1))], 3) if queue_times else 0.0,
+                    'max': round(queue_times[-1], 3) if queue_times else 0.0,
+                },
+                'service_seconds_mean': round(sum(service_times) / len(service_times), 3) if service_times else 0.0,
+                'retry_after': self._retry_after(),
+            }
+
+
+# Quotas per upstream
+UPSTREAM_BUCKETS: Dict[str, TokenBucket] = {
+    'overpass': TokenBucket('overpass', Config.OVERPASS_RATE_PER_MIN, Config.OVERPASS_BURST),
+    'latlong': TokenBucket('latlong', Config.LATLONG_RATE_PER_MIN, Config.LATLONG_BURST),
+    'nominatim': TokenBucket('nominatim', Config.NOMINATIM_RATE_PER_MIN, Config.NOMINATIM_BURST),
+}
+
+# Shared by /api/analyze and /api/analyze/compare
+analyze_queue = AdmissionQueue(
+    'analyze', Config.ANALYZE_MAX_CONCURRENT, Config.ANALYZE_MAX_QUEUE, Config.ANALYZE_QUEUE_TIMEOUT
+)
+
+
+def acquire_upstream(upstream: str, max_wait: Optional[float] = None) -> bool:
+    """
+    Wait for a call slot in an upstream's quota.
+
+    Args:
+        upstream: 'overpass', 'latlong' or 'nominatim' (others are unlimited)
+        max_wait: Longest wait in seconds (default: Config.UPSTREAM_MAX_WAIT)
+
+    Returns:
+        True if the call may go ahead
+    """
+    bucket = UPSTREAM_BUCKETS.get(upstream)
+    if bucket is None:
+        return True
+    return bucket.acquire(Config.UPSTREAM_MAX_WAIT if max_wait is None else max_wait)
+
+
+def admission_stats() -> Dict:
+    """Analysis queue and upstream quota metrics."""
+    return {
+        'analyze_queue': analyze_queue.stats(),
+        'upstreams': {name: bucket.stats() for name, bucket in UPSTREAM_BUCKETS.items()},
+    }
@@ -0,0 +1,210 @@
+"""
+Hotspot IQ - Hierarchical Point Clustering
+Supercluster-style marker clustering: points are clustered once for every
+zoom level, from the most detailed level down, so a (bbox, zoom) query is a
+single filter over a precomputed level.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional
+
+
+class ClusterIndex:
+    """
+    Greedy radius clustering of points for every zoom level.
+
+    Each level is built from the one above it. A node (point or cluster)
+    absorbs every unvisited node within `radius` pixels; the cluster sits
+    at the count-weighted centroid and carries per-category counts.
+    """
+
+    def __init__(
+        self,
+        points: List[Dict],
+        radius: float = 60,
+        extent: int = 512,
+        min_zoom: int = 0,
+        max_zoom: int = 17,
+        min_points: int = 2
+    ):
+        """
+        Args:
+            points: Dicts with lat, lng and category (other keys are kept on leaves)
+            radius: Cluster radius in pixels
+            extent: Tile size in pixels the radius refers to
+            min_zoom: Lowest zoom level clustered
+            max_zoom: Highest zoom level clustered (above it points are returned as-is)
+            min_points: Minimum number of points forming a cluster
+        """
+        self.radius = radius
+        self.extent = extent
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.min_points = min_points
+        self.points = points
+
+        self.categories = list(dict.fromkeys(p['category'] for p in points))
+        category_index = {c: i for i, c in enumerate(self.categories)}
+
+        count = len(points)
+        lats = np.array([p['lat'] for p in points], dtype=np.float64)
+        lngs = np.array([p['lng'] for p in points], dtype=np.float64)
+        category_counts = np.zeros((count, len(self.categories)), dtype=np.int64)
+        if count:
+            category_counts[np.arange(count), [category_index[p['category']] for p in points]] = 1
+
+        # Leaves live one level above max_zoom
+        self._levels: Dict[int, Dict[str, np.ndarray]] = {}
+        self._levels[max_zoom + 1] = {
+            'x': _lng_x(lngs),
+            'y': _lat_y(lats),
+            'count': np.ones(count, dtype=np.int64),
+            'categories': category_counts,
+            'id': np.arange(count, dtype=np.int64),
+            'expansion_zoom': np.full(count, max_zoom + 1, dtype=np.int64),
+            'point': np.arange(count, dtype=np.int64),
+        }
+        self._next_id = count
+
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            self._levels[zoom] = self._cluster(self._levels[zoom + 1], zoom)
+
+    def _cluster(self, level: Dict[str, np.ndarray], zoom: int) -> Dict[str, np.ndarray]:
+        """Cluster the nodes of the level above into the nodes of `zoom`."""
+        r = self.radius / (self.extent * 2 ** zoom)
+        xs, ys, counts = level['x'].tolist(), level['y'].tolist(), level['count'].tolist()
+
+        # Bucket nodes into r-sized cells so neighbours are found in 3x3 cells
+        grid: Dict[tuple, List[int]] = {}
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            grid.setdefault((int(x // r), int(y // r)), []).append(i)
+
+        visited = [False] * len(xs)
+        groups: List[List[int]] = []
+        r2 = r * r
+        for i in range(len(xs)):
+            if visited[i]:
+                continue
+            visited[i] = True
+            x, y = xs[i], ys[i]
+            cx, cy = int(x // r), int(y // r)
+
+            neighbours = [
+                j
+                for gx in (cx - 1, cx, cx + 1)
+                for gy in (cy - 1, cy, cy + 1)
+                for j in grid.get((gx, gy), ())
+                if not visited[j] and (xs[j] - x) ** 2 + (ys[j] - y) ** 2 <= r2
+            ]
+
+            if neighbours and counts[i] + sum(counts[j] for j in neighbours) >= self.min_points:
+                for j in neighbours:
+                    visited[j] = True
+                groups.append([i] + neighbours)
+            else:
+                groups.append([i])
+
+        size = len(groups)
+        out = {
+            'x': np.empty(size),
+            'y': np.empty(size),
+            'count': np.empty(size, dtype=np.int64),
+            'categories': np.empty((size, len(self.categories)), dtype=np.int64),
+            'id': np.empty(size, dtype=np.int64),
+            'expansion_zoom': np.empty(size, dtype=np.int64),
+            'point': np.empty(size, dtype=np.int64),
+        }
+        for k, members in enumerate(groups):
+            if len(members) == 1:
+                # Node carried over unchanged
+                for key in out:
+                    out[key][k] = level[key][members[0]]
+                continue
+
+            weights = level['count'][members]
+            total = int(weights.sum())
+            out['x'][k] = float((level['x'][members] * weights).sum() / total)
+            out['y'][k] = float((level['y'][members] * weights).sum() / total)
+            out['count'][k] = total
+            out['categories'][k] = level['categories'][members].sum(axis=0)
+            out['id'][k] = self._next_id
+            out['expansion_zoom'][k] = zoom + 1
+            out['point'][k] = -1
+            self._next_id += 1
+        return out
+
+    def get_clusters(
+        self,
+        zoom: float,
+        bbox: Optional[Dict[str, float]] = None
+    ) -> List[Dict]:
+        """
+        Get clusters and single points visible in a bounding box at a zoom level.
+
+        Args:
+            zoom: Map zoom level (fractional zooms are floored)
+            bbox: Optional dict with south, west, north, east (default: everything)
+
+        Returns:
+            List of clusters ({type: 'cluster', id, lat, lng, count,
+            dominant_category, categories, expansion_zoom}) and points
+            ({type: 'point', ...original point})
+        """
+        z = max(self.min_zoom, min(int(math.floor(zoom)), self.max_zoom + 1))
+        level = self._levels[z]
+
+        if bbox is not None:
+            min_x, max_x = _lng_x(bbox['west']), _lng_x(bbox['east'])
+            min_y, max_y = _lat_y(bbox['north']), _lat_y(bbox['south'])
+            mask = (
+                (level['x'] >= min_x) & (level['x'] <= max_x) &
+                (level['y'] >= min_y) & (level['y'] <= max_y)
+            )
+            indices = np.flatnonzero(mask)
+        else:
+            indices = np.arange(level['x'].size)
+
+        results = []
+        for i in indices.tolist():
+            point = int(level['point'][i])
+            if point >= 0:
+                results.append({'type': 'point', **self.points[point]})
+                continue
+
+            counts = level['categories'][i]
+            categories = {
+                self.categories[c]: int(counts[c])
+                for c in np.flatnonzero(counts)
+            }
+            results.append({
+                'type': 'cluster',
+                'id': int(level['id'][i]),
+                'lat': round(float(_y_lat(level['y'][i])), 6),
+                'lng': round(float(_x_lng(level['x'][i])), 6),
+                'count': int(level['count'][i]),
+                'dominant_category': self.categories[int(counts.argmax())],
+                'categories': categories,
+                'expansion_zoom': int(level['expansion_zoom'][i]),
+            })
+        return results
+
+
+# Spherical Mercator in the unit square (x east, y south)
+
+def _lng_x(lng):
+    return np.asarray(lng, dtype=np.float64) / 360.0 + 0.5
+
+
+def _lat_y(lat):
+    sin = np.sin(np.radians(np.asarray(lat, dtype=np.float64)))
+    y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / math.pi
+    return np.clip(y, 0.0, 1.0)
+
+
+def _x_lng(x):
+    return (x - 0.5) * 360.0
+
+
+def _y_lat(y):
+    return np.degrees(np.arctan(np.sinh(math.pi * (1 - 2 * y))))
@@ -0,0 +1,91 @@
+"""
+Hotspot IQ - Response Compression
+gzip / brotli negotiation for API responses.
+
+Brotli is used when the optional `brotli` package is installed and the client
+accepts it; otherwise gzip. Compressed representations get their own ETag
+(suffixed with the encoding), so strong validators stay correct.
+"""
+
+import gzip
+from typing import List, Optional
+from flask import Request, Response
+from config import Config
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+
+# Mimetypes worth compressing (PNG tiles are already deflated)
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/vnd.mapbox-vector-tile',
+    'text/html',
+    'text/plain',
+    'text/csv',
+}
+
+
+def available_encodings() -> List[str]:
+    """Encodings this server can produce, preferred first."""
+    return (['br'] if brotli is not None else []) + ['gzip']
+
+
+def choose_encoding(request: Request) -> Optional[str]:
+    """Pick the best encoding the client accepts, or None."""
+    best, best_quality = None, 0
+    for encoding in available_encodings():
+        quality = request.accept_encodings.quality(encoding)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def etag_variants(etag: str) -> List[str]:
+    """An ETag and the ETags of its compressed representations."""
+    return [etag] + [f"{etag}-{encoding}" for encoding in available_encodings()]
+
+
+def compress_response(request: Request, response: Response) -> Response:
+    """
+    Compress a response in place if the client accepts it and it is worth it.
+
+    Streamed, already-encoded, small and non-compressible responses are left
+    untouched.
+    """
+    response.vary.add('Accept-Encoding')
+
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < Config.COMPRESS_MIN_BYTES:
+        return response
+
+    encoding = choose_encoding(request)
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        compressed = brotli.compress(data, quality=Config.BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(data, compresslevel=Config.GZIP_LEVEL)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{encoding}", weak)
+
+    return response
@@ -0,0 +1,244 @@
+"""
+Hotspot IQ - DIGIPIN Encoder/Decoder
+Pure-local implementation of India Post's DIGIPIN grid encoding.
+
+DIGIPIN divides the bounding box 2.5°N-38.5°N / 63.5°E-99.5°E into a 4x4 grid
+ten times over, labelling each cell with one of 16 symbols. The resulting
+10-character code (formatted XXX-XXX-XXXX) identifies a ~3.8m x 3.8m cell and is
+fully deterministic, so it can be used as a stable spatial key for caching
+and sharding across workers.
+
+Reference: https://github.com/CEPT-VZG-IT-Development-Cell/DIGIPIN
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+# Symbol grid (row 0 is the northern-most row)
+DIGIPIN_GRID = [
+    ['F', 'C', '9', '8'],
+    ['J', '3', '2', '7'],
+    ['K', '4', '5', '6'],
+    ['L', 'M', 'P', 'T'],
+]
+
+# Bounding box covered by DIGIPIN
+DIGIPIN_BOUNDS = {
+    'min_lat': 2.5,
+    'max_lat': 38.5,
+    'min_lng': 63.5,
+    'max_lng': 99.5,
+}
+
+DIGIPIN_LEVELS = 10
+
+# Reverse lookup: symbol -> (row, col)
+_SYMBOL_POSITIONS: Dict[str, Tuple[int, int]] = {
+    symbol: (row, col)
+    for row, symbols in enumerate(DIGIPIN_GRID)
+    for col, symbol in enumerate(symbols)
+}
+
+# Flattened grid for vectorized lookups (index = row * 4 + col)
+_SYMBOL_ARRAY = np.array([s for row in DIGIPIN_GRID for s in row])
+
+
+def is_within_bounds(lat: float, lng: float) -> bool:
+    """Check whether a coordinate falls inside the DIGIPIN bounding box."""
+    return (
+        DIGIPIN_BOUNDS['min_lat'] <= lat <= DIGIPIN_BOUNDS['max_lat'] and
+        DIGIPIN_BOUNDS['min_lng'] <= lng <= DIGIPIN_BOUNDS['max_lng']
+    )
+
+
+def _format_code(symbols: str) -> str:
+    """Insert the standard separators: XXX-XXX-XXXX."""
+    return f"{symbols[:3]}-{symbols[3:6]}-{symbols[6:]}"
+
+
+def _check_level(level: int) -> None:
+    if not isinstance(level, int) or not 1 <= level <= DIGIPIN_LEVELS:
+        raise ValueError(f"level must be an integer from 1 to {DIGIPIN_LEVELS}, got {level!r}")
+
+
+def encode(lat: float, lng: float, level: int = DIGIPIN_LEVELS) -> str:
+    """
+    Encode a coordinate into a DIGIPIN code.
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+        level: Number of subdivision levels (1-10, default: 10)
+
+    Returns:
+        DIGIPIN code, e.g. "39J-438-TJC7" (separators only for full codes)
+
+    Raises:
+        ValueError: If the coordinate is outside the DIGIPIN bounding box,
+            or level is not 1-10
+    """
+    _check_level(level)
+    if not is_within_bounds(lat, lng):
+        raise ValueError(f"Coordinate ({lat}, {lng}) is outside the DIGIPIN bounding box")
+
+    min_lat, max_lat = DIGIPIN_BOUNDS['min_lat'], DIGIPIN_BOUNDS['max_lat']
+    min_lng, max_lng = DIGIPIN_BOUNDS['min_lng'], DIGIPIN_BOUNDS['max_lng']
+
+    symbols = []
+    for _ in range(level):
+        lat_div = (max_lat - min_lat) / 4
+        lng_div = (max_lng - min_lng) / 4
+
+        # Rows are counted from the north, columns from the west
+        row = 3 - int((lat - min_lat) // lat_div)
+        col = int((lng - min_lng) // lng_div)
+        row = max(0, min(row, 3))
+        col = max(0, min(col, 3))
+
+        symbols.append(DIGIPIN_GRID[row][col])
+
+        max_lat = min_lat + lat_div * (4 - row)
+        min_lat = min_lat + lat_div * (3 - row)
+        min_lng = min_lng + lng_div * col
+        max_lng = min_lng + lng_div
+
+    code = ''.join(symbols)
+    return _format_code(code) if level == DIGIPIN_LEVELS else code
+
+
+def decode_bounds(code: str) -> Dict[str, float]:
+    """
+    Decode a DIGIPIN (full or prefix) into the bounds of its cell.
+
+    Args:
+        code: DIGIPIN code, with or without separators
+
+    Returns:
+        Dict with min_lat, max_lat, min_lng, max_lng
+
+    Raises:
+        ValueError: If the code contains invalid symbols or is too long
+    """
+    symbols = code.replace('-', '').strip().upper()
+
+    if not symbols or len(symbols) > DIGIPIN_LEVELS:
+        raise ValueError(f"Invalid DIGIPIN '{code}'")
+
+    min_lat, max_lat = DIGIPIN_BOUNDS['min_lat'], DIGIPIN_BOUNDS['max_lat']
+    min_lng, max_lng = DIGIPIN_BOUNDS['min_lng'], DIGIPIN_BOUNDS['max_lng']
+
+    for symbol in symbols:
+        position = _SYMBOL_POSITIONS.get(symbol)
+        if position is None:
+            raise ValueError(f"Invalid DIGIPIN symbol '{symbol}' in '{code}'")
+        row, col = position
+
+        lat_div = (max_lat - min_lat) / 4
+        lng_div = (max_lng - min_lng) / 4
+
+        max_lat, min_lat = max_lat - lat_div * row, max_lat - lat_div * (row + 1)
+        min_lng, max_lng = min_lng + lng_div * col, min_lng + lng_div * (col + 1)
+
+    return {
+        'min_lat': min_lat,
+        'max_lat': max_lat,
+        'min_lng': min_lng,
+        'max_lng': max_lng,
+    }
+
+
+def decode(code: str) -> Tuple[float, float]:
+    """
+    Decode a DIGIPIN into the center coordinate of its cell.
+
+    Args:
+        code: DIGIPIN code, with or without separators
+
+    Returns:
+        Tuple of (lat, lng) rounded to 6 decimal places
+    """
+    bounds = decode_bounds(code)
+    lat = (bounds['min_lat'] + bounds['max_lat']) / 2
+    lng = (bounds['min_lng'] + bounds['max_lng']) / 2
+    return round(lat, 6), round(lng, 6)
+
+
+def encode_batch(lats, lngs, level: int = DIGIPIN_LEVELS) -> List[str]:
+    """
+    Vectorized DIGIPIN encoding for many points at once.
+
+    Runs the same subdivision as encode() on NumPy arrays, so thousands of
+    points are encoded in a handful of array operations per level.
+
+    Args:
+        lats: Sequence of latitudes
+        lngs: Sequence of longitudes
+        level: Number of subdivision levels (1-10, default: 10)
+
+    Returns:
+        List of DIGIPIN codes; points outside the bounding box get None
+
+    Raises:
+        ValueError: If the arrays differ in length or level is not 1-10
+    """
+    _check_level(level)
+    lat = np.asarray(lats, dtype=np.float64)
+    lng = np.asarray(lngs, dtype=np.float64)
+
+    if lat.shape != lng.shape:
+        raise ValueError("lats and lngs must have the same length")
+
+    valid = (
+        (lat >= DIGIPIN_BOUNDS['min_lat']) & (lat <= DIGIPIN_BOUNDS['max_lat']) &
+        (lng >= DIGIPIN_BOUNDS['min_lng']) & (lng <= DIGIPIN_BOUNDS['max_lng'])
+    )
+
+    min_lat = np.full(lat.shape, DIGIPIN_BOUNDS['min_lat'])
+    max_lat = np.full(lat.shape, DIGIPIN_BOUNDS['max_lat'])
+    min_lng = np.full(lng.shape, DIGIPIN_BOUNDS['min_lng'])
+    max_lng = np.full(lng.shape, DIGIPIN_BOUNDS['max_lng'])
+
+    indices = np.empty((level, lat.size), dtype=np.int64)
+
+    for step in range(level):
+        lat_div = (max_lat - min_lat) / 4
+        lng_div = (max_lng - min_lng) / 4
+
+        row = np.clip(3 - np.floor((lat - min_lat) / lat_div), 0, 3).astype(np.int64)
+        col = np.clip(np.floor((lng - min_lng) / lng_div), 0, 3).astype(np.int64)
+
+        indices[step] = row * 4 + col
+
+        max_lat = min_lat + lat_div * (4 - row)
+        min_lat = min_lat + lat_div * (3 - row)
+        min_lng = min_lng + lng_div * col
+        max_lng = min_lng + lng_div
+
+    # Join symbols column-wise: one string per point
+    symbols = _SYMBOL_ARRAY[indices]
+    codes = [''.join(column) for column in symbols.T]
+
+    if level == DIGIPIN_LEVELS:
+        codes = [_format_code(code) for code in codes]
+
+    return [code if ok else None for code, ok in zip(codes, valid.tolist())]
+
+
+def decode_batch(codes: List[str]) -> List[Tuple[float, float]]:
+    """
+    Decode many DIGIPIN codes into cell centers.
+
+    Args:
+        codes: List of DIGIPIN codes
+
+    Returns:
+        List of (lat, lng) tuples; invalid codes get None
+    """
+    results = []
+    for code in codes:
+        try:
+            results.append(decode(code))
+        except (ValueError, AttributeError):
+            results.append(None)
+    return results
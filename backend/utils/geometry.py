@@ -0,0 +1,90 @@
+"""
+Hotspot IQ - Geometry Helpers
+Polygon parsing and vectorized point-in-polygon tests.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+def parse_polygon(polygon) -> List[List[Tuple[float, float]]]:
+    """
+    Normalize a polygon into a list of rings of (lat, lng) vertices.
+
+    Accepts either a GeoJSON Polygon / MultiPolygon geometry (coordinates in
+    [lng, lat] order) or a plain list of [lat, lng] vertices.
+
+    Args:
+        polygon: GeoJSON geometry dict or list of [lat, lng] pairs
+
+    Returns:
+        List of rings; holes are plain extra rings (even-odd rule)
+
+    Raises:
+        ValueError: If the polygon is malformed
+    """
+    try:
+        if isinstance(polygon, dict):
+            geometry = polygon.get('geometry', polygon)
+            geometry_type = geometry.get('type')
+            if geometry_type == 'Polygon':
+                polygons = [geometry['coordinates']]
+            elif geometry_type == 'MultiPolygon':
+                polygons = geometry['coordinates']
+            else:
+                raise ValueError(f"Unsupported geometry type '{geometry_type}'")
+            rings = [
+                [(float(lat), float(lng)) for lng, lat, *_ in ring]
+                for rings_ in polygons
+                for ring in rings_
+            ]
+        else:
+            rings = [[(float(lat), float(lng)) for lat, lng in polygon]]
+    except (TypeError, KeyError, ValueError) as e:
+        raise ValueError(f"Invalid polygon: {e}")
+
+    rings = [ring for ring in rings if len(ring) >= 3]
+    if not rings:
+        raise ValueError("Polygon needs at least 3 vertices")
+    return rings
+
+
+def polygon_bounds(rings: List[List[Tuple[float, float]]]) -> Dict[str, float]:
+    """Bounding box of a parsed polygon (south, west, north, east)."""
+    lats = [lat for ring in rings for lat, _ in ring]
+    lngs = [lng for ring in rings for _, lng in ring]
+    return {'south': min(lats), 'west': min(lngs), 'north': max(lats), 'east': max(lngs)}
+
+
+def points_in_polygon(lats, lngs, rings: List[List[Tuple[float, float]]]) -> np.ndarray:
+    """
+    Even-odd ray casting for many points at once.
+
+    Loops over polygon edges and tests all points against each edge with
+    NumPy, so the cost is O(points x edges) in array operations.
+
+    Args:
+        lats: Point latitudes
+        lngs: Point longitudes
+        rings: Parsed polygon rings from parse_polygon()
+
+    Returns:
+        Boolean array, True for points inside the polygon
+    """
+    y = np.asarray(lats, dtype=np.float64)
+    x = np.asarray(lngs, dtype=np.float64)
+    inside = np.zeros(y.shape, dtype=bool)
+
+    for ring in rings:
+        vertices = np.asarray(ring, dtype=np.float64)
+        y1, x1 = vertices[:, 0], vertices[:, 1]
+        y2, x2 = np.roll(y1, -1), np.roll(x1, -1)
+
+        for ey1, ex1, ey2, ex2 in zip(y1, x1, y2, x2):
+            if ey1 == ey2:
+                continue  # Horizontal edges never cross the ray
+            crosses = (ey1 > y) != (ey2 > y)
+            x_cross = ex1 + (y - ey1) * (ex2 - ex1) / (ey2 - ey1)
+            inside ^= crosses & (x < x_cross)
+
+    return inside
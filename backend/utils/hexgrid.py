@@ -0,0 +1,316 @@
+"""
+Hotspot IQ - Hexagonal Grid
+Hierarchical hexagonal cells with stable global ids (H3-style).
+
+Cells are pointy-top hexagons laid out on the Web Mercator plane, so each
+cell is a regular hexagon on the ground wherever it is. As in H3, every
+resolution has 7 times as many cells as the previous one: the lattice is
+scaled by 1/sqrt(7) and rotated by about 19.1 degrees, alternating direction
+between even and odd resolutions. A cell has exactly seven children (the
+finer cell at its center and that cell's six neighbours) and one parent, so
+aggregates roll up exactly across resolutions.
+
+Unlike a grid anchored at a request's center, a cell id means the same area
+for every request, which makes per-cell results cacheable across
+overlapping analyses. Ids pack (resolution, q, r) axial coordinates into a
+64-bit integer and are written as 15-digit hex strings, like H3 indexes.
+"""
+
+import math
+import numpy as np
+from typing import List, Tuple
+
+
+# Spherical Mercator radius (EPSG:3857)
+EARTH_RADIUS = 6378137.0
+
+# Web Mercator latitude limit
+MAX_LATITUDE = 85.05112878
+
+# Edge length of a resolution 0 cell in Mercator meters (H3's average);
+# it shrinks by sqrt(7) per resolution (res 9 ~ 174m, res 10 ~ 66m)
+BASE_EDGE = 1107712.591
+MAX_RESOLUTION = 15
+
+# Odd resolutions are rotated by this angle relative to even ones
+CLASS_III_ROTATION = math.atan2(math.sqrt(3), 5)
+
+# Axial coordinates of a parent's center in its child lattice, by parent
+# resolution parity: child (q, r) = matrix @ parent (q, r). The inverse is
+# the adjugate / 7, which is the other matrix.
+_DOWN = (
+    np.array([[3, 1], [-1, 2]], dtype=np.int64),
+    np.array([[2, -1], [1, 3]], dtype=np.int64),
+)
+_UP = (_DOWN[1], _DOWN[0])
+
+# Axial neighbour offsets
+_NEIGHBOURS = np.array([(0, 0), (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)], dtype=np.int64)
+
+# Bit layout of a cell id: resolution | q + offset | r + offset
+_COORD_BITS = 28
+_COORD_OFFSET = 1 << (_COORD_BITS - 1)
+_COORD_MASK = (1 << _COORD_BITS) - 1
+
+SQRT3 = math.sqrt(3)
+
+
+def _check_resolution(resolution: int) -> None:
+    if not 0 <= resolution <= MAX_RESOLUTION:
+        raise ValueError(f"resolution must be between 0 and {MAX_RESOLUTION}")
+
+
+def edge_length(resolution: int) -> float:
+    """Cell edge length in Mercator meters (ground meters at the equator)."""
+    _check_resolution(resolution)
+    return BASE_EDGE / math.sqrt(7) ** resolution
+
+
+def cell_edge_meters(resolution: int, lat: float = 0.0) -> float:
+    """Cell edge length on the ground at a latitude, in meters."""
+    return edge_length(resolution) * math.cos(math.radians(lat))
+
+
+def cell_area_m2(resolution: int, lat: float = 0.0) -> float:
+    """Cell area on the ground at a latitude, in square meters."""
+    return 1.5 * SQRT3 * cell_edge_meters(resolution, lat) ** 2
+
+
+def _to_mercator(lats, lngs) -> Tuple[np.ndarray, np.ndarray]:
+    lat = np.clip(np.asarray(lats, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    lng = np.asarray(lngs, dtype=np.float64)
+    x = EARTH_RADIUS * np.radians(lng)
+    y = EARTH_RADIUS * np.arcsinh(np.tan(np.radians(lat)))
+    return x, y
+
+
+def _from_mercator(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    lats = np.degrees(np.arctan(np.sinh(np.asarray(y) / EARTH_RADIUS)))
+    lngs = np.degrees(np.asarray(x) / EARTH_RADIUS)
+    return lats, lngs
+
+
+def _axial_to_plane(resolution, q, r) -> Tuple[np.ndarray, np.ndarray]:
+    """Mercator coordinates of cell centers."""
+    resolution = np.asarray(resolution)
+    size = BASE_EDGE / np.sqrt(7.0) ** resolution
+    angle = np.where(resolution % 2 == 1, CLASS_III_ROTATION, 0.0)
+    u = size * SQRT3 * (q + r / 2)
+    v = size * 1.5 * r
+    cos, sin = np.cos(angle), np.sin(angle)
+    return u * cos - v * sin, u * sin + v * cos
+
+
+def _plane_to_axial(x: np.ndarray, y: np.ndarray, resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Axial coordinates of the cells containing Mercator points."""
+    size = edge_length(resolution)
+    angle = CLASS_III_ROTATION if resolution % 2 else 0.0
+    cos, sin = math.cos(angle), math.sin(angle)
+    u = x * cos + y * sin
+    v = -x * sin + y * cos
+    return _round_axial((SQRT3 / 3 * u - v / 3) / size, (2 / 3 * v) / size)
+
+
+def _round_axial(qf: np.ndarray, rf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Round fractional axial coordinates to the hexagon containing them."""
+    sf = -qf - rf
+    q, r, s = np.rint(qf), np.rint(rf), np.rint(sf)
+    dq, dr, ds = np.abs(q - qf), np.abs(r - rf), np.abs(s - sf)
+
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    q = np.where(fix_q, -r - s, q)
+    r = np.where(fix_r, -q - s, r)
+    return q.astype(np.int64), r.astype(np.int64)
+
+
+def _pack(resolution, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+    resolution = np.asarray(resolution, dtype=np.int64)
+    return (
+        (resolution << (2 * _COORD_BITS))
+        | ((q + _COORD_OFFSET) << _COORD_BITS)
+        | (r + _COORD_OFFSET)
+    )
+
+
+def _unpack(cells) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cells = np.asarray(cells, dtype=np.int64)
+    resolution = cells >> (2 * _COORD_BITS)
+    q = ((cells >> _COORD_BITS) & _COORD_MASK) - _COORD_OFFSET
+    r = (cells & _COORD_MASK) - _COORD_OFFSET
+    return resolution, q, r
+
+
+def lat_lng_to_cells(lats, lngs, resolution: int) -> np.ndarray:
+    """
+    Get the cells containing many coordinates.
+
+    Args:
+        lats: Latitudes
+        lngs: Longitudes
+        resolution: Grid resolution (0-MAX_RESOLUTION)
+
+    Returns:
+        Integer array of cell ids
+    """
+    _check_resolution(resolution)
+    x, y = _to_mercator(lats, lngs)
+    q, r = _plane_to_axial(x, y, resolution)
+    return _pack(resolution, q, r)
+
+
+def lat_lng_to_cell(lat: float, lng: float, resolution: int) -> int:
+    """Get the cell containing a coordinate."""
+    return int(lat_lng_to_cells([lat], [lng], resolution)[0])
+
+
+def cell_resolution(cell: int) -> int:
+    """Resolution of a cell id."""
+    return int(cell) >> (2 * _COORD_BITS)
+
+
+def cells_to_lat_lng(cells) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the centers of many cells (of any resolutions).
+
+    Returns:
+        Tuple of (lats, lngs) arrays
+    """
+    return _from_mercator(*_axial_to_plane(*_unpack(cells)))
+
+
+def cell_to_lat_lng(cell: int) -> Tuple[float, float]:
+    """Get the center of a cell as (lat, lng)."""
+    lats, lngs = cells_to_lat_lng([cell])
+    return float(lats[0]), float(lngs[0])
+
+
+def cell_boundary(cell: int) -> List[Tuple[float, float]]:
+    """
+    Get the six corners of a cell.
+
+    Returns:
+        List of (lat, lng) corners, counter-clockwise
+    """
+    resolution = cell_resolution(cell)
+    size = edge_length(resolution)
+    cx, cy = (float(v[0]) for v in _axial_to_plane(*_unpack([cell])))
+    angles = np.radians(30 + 60 * np.arange(6)) + (CLASS_III_ROTATION if resolution % 2 else 0.0)
+    lats, lngs = _from_mercator(cx + size * np.cos(angles), cy + size * np.sin(angles))
+    return list(zip(lats.tolist(), lngs.tolist()))
+
+
+def cells_to_parents(cells, resolution: int) -> np.ndarray:
+    """
+    Get the ancestors of many cells at a coarser resolution.
+
+    Parents are computed one level at a time with exact integer arithmetic,
+    so the ancestor at any resolution is the parent of the parent.
+
+    Args:
+        cells: Cell ids, none coarser than resolution
+        resolution: Target resolution
+
+    Returns:
+        Integer array of ancestor cell ids
+
+    Raises:
+        ValueError: If a cell is coarser than the target resolution
+    """
+    _check_resolution(resolution)
+    cell_res, q, r = _unpack(cells)
+    if np.any(cell_res < resolution):
+        raise ValueError("cells must not be coarser than the parent resolution")
+
+    cell_res, q, r = cell_res.copy(), q.copy(), r.copy()
+    for level in range(int(cell_res.max(initial=resolution)), resolution, -1):
+        at_level = cell_res == level
+        if not at_level.any():
+            continue
+        up = _UP[(level - 1) % 2]
+        pq, pr = _round_axial(
+            (up[0, 0] * q[at_level] + up[0, 1] * r[at_level]) / 7,
+            (up[1, 0] * q[at_level] + up[1, 1] * r[at_level]) / 7
+        )
+        q[at_level], r[at_level] = pq, pr
+        cell_res[at_level] = level - 1
+    return _pack(cell_res, q, r)
+
+
+def cell_to_parent(cell: int, resolution: int) -> int:
+    """Get the ancestor of a cell at a coarser resolution."""
+    return int(cells_to_parents([cell], resolution)[0])
+
+
+def cell_to_children(cell: int, resolution: int) -> np.ndarray:
+    """
+    Get the descendants of a cell at a finer resolution (7 per level).
+
+    Returns:
+        Integer array of descendant cell ids
+    """
+    _check_resolution(resolution)
+    level, q, r = (v.copy() for v in _unpack([cell]))
+    level = int(level[0])
+    if resolution < level:
+        raise ValueError("children must be at a finer resolution")
+
+    for parent_level in range(level, resolution):
+        down = _DOWN[parent_level % 2]
+        cq = down[0, 0] * q + down[0, 1] * r
+        cr = down[1, 0] * q + down[1, 1] * r
+        q = (cq[:, None] + _NEIGHBOURS[:, 0]).ravel()
+        r = (cr[:, None] + _NEIGHBOURS[:, 1]).ravel()
+    return _pack(resolution, q, r)
+
+
+def cells_in_radius(lat: float, lng: float, radius: float, resolution: int) -> np.ndarray:
+    """
+    Get the cells whose centers lie within radius meters of a point.
+
+    Args:
+        lat: Center latitude
+        lng: Center longitude
+        radius: Radius in meters
+        resolution: Grid resolution
+
+    Returns:
+        Integer array of cell ids, sorted
+    """
+    _check_resolution(resolution)
+    size = edge_length(resolution)
+    # Mercator meters per ground meter around the center
+    reach = radius / max(math.cos(math.radians(lat)), 0.01)
+
+    x, y = _to_mercator([lat], [lng])
+    cq, cr = (int(v[0]) for v in _plane_to_axial(x, y, resolution))
+
+    n = int(math.ceil(reach / (1.5 * size))) + 1
+    offsets = np.arange(-2 * n, 2 * n + 1)
+    dq, dr = (a.ravel() for a in np.meshgrid(offsets, offsets))
+    q, r = cq + dq, cr + dr
+
+    cx, cy = _axial_to_plane(resolution, q, r)
+    inside = np.hypot(cx - x[0], cy - y[0]) <= reach
+    return np.sort(_pack(resolution, q[inside], r[inside]))
+
+
+def cell_to_string(cell: int) -> str:
+    """Hex string form of a cell id."""
+    return f"{int(cell):015x}"
+
+
+def string_to_cell(value: str) -> int:
+    """
+    Parse the hex string form of a cell id.
+
+    Raises:
+        ValueError: If value is not a valid cell id
+    """
+    try:
+        cell = int(value, 16)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid cell id: {value!r}")
+    if not 0 <= cell_resolution(cell) <= MAX_RESOLUTION:
+        raise ValueError(f"Invalid cell id: {value!r}")
+    return cell
@@ -0,0 +1,33 @@
+"""
+Hotspot IQ - HTTP Caching Helpers
+Conditional responses for precomputed or cached bodies.
+"""
+
+from flask import Response, request
+from utils.compression import etag_variants
+
+
+def conditional_response(body: bytes, etag: str, mimetype: str, max_age: int) -> Response:
+    """
+    Build a cacheable response with a strong ETag, or 304 if the client has it.
+
+    Args:
+        body: Response body
+        etag: Strong ETag of the uncompressed body (unquoted)
+        mimetype: Response mimetype
+        max_age: Cache-Control max-age in seconds
+
+    Returns:
+        200 response with the body, or an empty 304 response
+    """
+    # Clients revalidate with the ETag of the (possibly compressed) copy they hold
+    matched = next((tag for tag in etag_variants(etag) if request.if_none_match.contains(tag)), None)
+    if matched:
+        response = Response(status=304)
+        response.set_etag(matched)
+    else:
+        response = Response(body, mimetype=mimetype)
+        response.set_etag(etag)
+
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
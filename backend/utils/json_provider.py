@@ -0,0 +1,75 @@
+"""
+Hotspot IQ - Fast JSON Provider
+Flask JSON provider that serializes with orjson when it is installed.
+
+orjson writes bytes directly and handles NumPy arrays and scalars natively,
+which matters for large analysis responses (hundreds of POI dicts) and for
+values coming straight out of the vectorized scorer. Without orjson the
+standard library encoder is used, extended to understand NumPy types.
+Output keeps Flask's conventions: sorted keys, compact separators, and
+indentation in debug mode.
+"""
+
+import json
+import numpy as np
+from typing import Any
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+def _default(o: Any) -> Any:
+    """Encode NumPy values, then anything Flask's encoder knows about."""
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    if isinstance(o, np.generic):
+        return o.item()
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    return DefaultJSONProvider.default(o)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with an orjson fast path and NumPy support."""
+
+    default = staticmethod(_default)
+
+    # orjson's NumPy support covers C-contiguous arrays of native types;
+    # everything else goes through _default
+    ORJSON_OPTIONS = (
+        (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+        if orjson is not None else 0
+    )
+
+    #: Set to False to force the standard library encoder (e.g. for benchmarks)
+    use_orjson = orjson is not None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if self.use_orjson and not kwargs:
+            return orjson.dumps(obj, default=_default, option=self.ORJSON_OPTIONS).decode('utf-8')
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if not self.use_orjson:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self.ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=options), mimetype=self.mimetype
+        )
@@ -0,0 +1,196 @@
+"""
+Hotspot IQ - Land/Water Mask
+Memory-mapped land/water raster for offline water-body checks.
+
+The mask is a regular lat/lng grid over a bounding box (India by default)
+with two bit planes: cells inside OSM land polygons (coastline-derived), and
+cells inside inland water polygons (lakes, reservoirs, riverbanks). A cell is
+sea when it is not land, and inland water when both bits are set. Planes are
+bit-packed row by row (north first) after a fixed header, and the file is
+memory-mapped, so a lookup reads a few bytes and only touched pages are ever
+loaded. Build it with scripts/build_landmask.py.
+"""
+
+import math
+import os
+import struct
+import threading
+import numpy as np
+from typing import Dict, Optional, Tuple
+from config import Config
+
+
+MAGIC = b'HSIQLMK1'
+# magic, south, west, north, east, rows, cols
+HEADER = struct.Struct('<8s4d2I')
+HEADER_SIZE = 64
+
+# Cell classes
+UNKNOWN = -1  # Outside the mask
+SEA = 0
+LAND = 1
+INLAND_WATER = 2
+
+WATER_TYPES = {SEA: 'ocean or sea', INLAND_WATER: 'lake, river or reservoir'}
+
+# Default coverage: mainland India and its coastal waters
+INDIA_BOUNDS = {'south': 6.5, 'west': 68.0, 'north': 37.5, 'east': 97.5}
+
+METERS_PER_DEGREE = 111000
+
+
+def write_header(f, bounds: Dict[str, float], rows: int, cols: int) -> None:
+    """Write a mask header (planes follow at HEADER_SIZE)."""
+    header = HEADER.pack(MAGIC, bounds['south'], bounds['west'], bounds['north'], bounds['east'], rows, cols)
+    f.write(header.ljust(HEADER_SIZE, b'\0'))
+
+
+class LandMask:
+    """Read-only view of a land/water mask file."""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            magic, south, west, north, east, rows, cols = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a land mask file")
+
+        self.path = path
+        self.south, self.west, self.north, self.east = south, west, north, east
+        self.rows, self.cols = rows, cols
+        self.lat_step = (north - south) / rows
+        self.lng_step = (east - west) / cols
+
+        row_bytes = (cols + 7) // 8
+        expected = HEADER_SIZE + 2 * rows * row_bytes
+        if os.path.getsize(path) != expected:
+            raise ValueError(f"{path} is truncated ({os.path.getsize(path)} of {expected} bytes)")
+        self._planes = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER_SIZE, shape=(2, rows, row_bytes))
+
+    def _cells(self, lats, lngs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Row/column of the cells holding points, and which points are covered."""
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        rows = np.floor((self.north - lats) / self.lat_step).astype(np.int64)
+        cols = np.floor((lngs - self.west) / self.lng_step).astype(np.int64)
+        covered = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        return np.where(covered, rows, 0), np.where(covered, cols, 0), covered
+
+    def _classify_cells(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        shift = (7 - (cols & 7)).astype(np.uint8)
+        land = (self._planes[0, rows, cols >> 3] >> shift) & 1
+        water = (self._planes[1, rows, cols >> 3] >> shift) & 1
+        return np.where(land == 0, SEA, np.where(water == 1, INLAND_WATER, LAND)).astype(np.int8)
+
+    def classify(self, lats, lngs) -> np.ndarray:
+        """
+        Classify many points.
+
+        Returns:
+            int8 array of SEA, LAND, INLAND_WATER or UNKNOWN (outside the mask)
+        """
+        rows, cols, covered = self._cells(lats, lngs)
+        return np.where(covered, self._classify_cells(rows, cols), UNKNOWN).astype(np.int8)
+
+    def classify_point(self, lat: float, lng: float) -> int:
+        """Classify a single point."""
+        return int(self.classify([lat], [lng])[0])
+
+    def covers(self, lat: float, lng: float, radius: float = 0) -> bool:
+        """Whether the circle of radius meters around a point lies inside the mask."""
+        lat_pad = radius / METERS_PER_DEGREE
+        lng_pad = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+        return (
+            self.south <= lat - lat_pad and lat + lat_pad <= self.north
+            and self.west <= lng - lng_pad and lng + lng_pad <= self.east
+        )
+
+    def window(self, lat: float, lng: float, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classes of all cells whose centers lie within radius meters of a point.
+
+        Returns:
+            Tuple of (classes, lats, lngs) flat arrays of the cells in the circle
+        """
+        lat_pad = radius / METERS_PER_DEGREE
+        lng_pad = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+        r0 = max(0, int((self.north - (lat + lat_pad)) / self.lat_step))
+        r1 = min(self.rows - 1, int((self.north - (lat - lat_pad)) / self.lat_step))
+        c0 = max(0, int((lng - lng_pad - self.west) / self.lng_step))
+        c1 = min(self.cols - 1, int((lng + lng_pad - self.west) / self.lng_step))
+        if r0 > r1 or c0 > c1:
+            empty = np.empty(0)
+            return empty.astype(np.int8), empty, empty
+
+        rows, cols = np.meshgrid(np.arange(r0, r1 + 1), np.arange(c0, c1 + 1), indexing='ij')
+        cell_lats = self.north - (rows + 0.5) * self.lat_step
+        cell_lngs = self.west + (cols + 0.5) * self.lng_step
+        dlat = (cell_lats - lat) * METERS_PER_DEGREE
+        dlng = (cell_lngs - lng) * METERS_PER_DEGREE * math.cos(math.radians(lat))
+        inside = dlat ** 2 + dlng ** 2 <= radius ** 2
+
+        return self._classify_cells(rows[inside], cols[inside]), cell_lats[inside], cell_lngs[inside]
+
+    def land_share(self, lat: float, lng: float, radius: float) -> Optional[float]:
+        """Share of the circle around a point that is land, or None if not covered."""
+        if not self.covers(lat, lng, radius):
+            return None
+        classes, _, _ = self.window(lat, lng, radius)
+        return float((classes == LAND).mean()) if classes.size else None
+
+    def nearest_land(self, lat: float, lng: float, radius: float) -> Optional[Tuple[float, float, float]]:
+        """
+        Center of the land cell closest to a point within radius meters.
+
+        Returns:
+            Tuple of (lat, lng, distance in meters), or None if there is none
+        """
+        classes, cell_lats, cell_lngs = self.window(lat, lng, radius)
+        land = classes == LAND
+        if not land.any():
+            return None
+
+        dlat = (cell_lats[land] - lat) * METERS_PER_DEGREE
+        dlng = (cell_lngs[land] - lng) * METERS_PER_DEGREE * math.cos(math.radians(lat))
+        distances = np.hypot(dlat, dlng)
+        best = int(np.argmin(distances))
+        return float(cell_lats[land][best]), float(cell_lngs[land][best]), float(distances[best])
+
+    def stats(self) -> Dict:
+        """Coverage and resolution of the mask."""
+        return {
+            'path': self.path,
+            'bounds': {'south': self.south, 'west': self.west, 'north': self.north, 'east': self.east},
+            'rows': self.rows,
+            'cols': self.cols,
+            'cell_meters': round(self.lat_step * METERS_PER_DEGREE, 1),
+        }
+
+
+_landmask: Optional[LandMask] = None
+_landmask_loaded = False
+_landmask_lock = threading.Lock()
+
+
+def get_landmask() -> Optional[LandMask]:
+    """
+    The mask at Config.LANDMASK_PATH, opened on first use.
+
+    Returns:
+        LandMask, or None if no mask is configured or the file is missing
+        or invalid (callers then fall back to Overpass)
+    """
+    global _landmask, _landmask_loaded
+    if _landmask_loaded:
+        return _landmask
+
+    with _landmask_lock:
+        if not _landmask_loaded:
+            path = Config.LANDMASK_PATH
+            if path and os.path.exists(path):
+                try:
+                    _landmask = LandMask(path)
+                    print(f"🗺️ Loaded land mask {path} ({_landmask.rows}x{_landmask.cols} cells)")
+                except (OSError, ValueError, struct.error) as e:
+                    print(f"⚠️ Could not load land mask {path}: {e}")
+            _landmask_loaded = True
+    return _landmask
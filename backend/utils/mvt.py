@@ -0,0 +1,137 @@
+"""
+Hotspot IQ - Minimal Mapbox Vector Tile Encoder
+Writes point layers in the MVT 2.1 protobuf format by hand, so vector tile
+endpoints don't need protobuf or mapbox-vector-tile installed.
+
+Only what the map needs is supported: POINT features with string, number and
+boolean properties.
+"""
+
+import struct
+from typing import Dict, List, Tuple
+
+
+# Default tile coordinate grid
+DEFAULT_EXTENT = 4096
+
+# Protobuf wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+
+# MVT geometry type and commands
+_GEOM_POINT = 1
+_CMD_MOVE_TO = 1
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    """Map signed integers onto unsigned ones (0, -1, 1, -2 -> 0, 1, 2, 3)."""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _bytes_field(field: int, data: bytes) -> bytes:
+    return _key(field, _LENGTH_DELIMITED) + _varint(len(data)) + data
+
+
+def _varint_field(field: int, value: int) -> bytes:
+    return _key(field, _VARINT) + _varint(value)
+
+
+def _packed_field(field: int, values: List[int]) -> bytes:
+    return _bytes_field(field, b''.join(_varint(v) for v in values))
+
+
+def _encode_value(value) -> bytes:
+    """Encode a property value as a vector_tile.Tile.Value message."""
+    if isinstance(value, bool):
+        return _varint_field(7, int(value))
+    if isinstance(value, int):
+        if value >= 0:
+            return _varint_field(5, value)       # uint_value
+        return _varint_field(6, _zigzag(value))  # sint_value
+    if isinstance(value, float):
+        return _key(3, _FIXED64) + struct.pack('<d', value)  # double_value
+    return _bytes_field(1, str(value).encode('utf-8'))       # string_value
+
+
+def encode_layer(name: str, features: List[Dict], extent: int = DEFAULT_EXTENT) -> bytes:
+    """
+    Encode one point layer.
+
+    Args:
+        name: Layer name
+        features: Dicts with 'x', 'y' (tile grid coordinates), optional 'id'
+                  and 'properties' (flat dict; None values are skipped)
+        extent: Tile coordinate grid size
+
+    Returns:
+        Encoded vector_tile.Tile.Layer message (without the enclosing field)
+    """
+    keys: Dict[str, int] = {}
+    values: Dict[Tuple[type, object], int] = {}
+    encoded_features = []
+
+    for feature in features:
+        tags = []
+        for prop, value in (feature.get('properties') or {}).items():
+            if value is None:
+                continue
+            key_index = keys.setdefault(prop, len(keys))
+            value_index = values.setdefault((type(value), value), len(values))
+            tags.extend((key_index, value_index))
+
+        geometry = [
+            (_CMD_MOVE_TO & 0x7) | (1 << 3),
+            _zigzag(int(feature['x'])),
+            _zigzag(int(feature['y'])),
+        ]
+
+        message = b''
+        if feature.get('id') is not None:
+            message += _varint_field(1, int(feature['id']))
+        if tags:
+            message += _packed_field(2, tags)
+        message += _varint_field(3, _GEOM_POINT)
+        message += _packed_field(4, geometry)
+        encoded_features.append(_bytes_field(2, message))
+
+    return (
+        _varint_field(15, 2) +                          # version
+        _bytes_field(1, name.encode('utf-8')) +
+        b''.join(encoded_features) +
+        b''.join(_bytes_field(3, k.encode('utf-8')) for k in keys) +
+        b''.join(_bytes_field(4, _encode_value(v)) for _, v in values) +
+        _varint_field(5, extent)
+    )
+
+
+def encode_tile(layers: Dict[str, List[Dict]], extent: int = DEFAULT_EXTENT) -> bytes:
+    """
+    Encode a vector tile.
+
+    Args:
+        layers: Layer name -> features (see encode_layer); empty layers are omitted
+        extent: Tile coordinate grid size
+
+    Returns:
+        Tile bytes (application/vnd.mapbox-vector-tile)
+    """
+    return b''.join(
+        _bytes_field(3, encode_layer(name, features, extent))
+        for name, features in layers.items()
+        if features
+    )
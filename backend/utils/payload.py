@@ -0,0 +1,170 @@
+"""
+Hotspot IQ - Response Payload Shaping
+Field projection and the compact /api/analyze format.
+
+The compact format uses short keys, rounds coordinates to ~1m and stores POI
+lists as parallel arrays (columnar), which removes the repeated key names
+that dominate a large JSON response:
+
+    {
+        "fmt": "compact-v1",
+        "loc": {"lat", "lng", "clat", "clng", "addr", "dp"},
+        "bt", "r", "f", "ff", "sm", "pt", "bg",
+        "spots": [{"lat", "lng", "s", "rt", "rc", "why", "nc", "nl", "md", "rdc", "rank"}],
+        "comp": {"n", "name": [], "lat": [], "lng": [], "d": []},
+        "lm": {"n", "name": [], "lat": [], "lng": [], "cat": []}
+    }
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Decimal places kept for coordinates in compact mode (~1.1m)
+COORD_PRECISION = 5
+
+COMPACT_FORMAT = 'compact-v1'
+
+# Compact key -> full key
+TOP_LEVEL_KEYS = {'bt': 'business_type', 'r': 'radius', 'f': 'filters_applied', 'ff': 'footfall_proxy',
+                  'sm': 'scoring_mode', 'pt': 'partial', 'bg': 'budget'}
+LOCATION_KEYS = {'lat': 'lat', 'lng': 'lng', 'clat': 'center_lat', 'clng': 'center_lng',
+                 'addr': 'address', 'dp': 'digipin'}
+SPOT_KEYS = {'lat': 'lat', 'lng': 'lng', 's': 'score', 'rt': 'rating', 'rc': 'rating_color',
+             'why': 'reasons', 'nc': 'nearby_competitors', 'nl': 'nearby_landmarks',
+             'md': 'min_competitor_distance', 'rdc': 'road_checked', 'rank': 'rank'}
+COMPETITOR_COLUMNS = {'name': 'name', 'lat': 'lat', 'lng': 'lng', 'd': 'distance'}
+LANDMARK_COLUMNS = {'name': 'name', 'lat': 'lat', 'lng': 'lng', 'cat': 'category'}
+
+_COORDINATE_KEYS = {'lat', 'lng', 'center_lat', 'center_lng'}
+
+
+def parse_fields(fields: Any) -> Optional[List[str]]:
+    """
+    Normalize a fields parameter ("a,b.c" or ["a", "b.c"]) into a list of paths.
+
+    Raises:
+        ValueError: If fields is neither a string nor a list of strings
+    """
+    if fields is None or fields == '':
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+        raise ValueError("fields must be a comma-separated string or a list of strings")
+    return [f.strip() for f in fields if f.strip()]
+
+
+def parse_flag(value: Any) -> bool:
+    """
+    Read a boolean option sent as a JSON bool or a query-style string.
+
+    Strings are true only when "1" or "true" (any case), so "false" and "0"
+    stay false.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true')
+    return value is True or value == 1
+
+
+def project_fields(payload: Dict, fields: Iterable[str]) -> Dict:
+    """
+    Keep only the given dotted paths of a response.
+
+    Example: ["location.digipin", "competitors.count"] keeps
+    {"location": {"digipin": ...}, "competitors": {"count": ...}}.
+    Paths that don't exist are ignored.
+
+    Args:
+        payload: Response dictionary
+        fields: Dotted paths to keep
+
+    Returns:
+        New dictionary with the selected fields
+    """
+    result: Dict = {}
+    for path in fields:
+        keys = path.split('.')
+        source, target = payload, result
+        for i, key in enumerate(keys):
+            if not isinstance(source, dict) or key not in source:
+                break
+            if i == len(keys) - 1:
+                target[key] = source[key]
+            else:
+                if target.get(key) is source[key]:
+                    break  # Parent already included in full
+                source = source[key]
+                target = target.setdefault(key, {})
+    return result
+
+
+def _round_coordinate(value: Any) -> Any:
+    return round(value, COORD_PRECISION) if isinstance(value, float) else value
+
+
+def _shorten(record: Dict, keys: Dict[str, str]) -> Dict:
+    """Rename the keys of a record present in `keys`, rounding coordinates."""
+    return {
+        short: _round_coordinate(record[full]) if full in _COORDINATE_KEYS else record[full]
+        for short, full in keys.items()
+        if full in record
+    }
+
+
+def columnar(records: List[Dict], columns: Dict[str, str]) -> Dict[str, List]:
+    """
+    Turn a list of records into parallel arrays.
+
+    Args:
+        records: List of dictionaries
+        columns: Output column name -> record key (missing values become None)
+
+    Returns:
+        Dict of column name -> list of values
+    """
+    return {
+        short: [
+            _round_coordinate(r.get(full)) if full in _COORDINATE_KEYS else r.get(full)
+            for r in records
+        ]
+        for short, full in columns.items()
+    }
+
+
+def compact_analysis(response: Dict) -> Dict:
+    """
+    Convert an /api/analyze response (possibly projected) to the compact format.
+
+    Args:
+        response: Full or projected analysis response
+
+    Returns:
+        Compact response (see module docstring)
+    """
+    compact: Dict = {'fmt': COMPACT_FORMAT}
+
+    if 'location' in response:
+        compact['loc'] = _shorten(response['location'], LOCATION_KEYS)
+    for short, full in TOP_LEVEL_KEYS.items():
+        if full in response:
+            compact[short] = response[full]
+    if 'recommended_spots' in response:
+        compact['spots'] = [_shorten(spot, SPOT_KEYS) for spot in response['recommended_spots']]
+
+    competitors = response.get('competitors')
+    if competitors is not None:
+        compact['comp'] = {}
+        if 'count' in competitors:
+            compact['comp']['n'] = competitors['count']
+        if 'nearby' in competitors:
+            compact['comp'].update(columnar(competitors['nearby'], COMPETITOR_COLUMNS))
+
+    landmarks = response.get('landmarks')
+    if landmarks is not None:
+        compact['lm'] = {}
+        if 'total' in landmarks:
+            compact['lm']['n'] = landmarks['total']
+        if 'list' in landmarks:
+            compact['lm'].update(columnar(landmarks['list'], LANDMARK_COLUMNS))
+
+    return compact
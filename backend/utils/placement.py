@@ -0,0 +1,155 @@
+"""
+Hotspot IQ - Multi-site Placement
+Greedy maximum-coverage placement of several sites over a demand grid.
+
+Each demand cell j has a weight w_j (footfall discounted by competitors
+already serving it) and each candidate site i covers cell j with strength
+a_ij, which decays linearly from 1 at the site to 0 at the service radius.
+A set of sites S captures
+
+    F(S) = sum_j w_j * max(a_ij for i in S)
+
+so demand covered by several sites is only counted once: a second cafe next
+to the first adds little, which is how self-cannibalization is priced. F is
+monotone submodular, so greedy selection is within (1 - 1/e) of optimal, and
+lazy evaluation (re-checking only the candidate at the top of a max-heap of
+stale gains) needs far fewer gain evaluations than plain greedy.
+
+Coverage is kept as a sparse CSR matrix (candidates x demand cells): each
+row holds only the cells inside the service radius.
+"""
+
+import heapq
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from utils.score_calculator import haversine_matrix
+from utils.tiles import METERS_PER_DEGREE
+
+
+# Candidates compared against the demand grid per distance matrix
+COVERAGE_CHUNK = 256
+
+
+def coverage_matrix(
+    cand_lats,
+    cand_lngs,
+    demand_lats,
+    demand_lngs,
+    service_radius: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the sparse candidate x demand coverage matrix.
+
+    Candidates are processed in latitude-sorted chunks that are only compared
+    with the band of demand cells within service_radius of the chunk, so the
+    cost grows with the number of covered pairs rather than candidates x cells.
+
+    Args:
+        cand_lats: Candidate site latitudes
+        cand_lngs: Candidate site longitudes
+        demand_lats: Demand cell latitudes
+        demand_lngs: Demand cell longitudes
+        service_radius: Catchment radius in meters
+
+    Returns:
+        CSR arrays (indptr, indices, data): row i covers demand cells
+        indices[indptr[i]:indptr[i + 1]] with strengths in data
+    """
+    cand_lats = np.asarray(cand_lats, dtype=np.float64)
+    cand_lngs = np.asarray(cand_lngs, dtype=np.float64)
+    demand_lats = np.asarray(demand_lats, dtype=np.float64)
+    demand_lngs = np.asarray(demand_lngs, dtype=np.float64)
+
+    demand_order = np.argsort(demand_lats, kind='stable')
+    sorted_lats = demand_lats[demand_order]
+    cand_order = np.argsort(cand_lats, kind='stable')
+    lat_pad = service_radius / METERS_PER_DEGREE * 1.01
+
+    rows, cols, values = [], [], []
+    for start in range(0, cand_order.size, COVERAGE_CHUNK):
+        chunk = cand_order[start:start + COVERAGE_CHUNK]
+        lo = np.searchsorted(sorted_lats, cand_lats[chunk].min() - lat_pad, side='left')
+        hi = np.searchsorted(sorted_lats, cand_lats[chunk].max() + lat_pad, side='right')
+        band = demand_order[lo:hi]
+        if band.size == 0:
+            continue
+
+        dist = haversine_matrix(cand_lats[chunk], cand_lngs[chunk], demand_lats[band], demand_lngs[band])
+        row, col = np.nonzero(dist < service_radius)
+        rows.append(chunk[row])
+        cols.append(band[col])
+        values.append(1.0 - dist[row, col] / service_radius)
+
+    if rows:
+        rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+    else:
+        rows, cols, values = np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(cand_lats.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=cand_lats.size), out=indptr[1:])
+    return indptr, cols[order], values[order]
+
+
+def covered_by(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, n_demand: int) -> np.ndarray:
+    """Best coverage strength of every demand cell by any row of the matrix."""
+    covered = np.zeros(n_demand)
+    np.maximum.at(covered, indices, data)
+    return covered
+
+
+def lazy_greedy(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    weights: np.ndarray,
+    k: int,
+    covered: Optional[np.ndarray] = None
+) -> Dict:
+    """
+    Pick up to k candidates maximizing weighted coverage with lazy greedy.
+
+    Args:
+        indptr, indices, data: CSR coverage matrix from coverage_matrix()
+        weights: Demand weight per demand cell
+        k: Number of sites to pick
+        covered: Coverage already provided (e.g. by existing sites)
+
+    Returns:
+        Dict with picks (index, gain, standalone - the demand the site would
+        capture alone), final covered array and gain evaluations made
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    covered = np.zeros(weights.size) if covered is None else np.array(covered, dtype=np.float64)
+    n_candidates = indptr.size - 1
+    row_ids = np.repeat(np.arange(n_candidates), np.diff(indptr))
+
+    # Every candidate's gain against the starting coverage, in one pass
+    standalone = np.bincount(row_ids, weights=weights[indices] * data, minlength=n_candidates)
+    gains = np.bincount(
+        row_ids, weights=weights[indices] * np.maximum(data - covered[indices], 0), minlength=n_candidates
+    )
+    heap = [(-gain, i) for i, gain in enumerate(gains.tolist()) if gain > 0]
+    heapq.heapify(heap)
+    evaluations = n_candidates
+
+    picks: List[Dict] = []
+    while heap and len(picks) < k:
+        _, i = heapq.heappop(heap)
+        cols = indices[indptr[i]:indptr[i + 1]]
+        strength = data[indptr[i]:indptr[i + 1]]
+        gain = float((weights[cols] * np.maximum(strength - covered[cols], 0)).sum())
+        evaluations += 1
+
+        # Gains only shrink, so a fresh gain at least the next stale bound is the best
+        if heap and gain < -heap[0][0]:
+            if gain > 0:
+                heapq.heappush(heap, (-gain, i))
+            continue
+        if gain <= 0:
+            break
+
+        picks.append({'index': i, 'gain': gain, 'standalone': float(standalone[i])})
+        covered[cols] = np.maximum(covered[cols], strength)
+
+    return {'picks': picks, 'covered': covered, 'evaluations': evaluations}
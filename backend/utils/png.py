@@ -0,0 +1,54 @@
+"""
+Hotspot IQ - Minimal PNG Encoder
+Writes 8-bit grayscale or RGBA images from NumPy arrays using only zlib and
+struct, so raster endpoints don't need an imaging library.
+"""
+
+import struct
+import zlib
+import numpy as np
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Length, type, data and CRC of one PNG chunk."""
+    return (
+        struct.pack('>I', len(data)) +
+        chunk_type +
+        data +
+        struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(image: np.ndarray, compression: int = 6) -> bytes:
+    """
+    Encode an image as PNG.
+
+    Args:
+        image: uint8 array of shape (H, W) for grayscale or (H, W, 4) for RGBA
+        compression: zlib level (0-9)
+
+    Returns:
+        PNG file bytes
+    """
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+
+    if image.ndim == 2:
+        color_type = 0  # Grayscale
+        height, width = image.shape
+    elif image.ndim == 3 and image.shape[2] == 4:
+        color_type = 6  # RGBA
+        height, width = image.shape[:2]
+    else:
+        raise ValueError("image must be (H, W) or (H, W, 4)")
+
+    # Every scanline starts with filter type 0 (None)
+    rows = image.reshape(height, -1)
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows]).tobytes()
+
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return (
+        b'\x89PNG\r\n\x1a\n' +
+        _chunk(b'IHDR', header) +
+        _chunk(b'IDAT', zlib.compress(raw, compression)) +
+        _chunk(b'IEND', b'')
+    )
@@ -0,0 +1,219 @@
+"""
+Hotspot IQ - Request Budget
+Deadline and upstream call budget shared by everything one request does.
+
+An analysis fans out into dozens of LatLong, Overpass and Nominatim calls,
+each with its own timeout, so its worst-case latency used to be the sum of
+all of them. A RequestBudget, opened with @with_request_budget around the
+request's entry point, caps both the total time and the number of upstream
+calls. Every upstream call charges it through upstream_timeout() (or
+overpass_query() for overpy), which also shortens the call's timeout to the
+time left; calls that no longer fit are refused with BudgetExhausted, and
+callers treat that like an upstream failure. Optional stages ask
+stage_allowed() before starting, so they are skipped while time is still
+left for the required ones. Upstreams that fail outright, or are answered
+from incomplete cached data instead, are recorded with mark_degraded().
+Either way the budget is marked partial and the response says so.
+
+upstream_timeout() also waits for the upstream's quota (utils/admission.py),
+outside a budget too, so background jobs share the same limits. A call that
+cannot get quota within its wait is refused with UpstreamThrottled.
+"""
+
+import functools
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+from config import Config
+from utils.admission import acquire_upstream
+
+
+# Calls are not started with less time than this left
+MIN_CALL_SECONDS = 1.0
+
+
+class BudgetExhausted(Exception):
+    """An upstream call was refused because the request ran out of time or calls."""
+
+
+class UpstreamThrottled(BudgetExhausted):
+    """An upstream call was refused because its quota had no room in time."""
+
+
+class RequestBudget:
+    """Time and upstream calls left for one request."""
+
+    def __init__(self, deadline: float, max_calls: int):
+        self.started = time.monotonic()
+        self.deadline = self.started + deadline
+        self.max_calls = max_calls
+        self.calls: Dict[str, int] = {}
+        self.refused: Dict[str, int] = {}
+        self.degraded: List[str] = []
+        self._lock = threading.RLock()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def calls_left(self) -> int:
+        """Upstream calls left."""
+        return max(0, self.max_calls - sum(self.calls.values()))
+
+    def allows(self, calls: int = 1, seconds: float = 0.0) -> bool:
+        """Whether calls more upstream calls fit with more than seconds to spare."""
+        return self.calls_left() >= calls and self.remaining() > max(seconds, MIN_CALL_SECONDS)
+
+    def spend(self, upstream: str, timeout: float) -> float:
+        """
+        Charge one upstream call.
+
+        Args:
+            upstream: Upstream name, e.g. 'latlong' or 'overpass'
+            timeout: The call's own timeout in seconds
+
+        Returns:
+            Timeout to use, capped to the time left
+
+        Raises:
+            BudgetExhausted: If the deadline is (nearly) reached or no calls are left
+        """
+        with self._lock:
+            if not self.allows():
+                self.refuse(upstream)
+                raise BudgetExhausted(
+                    f"{upstream} call skipped: request budget exhausted "
+                    f"({sum(self.calls.values())} calls, {time.monotonic() - self.started:.1f}s)"
+                )
+            self.calls[upstream] = self.calls.get(upstream, 0) + 1
+            return min(timeout, self.remaining())
+
+    def refuse(self, upstream: str) -> None:
+        """Record an upstream call that was not made."""
+        with self._lock:
+            self.refused[upstream] = self.refused.get(upstream, 0) + 1
+
+    def degrade(self, stage: str) -> None:
+        """Record that a stage was cut short or fell back to incomplete data."""
+        with self._lock:
+            if stage not in self.degraded:
+                self.degraded.append(stage)
+
+    @property
+    def partial(self) -> bool:
+        """Whether any call was refused or stage cut short."""
+        return bool(self.refused or self.degraded)
+
+    def summary(self) -> Dict:
+        """Calls made and refused per upstream, stages cut short and time used."""
+        return {
+            'elapsed': round(time.monotonic() - self.started, 2),
+            'deadline': round(self.deadline - self.started, 1),
+            'calls': dict(self.calls),
+            'max_calls': self.max_calls,
+            'refused': dict(self.refused),
+            'degraded_stages': list(self.degraded),
+        }
+
+
+_budget: ContextVar[Optional[RequestBudget]] = ContextVar('request_budget', default=None)
+
+
+def with_request_budget(func: Callable) -> Callable:
+    """
+    Run func under a RequestBudget of Config.REQUEST_DEADLINE seconds and
+    Config.REQUEST_MAX_UPSTREAM_CALLS calls. Nested calls share the
+    outermost budget.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _budget.get() is not None:
+            return func(*args, **kwargs)
+        token = _budget.set(RequestBudget(Config.REQUEST_DEADLINE, Config.REQUEST_MAX_UPSTREAM_CALLS))
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _budget.reset(token)
+    return wrapper
+
+
+def current_budget() -> Optional[RequestBudget]:
+    """The budget of the running request, or None outside one."""
+    return _budget.get()
+
+
+def upstream_timeout(upstream: str, timeout: float) -> float:
+    """
+    Wait for the upstream's quota and charge the call to the current budget.
+
+    Returns:
+        timeout, capped to the time left (unchanged outside a budget)
+
+    Raises:
+        UpstreamThrottled: If no quota frees up within Config.UPSTREAM_MAX_WAIT
+            or the time left
+        BudgetExhausted: If the call does not fit in the budget
+    """
+    budget = _budget.get()
+    max_wait = Config.UPSTREAM_MAX_WAIT
+    if budget is not None:
+        if not budget.allows():
+            return budget.spend(upstream, timeout)  # raises BudgetExhausted
+        max_wait = min(max_wait, budget.remaining() - MIN_CALL_SECONDS)
+
+    if not acquire_upstream(upstream, max_wait):
+        if budget is not None:
+            budget.refuse(upstream)
+        raise UpstreamThrottled(f"{upstream} call skipped: quota exhausted")
+
+    return timeout if budget is None else budget.spend(upstream, timeout)
+
+
+def cap_overpass_timeout(query: str, seconds: float) -> str:
+    """Lower the [timeout:N] setting of an Overpass QL query to seconds."""
+    def _cap(match):
+        return f"[timeout:{max(1, min(int(match.group(1)), int(seconds)))}]"
+    return re.sub(r'\[timeout:(\d+)\]', _cap, query, count=1)
+
+
+def overpass_query(query: str) -> str:
+    """
+    Charge an Overpass call made through overpy and bound its server-side
+    timeout by the time left (overpy has no client timeout to pass).
+
+    Raises:
+        BudgetExhausted: If the call does not fit in the budget
+    """
+    match = re.search(r'\[timeout:(\d+)\]', query)
+    timeout = upstream_timeout('overpass', float(match.group(1)) if match else 180.0)
+    return cap_overpass_timeout(query, timeout)
+
+
+def mark_degraded(stage: str) -> None:
+    """
+    Mark the running request partial because stage had to make do with
+    missing or incomplete data, e.g. every Overpass endpoint failed.
+    Does nothing outside a budget.
+    """
+    budget = _budget.get()
+    if budget is not None:
+        budget.degrade(stage)
+
+
+def stage_allowed(stage: str, calls: int = 1) -> bool:
+    """
+    Whether an optional stage should start.
+
+    It needs calls upstream calls and more than Config.REQUEST_STAGE_RESERVE
+    seconds left, which are kept for the required stages. A refused stage
+    marks the request partial.
+    """
+    budget = _budget.get()
+    if budget is None or budget.allows(calls, Config.REQUEST_STAGE_RESERVE):
+        return True
+    if stage not in budget.degraded:
+        print(f"⏱️ Skipping {stage}: request budget low ({budget.remaining():.0f}s, {budget.calls_left()} calls left)")
+    budget.degrade(stage)
+    return False
@@ -5,8 +5,13 @@ Finds optimal business locations based on competitor density and landmark proxim
 
 import math
 import requests
+import numpy as np
 from typing import Dict, List, Tuple, Optional
-from config import LANDMARK_WEIGHTS
+from config import Config, LANDMARK_WEIGHTS
+from utils.relevance import relevance_scores
+from utils.request_budget import (
+    upstream_timeout, cap_overpass_timeout, stage_allowed, mark_degraded, BudgetExhausted
+)
 
 # Overpass API endpoints
 OVERPASS_ENDPOINTS = [
@@ -14,6 +19,37 @@ OVERPASS_ENDPOINTS = [
     "https://overpass.kumi.systems/api/interpreter"
 ]
 
+# Grid scoring: competitors within this distance count against a spot
+COMPETITOR_PROXIMITY = 300
+
+# Grid scoring: landmarks within this distance add footfall
+LANDMARK_PROXIMITY = 500
+
+# Grid scoring: footfall weight by landmark keyword (first match wins)
+GRID_LANDMARK_WEIGHTS = [
+    (['metro', 'station', 'railway'], 25),
+    (['mall', 'plaza', 'market'], 20),
+    (['hospital', 'medical', 'clinic'], 15),
+    (['school', 'college', 'university'], 15),
+    (['office', 'corporate', 'tech'], 12),
+    (['bank', 'atm'], 10),
+]
+GRID_DEFAULT_LANDMARK_WEIGHT = 5
+
+# Grid scoring modes: 'keyword' uses GRID_LANDMARK_WEIGHTS for every business;
+# 'relevance' weighs each landmark by RELEVANCE_MATRIX for the business type
+SCORING_MODES = ('keyword', 'relevance')
+
+# Relevance mode: footfall weight of a fully relevant (1.0) landmark,
+# on the same scale as the top keyword weight
+RELEVANCE_WEIGHT_SCALE = 25
+
+# Upper bound on points x POIs distances held in memory at once
+SCORE_CHUNK_ELEMENTS = 2_000_000
+
+# Adaptive spot search starts from the same grid as find_recommended_spots used
+ADAPTIVE_INITIAL_GRID = 12
+
 
 def _is_near_road(lat: float, lng: float, max_distance: float = 300) -> Tuple[bool, Optional[float]]:
     """
@@ -26,6 +62,10 @@ def _is_near_road(lat: float, lng: float, max_distance: float = 300) -> Tuple[bo
         
     Returns:
         Tuple of (is_near_road, approximate_distance)
+        
+    Raises:
+        BudgetExhausted: If the request budget or the Overpass quota has no
+            room for the check (UpstreamThrottled for the latter)
     """
     try:
         # Query for roads - use 'out body' to get actual results
@@ -39,7 +79,8 @@ def _is_near_road(lat: float, lng: float, max_distance: float = 300) -> Tuple[bo
         
         for endpoint in OVERPASS_ENDPOINTS[:1]:  # Just use first endpoint for speed
             try:
-                response = requests.post(endpoint, data={'data': query}, timeout=5)
+                timeout = upstream_timeout('overpass', 5)
+                response = requests.post(endpoint, data={'data': cap_overpass_timeout(query, timeout)}, timeout=timeout)
                 if response.status_code == 200:
                     data = response.json()
                     elements = data.get('elements', [])
@@ -47,11 +88,15 @@ def _is_near_road(lat: float, lng: float, max_distance: float = 300) -> Tuple[bo
                     if road_count > 0:
                         return True, max_distance / 2  # Approximate distance
                     return False, None
+            except BudgetExhausted:
+                raise
             except Exception as e:
                 continue
         # If API fails, assume NOT near road (conservative)
         return False, None
-    except:
+    except BudgetExhausted:
+        raise
+    except Exception:
         return False, None
 
 
@@ -65,26 +110,208 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
 
 
+def haversine_matrix(lats, lngs, poi_lats, poi_lngs) -> np.ndarray:
+    """
+    Vectorized haversine distance between every point and every POI.
+    
+    Args:
+        lats, lngs: Point coordinates, shape (n,)
+        poi_lats, poi_lngs: POI coordinates, shape (m,)
+        
+    Returns:
+        Distances in meters, shape (n, m)
+    """
+    R = 6371000  # Earth's radius in meters
+    lat1 = np.asarray(lats, dtype=np.float64)[:, None]
+    lng1 = np.asarray(lngs, dtype=np.float64)[:, None]
+    lat2 = np.asarray(poi_lats, dtype=np.float64)[None, :]
+    lng2 = np.asarray(poi_lngs, dtype=np.float64)[None, :]
+    
+    dphi = np.radians(lat2 - lat1)
+    dlambda = np.radians(lng2 - lng1)
+    a = np.sin(dphi / 2) ** 2 + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(dlambda / 2) ** 2
+    return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def grid_landmark_weight(landmark: Dict) -> int:
+    """Footfall weight of a landmark, from keywords in its name or category."""
+    name = landmark.get('name', '').lower()
+    category = landmark.get('category', '').lower()
+    
+    for keywords, weight in GRID_LANDMARK_WEIGHTS:
+        if any(kw in name or kw in category for kw in keywords):
+            return weight
+    return GRID_DEFAULT_LANDMARK_WEIGHT
+
+
+def resolve_scoring_mode(scoring_mode: Optional[str] = None) -> str:
+    """
+    Validate a scoring mode, defaulting to Config.GRID_SCORING_MODE.
+    
+    Raises:
+        ValueError: For an unknown mode
+    """
+    mode = scoring_mode or Config.GRID_SCORING_MODE
+    if not isinstance(mode, str) or mode.lower() not in SCORING_MODES:
+        raise ValueError(f"scoring_mode must be one of: {', '.join(SCORING_MODES)}")
+    return mode.lower()
+
+
+def landmark_weights(
+    landmarks: List[Dict],
+    business_type: Optional[str] = None,
+    scoring_mode: Optional[str] = None
+) -> np.ndarray:
+    """
+    Footfall weight of every landmark under a scoring mode.
+    
+    Args:
+        landmarks: Landmarks with name and category
+        business_type: Business type (used by 'relevance' mode)
+        scoring_mode: 'keyword' or 'relevance' (default: Config.GRID_SCORING_MODE)
+        
+    Returns:
+        Float array of weights, one per landmark
+    """
+    if resolve_scoring_mode(scoring_mode) == 'relevance':
+        categories = [lm.get('category', '') for lm in landmarks]
+        return relevance_scores(business_type or 'other', categories) * RELEVANCE_WEIGHT_SCALE
+    return np.array([grid_landmark_weight(lm) for lm in landmarks], dtype=np.float64)
+
+
+def score_points(
+    lats,
+    lngs,
+    competitors: List[Dict],
+    landmarks: List[Dict],
+    max_landmark_names: int = 5,
+    business_type: Optional[str] = None,
+    scoring_mode: Optional[str] = None
+) -> Dict:
+    """
+    Score many candidate points at once with the grid opportunity formula.
+    
+    Distances are computed as (points x POIs) NumPy matrices in chunks of at
+    most SCORE_CHUNK_ELEMENTS, so memory stays bounded for large batches.
+    Footfall is the (points x landmarks) proximity decay times the landmark
+    weights of the scoring mode.
+    
+    Args:
+        lats: Candidate latitudes
+        lngs: Candidate longitudes
+        competitors: Competitor places with lat/lng
+        landmarks: Landmarks with lat/lng, name and category
+        max_landmark_names: Nearby landmark indices kept per point
+        business_type: Business type (used by 'relevance' mode)
+        scoring_mode: 'keyword' or 'relevance' (default: Config.GRID_SCORING_MODE)
+        
+    Returns:
+        Dict of per-point arrays: opportunity_score, footfall_score,
+        nearby_competitors, min_competitor_distance (inf if no competitors),
+        nearby_landmarks, and landmark_indices (list of index lists into
+        landmarks, in input order)
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    n = lats.size
+    
+    comp_lats = np.array([c.get('lat', 0) for c in competitors], dtype=np.float64)
+    comp_lngs = np.array([c.get('lng', 0) for c in competitors], dtype=np.float64)
+    lm_lats = np.array([lm.get('lat', 0) for lm in landmarks], dtype=np.float64)
+    lm_lngs = np.array([lm.get('lng', 0) for lm in landmarks], dtype=np.float64)
+    lm_weights = landmark_weights(landmarks, business_type, scoring_mode)
+    
+    nearby_competitors = np.zeros(n, dtype=np.int64)
+    min_competitor_dist = np.full(n, np.inf)
+    nearby_landmarks = np.zeros(n, dtype=np.int64)
+    footfall = np.zeros(n, dtype=np.float64)
+    landmark_indices: List[List[int]] = [[] for _ in range(n)]
+    
+    widest = max(len(competitors), len(landmarks), 1)
+    chunk = max(1, SCORE_CHUNK_ELEMENTS // widest)
+    
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        
+        if len(competitors):
+            comp_dist = haversine_matrix(lats[start:stop], lngs[start:stop], comp_lats, comp_lngs)
+            nearby_competitors[start:stop] = (comp_dist < COMPETITOR_PROXIMITY).sum(axis=1)
+            min_competitor_dist[start:stop] = comp_dist.min(axis=1)
+        
+        if len(landmarks):
+            lm_dist = haversine_matrix(lats[start:stop], lngs[start:stop], lm_lats, lm_lngs)
+            near = lm_dist < LANDMARK_PROXIMITY
+            
+            # Closer landmarks count more, weighted by landmark type
+            proximity_bonus = np.where(near, (LANDMARK_PROXIMITY - lm_dist) / LANDMARK_PROXIMITY, 0.0)
+            footfall[start:stop] = proximity_bonus @ lm_weights
+            nearby_landmarks[start:stop] = near.sum(axis=1)
+            
+            for row in np.flatnonzero(nearby_landmarks[start:stop]):
+                landmark_indices[start + row] = np.flatnonzero(near[row])[:max_landmark_names].tolist()
+    
+    # High footfall + low competition = better
+    competition_penalty = nearby_competitors * 15
+    distance_bonus = np.where(
+        min_competitor_dist > 200,
+        np.minimum(30, (min_competitor_dist - 200) / 10),
+        0.0
+    )
+    opportunity = np.maximum(0, footfall + distance_bonus - competition_penalty)
+    
+    return {
+        'opportunity_score': opportunity,
+        'footfall_score': footfall,
+        'nearby_competitors': nearby_competitors,
+        'min_competitor_distance': min_competitor_dist,
+        'nearby_landmarks': nearby_landmarks,
+        'landmark_indices': landmark_indices,
+    }
+
+
+def point_score_records(lats, lngs, scores: Dict, landmarks: List[Dict]) -> List[Dict]:
+    """Turn score_points() arrays into per-point dicts (grid cell format)."""
+    records = []
+    for i, (lat, lng) in enumerate(zip(np.asarray(lats).tolist(), np.asarray(lngs).tolist())):
+        min_dist = float(scores['min_competitor_distance'][i])
+        records.append({
+            'lat': lat,
+            'lng': lng,
+            'opportunity_score': round(float(scores['opportunity_score'][i]), 1),
+            'nearby_competitors': int(scores['nearby_competitors'][i]),
+            'min_competitor_distance': round(min_dist) if min_dist != float('inf') else None,
+            'nearby_landmarks': int(scores['nearby_landmarks'][i]),
+            'footfall_score': round(float(scores['footfall_score'][i]), 1),
+            'landmark_names': [landmarks[j].get('name', '') for j in scores['landmark_indices'][i]]
+        })
+    return records
+
+
 def calculate_grid_scores(
     center_lat: float,
     center_lng: float,
     radius: float,
     competitors: List[Dict],
     landmarks: List[Dict],
-    grid_size: int = 10
+    grid_size: int = 10,
+    business_type: Optional[str] = None,
+    scoring_mode: Optional[str] = None
 ) -> List[Dict]:
     """
     Analyze the area using a grid and calculate opportunity score for each cell.
     
+    business_type and scoring_mode are passed to score_points().
+    
     Returns a list of grid cells with their scores, sorted by opportunity.
     """
     # Convert radius to lat/lng offsets
     lat_offset_per_m = 1 / 111000
     lng_offset_per_m = 1 / (111000 * math.cos(math.radians(center_lat)))
     
-    grid_cells = []
     cell_size = (2 * radius) / grid_size  # Size of each cell in meters
     
+    cell_lats = []
+    cell_lngs = []
     for row in range(grid_size):
         for col in range(grid_size):
             # Calculate cell center coordinates
@@ -96,67 +323,14 @@ def calculate_grid_scores(
             if dist_from_center > radius:
                 continue
             
-            # Count competitors within proximity of this cell (300m radius)
-            nearby_competitors = 0
-            min_competitor_dist = float('inf')
-            for comp in competitors:
-                comp_dist = haversine_distance(cell_lat, cell_lng, comp.get('lat', 0), comp.get('lng', 0))
-                if comp_dist < 300:
-                    nearby_competitors += 1
-                if comp_dist < min_competitor_dist:
-                    min_competitor_dist = comp_dist
-            
-            # Count landmarks within proximity (500m radius) and calculate footfall score
-            nearby_landmarks = []
-            footfall_score = 0
-            for lm in landmarks:
-                lm_dist = haversine_distance(cell_lat, cell_lng, lm.get('lat', 0), lm.get('lng', 0))
-                if lm_dist < 500:
-                    nearby_landmarks.append(lm)
-                    # Higher value for closer landmarks
-                    proximity_bonus = max(0, (500 - lm_dist) / 500)
-                    
-                    # Weight by landmark type
-                    name = lm.get('name', '').lower()
-                    category = lm.get('category', '').lower()
-                    
-                    if any(kw in name or kw in category for kw in ['metro', 'station', 'railway']):
-                        footfall_score += 25 * proximity_bonus
-                    elif any(kw in name or kw in category for kw in ['mall', 'plaza', 'market']):
-                        footfall_score += 20 * proximity_bonus
-                    elif any(kw in name or kw in category for kw in ['hospital', 'medical', 'clinic']):
-                        footfall_score += 15 * proximity_bonus
-                    elif any(kw in name or kw in category for kw in ['school', 'college', 'university']):
-                        footfall_score += 15 * proximity_bonus
-                    elif any(kw in name or kw in category for kw in ['office', 'corporate', 'tech']):
-                        footfall_score += 12 * proximity_bonus
-                    elif any(kw in name or kw in category for kw in ['bank', 'atm']):
-                        footfall_score += 10 * proximity_bonus
-                    else:
-                        footfall_score += 5 * proximity_bonus
-            
-            # Calculate opportunity score: high footfall + low competition = better
-            # Competition penalty: more competitors nearby = lower score
-            competition_penalty = nearby_competitors * 15
-            
-            # Distance bonus: if no competitors very close, that's good
-            distance_bonus = 0
-            if min_competitor_dist > 200:
-                distance_bonus = min(30, (min_competitor_dist - 200) / 10)
-            
-            # Final opportunity score
-            opportunity = max(0, footfall_score + distance_bonus - competition_penalty)
-            
-            grid_cells.append({
-                'lat': cell_lat,
-                'lng': cell_lng,
-                'opportunity_score': round(opportunity, 1),
-                'nearby_competitors': nearby_competitors,
-                'min_competitor_distance': round(min_competitor_dist) if min_competitor_dist != float('inf') else None,
-                'nearby_landmarks': len(nearby_landmarks),
-                'footfall_score': round(footfall_score, 1),
-                'landmark_names': [lm.get('name', '') for lm in nearby_landmarks[:5]]
-            })
+            cell_lats.append(cell_lat)
+            cell_lngs.append(cell_lng)
+    
+    scores = score_points(
+        cell_lats, cell_lngs, competitors, landmarks,
+        business_type=business_type, scoring_mode=scoring_mode
+    )
+    grid_cells = point_score_records(cell_lats, cell_lngs, scores, landmarks)
     
     # Sort by opportunity score (highest first)
     grid_cells.sort(key=lambda x: x['opportunity_score'], reverse=True)
@@ -164,6 +338,123 @@ def calculate_grid_scores(
     return grid_cells
 
 
+def adaptive_grid_scores(
+    center_lat: float,
+    center_lng: float,
+    radius: float,
+    competitors: List[Dict],
+    landmarks: List[Dict],
+    max_evaluations: Optional[int] = None,
+    min_cell_size: Optional[float] = None,
+    business_type: Optional[str] = None,
+    scoring_mode: Optional[str] = None
+) -> List[Dict]:
+    """
+    Coarse-to-fine (quadtree) version of calculate_grid_scores().
+    
+    Scores an ADAPTIVE_INITIAL_GRID square grid over the circle, then refines
+    level by level: the best-scoring cells of the last level are split into
+    four quadrants whose centers are scored, until cells reach min_cell_size
+    or max_evaluations points have been scored. The remaining budget is
+    shared evenly between the levels still to go, so several hotspots get
+    refined rather than just the best one. Empty areas stay coarse and busy
+    streets are searched at fine resolution, for about the cost of a uniform
+    grid with the same number of points.
+    
+    Args:
+        center_lat: Center latitude
+        center_lng: Center longitude
+        radius: Search radius in meters
+        competitors: Competitor places with lat/lng
+        landmarks: Landmarks with lat/lng, name and category
+        max_evaluations: Points to score (default: Config.SPOT_SEARCH_BUDGET);
+            the coarse grid is always scored in full
+        min_cell_size: Smallest cell size in meters (default: Config.SPOT_SEARCH_MIN_CELL)
+        business_type: Business type (used by 'relevance' mode)
+        scoring_mode: 'keyword' or 'relevance'
+        
+    Returns:
+        Scored cells in calculate_grid_scores() format, sorted by opportunity
+    """
+    budget = Config.SPOT_SEARCH_BUDGET if max_evaluations is None else max_evaluations
+    min_cell = Config.SPOT_SEARCH_MIN_CELL if min_cell_size is None else min_cell_size
+    
+    lat_offset_per_m = 1 / 111000
+    lng_offset_per_m = 1 / (111000 * math.cos(math.radians(center_lat)))
+    
+    def inside(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        return haversine_matrix(lats, lngs, [center_lat], [center_lng])[:, 0] <= radius
+    
+    def score_level(lats: np.ndarray, lngs: np.ndarray) -> Dict:
+        scores = score_points(
+            lats, lngs, competitors, landmarks,
+            business_type=business_type, scoring_mode=scoring_mode
+        )
+        levels.append((lats, lngs, scores))
+        return scores
+    
+    levels = []  # (lats, lngs, score_points() result) per quadtree level
+    
+    # Level 0: uniform coarse grid
+    cell_size = (2 * radius) / ADAPTIVE_INITIAL_GRID
+    offsets = (np.arange(ADAPTIVE_INITIAL_GRID) - ADAPTIVE_INITIAL_GRID / 2 + 0.5) * cell_size
+    row_offsets, col_offsets = np.meshgrid(offsets, offsets, indexing='ij')
+    lats = center_lat + row_offsets.ravel() * lat_offset_per_m
+    lngs = center_lng + col_offsets.ravel() * lng_offset_per_m
+    keep = inside(lats, lngs)
+    lats, lngs = lats[keep], lngs[keep]
+    scores = score_level(lats, lngs)
+    evaluated = lats.size
+    
+    # Split the best cells of each level into quadrants while budget remains
+    levels_left = max(0, int(math.floor(math.log2(cell_size / min_cell)))) if min_cell > 0 and cell_size > 0 else 0
+    quadrants = np.array([(-1, -1), (-1, 1), (1, -1), (1, 1)], dtype=np.float64) * cell_size / 4
+    while levels_left > 0 and evaluated < budget:
+        remaining = budget - evaluated
+        opportunity = scores['opportunity_score']
+        
+        # Only cells with some opportunity are worth splitting
+        n_split = min(max(1, remaining // levels_left // 4), int((opportunity > 0).sum()))
+        if n_split == 0:
+            break
+        parents = np.argsort(-opportunity, kind='stable')[:n_split]
+        
+        lats = (lats[parents, None] + quadrants[:, 0] * lat_offset_per_m).ravel()
+        lngs = (lngs[parents, None] + quadrants[:, 1] * lng_offset_per_m).ravel()
+        keep = np.flatnonzero(inside(lats, lngs))[:remaining]
+        lats, lngs = lats[keep], lngs[keep]
+        scores = score_level(lats, lngs)
+        
+        evaluated += lats.size
+        quadrants /= 2
+        levels_left -= 1
+    
+    lats = np.concatenate([level[0] for level in levels])
+    lngs = np.concatenate([level[1] for level in levels])
+    scores = {
+        key: np.concatenate([level[2][key] for level in levels])
+        for key in levels[0][2] if key != 'landmark_indices'
+    }
+    scores['landmark_indices'] = [indices for level in levels for indices in level[2]['landmark_indices']]
+    
+    grid_cells = point_score_records(lats, lngs, scores, landmarks)
+    grid_cells.sort(key=lambda x: x['opportunity_score'], reverse=True)
+    
+    return grid_cells
+
+
+def get_spot_rating(score: float) -> Tuple[str, str]:
+    """Map a grid opportunity score to a (rating, rating_color) pair."""
+    if score >= 50:
+        return 'Excellent', 'green'
+    elif score >= 30:
+        return 'Good', 'cyan'
+    elif score >= 15:
+        return 'Moderate', 'yellow'
+    else:
+        return 'Fair', 'orange'
+
+
 def find_recommended_spots(
     center_lat: float,
     center_lng: float,
@@ -171,20 +462,43 @@ def find_recommended_spots(
     competitors: List[Dict],
     landmarks: List[Dict],
     max_spots: int = 5,
-    road_proximity: float = 300  # Maximum distance from road in meters
+    road_proximity: float = 300,  # Maximum distance from road in meters
+    business_type: Optional[str] = None,
+    scoring_mode: Optional[str] = None,
+    search_budget: Optional[int] = None
 ) -> List[Dict]:
     """
     Find the best spots for setting up a business.
     Only recommends spots that are near roadways (within road_proximity meters).
+    Once the request budget runs low, road checks stop and the remaining
+    spots are returned with road_checked False.
+    In 'relevance' scoring mode, landmarks count by their relevance to business_type.
+    
+    Candidates come from adaptive_grid_scores() with search_budget scored
+    points (default: Config.SPOT_SEARCH_BUDGET), or from a fixed 12x12 grid
+    when the budget is 0.
     
     Returns top spots with explanations.
     """
+    budget = Config.SPOT_SEARCH_BUDGET if search_budget is None else search_budget
+    
     # Calculate grid scores
-    grid_scores = calculate_grid_scores(
-        center_lat, center_lng, radius, 
-        competitors, landmarks, 
-        grid_size=12  # Higher resolution grid
-    )
+    if budget > 0:
+        grid_scores = adaptive_grid_scores(
+            center_lat, center_lng, radius,
+            competitors, landmarks,
+            max_evaluations=budget,
+            business_type=business_type,
+            scoring_mode=scoring_mode
+        )
+    else:
+        grid_scores = calculate_grid_scores(
+            center_lat, center_lng, radius, 
+            competitors, landmarks, 
+            grid_size=12,  # Higher resolution grid
+            business_type=business_type,
+            scoring_mode=scoring_mode
+        )
     
     if not grid_scores:
         return []
@@ -220,17 +534,27 @@ def find_recommended_spots(
         if too_close:
             continue
         
-        # Check if spot is near a road - ALWAYS check, no fallback
-        near_road, _ = _is_near_road(cell['lat'], cell['lng'], road_proximity)
-        checked_for_roads += 1
-        
-        if not near_road:
-            # Skip spots not near roads
-            skipped_no_road += 1
-            print(f"      ❌ Skipped ({cell['lat']:.5f}, {cell['lng']:.5f}) - no road within {road_proximity}m")
-            continue
+        # Check if spot is near a road, while the request budget allows
+        road_checked = stage_allowed('road_checks')
+        if road_checked:
+            try:
+                near_road, _ = _is_near_road(cell['lat'], cell['lng'], road_proximity)
+            except BudgetExhausted as e:
+                # No time or quota left: keep the spot, unverified
+                print(f"      ⏱️ {e}")
+                mark_degraded('road_checks')
+                road_checked = False
         
-        print(f"      ✅ Found spot near road: ({cell['lat']:.5f}, {cell['lng']:.5f})")
+        if road_checked:
+            checked_for_roads += 1
+            
+            if not near_road:
+                # Skip spots not near roads
+                skipped_no_road += 1
+                print(f"      ❌ Skipped ({cell['lat']:.5f}, {cell['lng']:.5f}) - no road within {road_proximity}m")
+                continue
+            
+            print(f"      ✅ Found spot near road: ({cell['lat']:.5f}, {cell['lng']:.5f})")
         
         # Generate reason for recommendation
         reasons = []
@@ -255,21 +579,10 @@ def find_recommended_spots(
             reasons.append(f"Near: {', '.join(top_landmarks)}")
         
         # Add road accessibility note
-        reasons.append("Good road accessibility")
+        reasons.append("Good road accessibility" if road_checked else "Road access not verified")
         
         # Determine rating based on score
-        if cell['opportunity_score'] >= 50:
-            rating = 'Excellent'
-            rating_color = 'green'
-        elif cell['opportunity_score'] >= 30:
-            rating = 'Good'
-            rating_color = 'cyan'
-        elif cell['opportunity_score'] >= 15:
-            rating = 'Moderate'
-            rating_color = 'yellow'
-        else:
-            rating = 'Fair'
-            rating_color = 'orange'
+        rating, rating_color = get_spot_rating(cell['opportunity_score'])
         
         recommended.append({
             'lat': round(cell['lat'], 6),
@@ -280,7 +593,8 @@ def find_recommended_spots(
             'reasons': reasons if reasons else ['Balanced location with growth potential'],
             'nearby_competitors': cell['nearby_competitors'],
             'nearby_landmarks': cell['nearby_landmarks'],
-            'min_competitor_distance': cell['min_competitor_distance']
+            'min_competitor_distance': cell['min_competitor_distance'],
+            'road_checked': road_checked
         })
     
     # Number the spots
@@ -0,0 +1,146 @@
+"""
+Hotspot IQ - Slippy Map Tile Math
+Web Mercator tile helpers (the z/x/y scheme used by OSM and Leaflet).
+
+Tiles give a fixed, shareable partition of the map: POI fetches, rasters and
+vector tiles keyed by (zoom, x, y) can be reused by any request that touches
+the same area.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+# Web Mercator latitude limit
+MAX_LATITUDE = 85.05112878
+
+# Mean meters per degree of latitude
+METERS_PER_DEGREE = 111000
+
+
+def lat_lng_to_tile(lat: float, lng: float, zoom: int) -> Tuple[int, int]:
+    """
+    Get the tile containing a coordinate.
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+        zoom: Zoom level
+
+    Returns:
+        Tuple of (x, y) tile indices
+    """
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    n = 2 ** zoom
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return max(0, min(x, n - 1)), max(0, min(y, n - 1))
+
+
+def lat_lng_to_tiles(lats, lngs, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized lat_lng_to_tile() for many coordinates.
+
+    Returns:
+        Tuple of (x, y) integer arrays
+    """
+    lat = np.clip(np.asarray(lats, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    lng = np.asarray(lngs, dtype=np.float64)
+    n = 2 ** zoom
+    x = ((lng + 180.0) / 360.0 * n).astype(np.int64)
+    y = ((1.0 - np.arcsinh(np.tan(np.radians(lat))) / np.pi) / 2.0 * n).astype(np.int64)
+    return np.clip(x, 0, n - 1), np.clip(y, 0, n - 1)
+
+
+def tile_width_meters(lat: float, zoom: int) -> float:
+    """Approximate east-west width of a tile at a latitude, in meters."""
+    return 40075016.686 * math.cos(math.radians(lat)) / (2 ** zoom)
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> Dict[str, float]:
+    """
+    Get the bounding box of a tile.
+
+    Args:
+        x: Tile column
+        y: Tile row
+        zoom: Zoom level
+
+    Returns:
+        Dict with south, west, north, east
+    """
+    n = 2 ** zoom
+    west = x / n * 360.0 - 180.0
+    east = (x + 1) / n * 360.0 - 180.0
+    north = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    south = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return {'south': south, 'west': west, 'north': north, 'east': east}
+
+
+def tile_pixel_centers(x: int, y: int, zoom: int, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coordinates of the pixel centers of a tile rendered at size x size pixels.
+
+    Returns:
+        Tuple of (lats, lngs): lats has one entry per row (north first),
+        lngs one entry per column (west first)
+    """
+    world = size * (2 ** zoom)
+    cols = x * size + np.arange(size) + 0.5
+    rows = y * size + np.arange(size) + 0.5
+    lngs = cols / world * 360.0 - 180.0
+    lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * rows / world))))
+    return lats, lngs
+
+
+def project_to_tile(lats, lngs, x: int, y: int, zoom: int, extent: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project coordinates into a tile's local grid (0..extent, origin top-left).
+
+    Points outside the tile get coordinates below 0 or above extent.
+
+    Returns:
+        Tuple of (px, py) integer arrays
+    """
+    lat = np.clip(np.asarray(lats, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    lng = np.asarray(lngs, dtype=np.float64)
+    n = 2 ** zoom
+    fx = (lng + 180.0) / 360.0 * n
+    fy = (1.0 - np.arcsinh(np.tan(np.radians(lat))) / np.pi) / 2.0 * n
+    px = np.rint((fx - x) * extent).astype(np.int64)
+    py = np.rint((fy - y) * extent).astype(np.int64)
+    return px, py
+
+
+def tiles_covering(south: float, west: float, north: float, east: float, zoom: int) -> List[Tuple[int, int]]:
+    """
+    List the tiles intersecting a bounding box.
+
+    Returns:
+        List of (x, y) tile indices, row by row
+    """
+    min_x, min_y = lat_lng_to_tile(north, west, zoom)
+    max_x, max_y = lat_lng_to_tile(south, east, zoom)
+    return [
+        (x, y)
+        for y in range(min_y, max_y + 1)
+        for x in range(min_x, max_x + 1)
+    ]
+
+
+def padded_bounds(lat: float, lng: float, padding: float) -> Dict[str, float]:
+    """
+    Bounding box around a point, padded by a distance in meters.
+
+    Returns:
+        Dict with south, west, north, east
+    """
+    lat_pad = padding / METERS_PER_DEGREE
+    lng_pad = padding / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return {
+        'south': lat - lat_pad,
+        'west': lng - lng_pad,
+        'north': lat + lat_pad,
+        'east': lng + lng_pad,
+    }